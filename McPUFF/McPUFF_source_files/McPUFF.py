@@ -48,10 +48,19 @@ Modified_Parameter.create_perturbed_parameter_value()     # Set "st_dev_special_
 TMC_Mod_Param_object.__init__.                            # Set "scaling_number_uniform" for random number from uniform distribution for ordinary parameters in "TMC" mode.
 Reaction.__init__.                                        # Set "number_of_workers" for CPU's to use in "Single_Parameters" mode.
 Reaction.__init__.                                        # Set "max_multithreads_TMC" for CPU's to use in "TMC" mode.
+Reaction.__init__.                                        # Turn off pinning of worker processes to separate CPU's ("pin_TMC_workers") in "TMC" mode.
 Reaction.delete_GEF_result_folder()                       # Turn off the deletion of GEF runtime data.  Be warned that the data amount can be quite large (GB).
 Reaction.delete_TALYS_result_files()                      # Turn off the deletion of TALYS runtime data. Be warned that the data amount can be quite large (GB). 
 Reaction.delete_TALYS_ff_files()                          # Turn off the deletion of ".ff" files in the GEF library during runtime. Be warned that the number of files equals twice the number of "TMC" simulations.
-Reaction.perturbed_calculations_single_parameter()        # Set "simultaneous_threads_per_param" to assign number of CPU's to use for multi-threading. (Divide "number_of_workers" between multi-threads).
+Reaction.__init__.                                        # Set "max_processes_single" for the worker processes shared by all parameters in "Single_Parameters" mode.
+Reaction.storage_dtype                                    # Set dtype of stored result arrays ("numpy.float32" by default, "numpy.float64" for double precision).
+Reaction.pickle_FY_dtype                                  # Set a smaller dtype for the fission yield arrays in the "pickle" file only (e.g. "numpy.float16"). "None" keeps "Reaction.storage_dtype".
+Reaction.pickle_compresslevel                             # Set the "gzip" compression level of the "pickle" file (1 fastest, 9 smallest file, 3 by default).
+Reaction.keep_TALYS_output_file                           # Set to "True" to write the TALYS screen output to the "_output.out" file (discarded by default).
+Reaction.GEF_working_dir_in_RAM                           # Set to "True" to run GEF in a working directory in RAM ("/dev/shm") instead of in "Output_McPUFF".
+Reaction.use_GEF_cache                                    # Set to "True" to reuse the results of GEF simulations with identical input. Cached results are stored in "Output_McPUFF/GEF_cache".
+Reaction.use_TALYS_cache                                  # Set to "True" to reuse the results of TALYS simulations with identical input. Cached results are stored in "Output_McPUFF/TALYS_cache".
+Reaction.random_seed                                      # Set an integer seed to repeat the random numbers of a simulation ("None" by default, a new seed for every simulation).
 #-------------------------------------------------------------------------------------------------------------------------------#
 
 See Also
@@ -76,7 +85,7 @@ later with the class ``Perturbed_Parameter_TMC_Data``.
 
 >>> reac = Reaction(92,236,2.53e-8,1e6,500,"normal","pth_GEF_program",
                                 "pth_TALYS_program","pth_main",True,"TMC")
-[reac (Reaction object), "Z92_A236_n_E2.53e-08MeV.pkl" ]
+[reac (Reaction object), "Z92_A236_n_E2.53e-08MeV.pkl.gz" ]
 """
 from package_McPUFF import * 
 from package_McPUFF.McPUFF_program import Reaction
@@ -123,5 +132,6 @@ distribution_flag = 'normal'                    # Draws random numbers from a no
 See the "See Also" section.
 """
 #======================================================= RUN McPUFF SIMULATION =================================================#
-reac = Reaction(Z_target,A_compound,E_reaction,MC_runs,number_of_randoms,distribution_flag,pth_GEF_program,pth_TALYS_program,pth_main,TMC_with_TALYS,program_flag)
+if __name__ == "__main__":                      # Needed since "TMC" mode starts worker processes that import this script.
+    reac = Reaction(Z_target,A_compound,E_reaction,MC_runs,number_of_randoms,distribution_flag,pth_GEF_program,pth_TALYS_program,pth_main,TMC_with_TALYS,program_flag)
 #-------------------------------------------------------- END OF SCRIPT --------------------------------------------------------#
\ No newline at end of file
@@ -16,10 +16,13 @@
 #
 """Initialize a `McPUFF_Perturbed_Data` object by deserializing
 a `pickle` file with simulation data."""
+from package_McPUFF.McPUFF_program import McPUFF_Unpickler
 from package_McPUFF import McPUFF_program as main_program
 from matplotlib import pyplot as plt
+import concurrent.futures
 import numpy as np
 import pickle
+import gzip
 import sys
 import os
 class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
@@ -76,7 +79,19 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
     the modes are identified with the strings 'Single' or 'TMC' at the 
     beginning. The user should rename the finished `pickle` files 
     accordingly. The reason for this setup is that TMC simulations can be 
-    performed in batches if there are time constraints.
+    performed in batches if there are time constraints. Files written by
+    this version of McPUFF start with a short header that gives the mode
+    (see ``McPUFF_program.Reaction.pickle_header``). The header is read 
+    before the file is loaded and the file name is then not used.
+    The `pickle` files are read and decompressed in parallel by worker 
+    threads (`concurrent.futures.ThreadPoolExecutor`) and are then added
+    in the order they are found in the folder.
+    The ``unperturbed_GEF_results`` and ``unperturbed_TALYS_results``
+    dictionaries are not loaded lazily. They are part of the same `gzip`
+    stream as the rest of the ``Reaction`` object, so they are already
+    deserialized when the file is loaded, and reading them later would
+    mean decompressing the whole file again. They are taken from the
+    first ``TMC`` file only and are small compared to the fission yields.
 
     For each simulation loop in McPUFF, following the procedure 
     developed in [1]_, fission events that only occur once are 
@@ -167,52 +182,686 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
         self.list_of_Mod_Param_objects = []    
         self.list_of_TMC_Objects = []
         self.list_of_Reac_objects = [] 
+        pickle_files = []
+        pickle_file_modes = []
         for file_name in os.scandir(pth_PKL):
-            #--------------------------------------------------------------------------------#
-            #               For pickle files from simulations with 'TMC' mode                #
-            #--------------------------------------------------------------------------------#
-            if file_name.is_file() and file_name.name.startswith('TMC'): 
-                print(f'File name: {file_name.name}')
-                with open(str(os.path.join(pth_PKL,file_name)),'rb') as f:
-                    reac_obj = pickle.load(f)
-                if isinstance(reac_obj, main_program.Reaction):
-                    # All serialized data is retrieved as `str` type. Conversion must be done when using data. For data type, see main program McPUFF_program.
-                    self.reaction_info = getattr(reac_obj, 'reaction_info')                                         # Same for all pickle files 
-                    self.dictionary_unpert_param_name_val = getattr(reac_obj, 'dictionary_unpert_param_name_val')   # Same for all pickle files
-                    self.list_of_Mod_Param_objects.extend(getattr(reac_obj, 'list_of_Mod_Param_objects'))           # Extend list with obj from each pickle file
-                    self.list_of_TMC_Objects.extend(getattr(reac_obj,'list_of_TMC_Objects'))                        # Extend list with obj from each pickle file
-                    self.program_flag = getattr(reac_obj, 'program_flag')                                           # Same for all pickle files
-                    self.With_TALYS_flag = getattr(reac_obj, 'With_TALYS_flag')                                     # Same for all pickle files   
-                    self.unperturbed_FY = getattr(reac_obj, 'unperturbed_FY')                                       # Same for all pickle files
-                    self.unperturbed_ignored_events = getattr(reac_obj,'unperturbed_ignored_events')                # One value set because one run
-                    self.unperturbed_GEF_results = getattr(reac_obj, 'unperturbed_GEF_results')                     # Same for all pickle files
-                    self.unperturbed_TALYS_results = getattr(reac_obj, 'unperturbed_TALYS_results')                 # Same for all pickle files
-                    del f, reac_obj
-            #-------------------------------------------------------------------------------------------------------------------#
-            #                           For pickle files from simulations with 'Single_Parameter' mode                          #
-            #-------------------------------------------------------------------------------------------------------------------#
-            elif file_name.is_file() and file_name.name.startswith('Single'): 
-                print(f'File name: {file_name.name}')
-                with open(str(os.path.join(pth_PKL,file_name)),'rb') as f:
-                    reac_obj = pickle.load(f)
-                if isinstance(reac_obj, main_program.Reaction):
-                    self.list_of_Reac_objects.append(reac_obj)
-                    del f, reac_obj 
-            else:
+            file_mode = McPUFF_Perturbed_Data.read_pickle_header(file_name.path) if file_name.is_file() else None
+            if file_mode is None and file_name.is_file():                                                                       # File from earlier version of McPUFF. Mode given by file name.
+                if file_name.name.startswith('TMC'):
+                    file_mode = 'TMC'
+                elif file_name.name.startswith('Single'):
+                    file_mode = 'Single_Parameters'
+            if file_mode is None:
                 print('Incorrect input for Perturbed_Parameter_Data. No such pickle file can be found')
                 sys.exit()
+            pickle_files.append(file_name)
+            pickle_file_modes.append(file_mode)
+        McPUFF_Perturbed_Data.prefetch_pickle_files([file_name.path for file_name in pickle_files])                            # Start reading all files from disk at once.
+        #------------------------------- LOAD ALL PICKLE FILES IN PARALLEL, USE THEM IN ORDER ------------------------------#
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1,min(len(pickle_files),main_program.Reaction.number_of_CPUs))) as load_executor:  # Threads: file reading and gzip decompression release the GIL, and the objects need no second pickling to reach the main process.
+            loaded_reac_objects = load_executor.map(McPUFF_Perturbed_Data.load_pickle_file,[file_name.path for file_name in pickle_files])
+            for file_name,file_mode,reac_obj in zip(pickle_files,pickle_file_modes,loaded_reac_objects):
+                #--------------------------------------------------------------------------------#
+                #               For pickle files from simulations with 'TMC' mode                #
+                #--------------------------------------------------------------------------------#
+                if file_mode == 'TMC': 
+                    print(f'File name: {file_name.name}')
+                    if isinstance(reac_obj, main_program.Reaction):
+                        # Parameter values and GEF mean values are `float`. The GEF/TALYS result dictionaries are still `str`, as are the parameter values in files from earlier versions of McPUFF. For data type, see main program McPUFF_program.
+                        reac_dict = reac_obj.__dict__                                                                   # Instance attributes of the Reaction object. One lookup per attribute.
+                        self.list_of_Mod_Param_objects.extend(reac_dict['list_of_Mod_Param_objects'])                   # Extend list with obj from each pickle file
+                        self.list_of_TMC_Objects.extend(reac_dict['list_of_TMC_Objects'])                               # Extend list with obj from each pickle file
+                        if self.reaction_info is None:                                                                  # Same for all pickle files. Taken from the first file only.
+                            self.reaction_info = reac_dict['reaction_info']
+                            self.dictionary_unpert_param_name_val = reac_dict['dictionary_unpert_param_name_val']
+                            self.program_flag = reac_dict['program_flag']
+                            self.With_TALYS_flag = reac_dict['With_TALYS_flag']
+                            self.unperturbed_FY = reac_dict['unperturbed_FY']
+                            self.unperturbed_ignored_events = reac_dict['unperturbed_ignored_events']                   # One value set because one run
+                            self.unperturbed_GEF_results = reac_dict['unperturbed_GEF_results']
+                            self.unperturbed_TALYS_results = reac_dict['unperturbed_TALYS_results']
+                        share_dictionary = reac_dict['dictionary_unpert_param_name_val'] == self.dictionary_unpert_param_name_val   # True for all batches of the same reaction.
+                        for tmc_obj in reac_dict['list_of_TMC_Objects']:
+                            if share_dictionary:
+                                tmc_obj.dictionary_unpert_param_name_val = self.dictionary_unpert_param_name_val        # One dictionary for all pickle files instead of one per file.
+                            for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects:
+                                tmc_mod_param_obj.param_name = sys.intern(tmc_mod_param_obj.param_name)                 # One string object per parameter name for all pickle files.
+                            McPUFF_Perturbed_Data.coerce_numeric_results(tmc_obj)                                       # Mean values of GEF results as float, converted once.
+                        del reac_obj,reac_dict,share_dictionary
+                #-------------------------------------------------------------------------------------------------------------------#
+                #                           For pickle files from simulations with 'Single_Parameter' mode                          #
+                #-------------------------------------------------------------------------------------------------------------------#
+                elif file_mode == 'Single_Parameters': 
+                    print(f'File name: {file_name.name}')
+                    if isinstance(reac_obj, main_program.Reaction):
+                        self.list_of_Reac_objects.append(reac_obj)
+                        for modified_param in reac_obj.list_of_Mod_Param_objects:
+                            for rand_param_obj in modified_param.list_of_Random_Parameter_Value_objects:
+                                McPUFF_Perturbed_Data.coerce_numeric_results(rand_param_obj)                            # Mean values of GEF results as float, converted once.
+                        del reac_obj 
+        del pickle_files,pickle_file_modes,load_executor,loaded_reac_objects
     #--------------------------------------------------- CLASS METHODS ---------------------------------------------------------#
+    def stack_perturbed_FY(list_of_sim_objects,FY_columns=None):
+        """Collect the perturbed fission fragment yields of several 
+        simulation objects in one contiguous array per column.
+
+        Parameters
+        ----------
+        list_of_sim_objects : `list` [``McPUFF_program.TMC_Object``] or `list` [``McPUFF_program.Random_Parameter_value``]
+            Simulation objects with a ``perturbed_FY`` attribute.
+        FY_columns : `list` [`int`], optional
+            Columns of ``perturbed_FY`` to collect. All columns are 
+            collected if not given.
+
+        Returns
+        -------
+        stacked_FY : `numpy.ndarray` (number of columns,number of objects,max(number_of_fission_events))
+            dtype = `float32`. Column ``FY_columns[i]`` of the 
+            ``perturbed_FY`` arrays of all objects is stored in 
+            ``stacked_FY[i]``, one simulation per row. Rows after the 
+            last fission event of all objects are left out.
+        number_of_fission_events : `numpy.ndarray` (number of objects,)
+            Number of unique fission events (rows with data) in each 
+            ``perturbed_FY`` array.
+
+        See Also
+        --------
+        ``McPUFF_program.GEF_FY_for_TALYS()``
+
+        Notes
+        -----
+        The ``perturbed_FY`` arrays are filled from the first row and the 
+        remaining rows are zero. A sum over all rows of a column divided by
+        ``number_of_fission_events`` is therefore the mean value of the 
+        column for that simulation. With all simulations in one array, a
+        fission observable can be reduced for all simulations with a 
+        single `numpy` call instead of one call per object.
+
+        The ``perturbed_FY`` arrays are stored row by row, so the values 
+        of one column are 11 or 19 numbers apart in memory. In 
+        ``stacked_FY`` each column is stored contiguously (structure of
+        arrays) and only the requested columns are copied. A reduction of
+        a column then reads only the values it uses. Evenly spaced columns,
+        e.g. [7,9,11,13,15,17], are copied through a strided view of 
+        ``perturbed_FY`` instead of a fancy-indexed temporary copy. Rows 
+        that are zero in all objects are neither copied nor summed.
+
+        The loop over the objects is not split over processes or threads.
+        The work per object is one copy of at most 300 rows, and all the
+        reductions are done afterwards on the stacked array. Sending the
+        objects to worker processes would cost more than the copy itself.
+
+        Examples
+        --------
+        >>> stacked_FY, n_events = McPUFF_Perturbed_Data.stack_perturbed_FY(
+                                    MPD_object.list_of_TMC_Objects,[7,9])
+        [numpy.ndarray (2,500,max(n_events)), numpy.ndarray (500,)]
+        """
+        if FY_columns is None:
+            FY_columns = list(range(list_of_sim_objects[0].perturbed_FY.shape[1]))
+        column_steps = np.diff(FY_columns)
+        if len(FY_columns) > 1 and column_steps[0] > 0 and np.all(column_steps == column_steps[0]):                       # Evenly spaced columns. Basic slice gives a view.
+            column_index = slice(FY_columns[0],FY_columns[-1]+1,int(column_steps[0]))
+        else:
+            column_index = np.asarray(FY_columns,dtype=np.intp)                                                                 # Converted once instead of once per object.
+        number_of_fission_events = np.array([McPUFF_Perturbed_Data.count_fission_events(sim_obj) for sim_obj in list_of_sim_objects],dtype=np.int64)
+        number_of_rows = int(number_of_fission_events.max())                                                                    # Rows after this are zero in all objects.
+        stacked_FY = np.empty((len(FY_columns),len(list_of_sim_objects),number_of_rows),dtype=list_of_sim_objects[0].perturbed_FY.dtype)
+        for k,sim_obj in enumerate(list_of_sim_objects):
+            stacked_FY[:,k,:] = sim_obj.perturbed_FY[:number_of_rows,column_index].T                                           # One contiguous row per column and simulation.
+        del column_steps,column_index,number_of_rows,k,sim_obj
+        return stacked_FY, number_of_fission_events
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def count_fission_events(sim_obj):
+        """Return the number of fission events (rows with data) in the 
+        ``perturbed_FY`` array of a simulation object.
+
+        Parameters
+        ----------
+        sim_obj : ``McPUFF_program.TMC_Object`` or ``McPUFF_program.Random_Parameter_value``
+            Simulation object with a ``perturbed_FY`` attribute.
+
+        Returns
+        -------
+        number_of_fission_events : `int`
+            Number of rows with data in ``perturbed_FY``.
+
+        Notes
+        -----
+        McPUFF stores the number in ``number_of_fission_events`` when the
+        simulation is done. For objects from `pickle` files of earlier 
+        versions of McPUFF the number is counted in column 0 (Z1), which 
+        is never zero for a fission event.
+
+        Examples
+        --------
+        >>> n_events = McPUFF_Perturbed_Data.count_fission_events(tmc_obj)
+        [n_events]
+        """
+        number_of_fission_events = getattr(sim_obj,'number_of_fission_events',None)                                           # Instance attribute missing in old pickle files. Class attribute is None.
+        if number_of_fission_events is None:
+            number_of_fission_events = int(np.count_nonzero(sim_obj.perturbed_FY[:,0]))
+        return number_of_fission_events
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def coerce_numeric_results(sim_obj):
+        """Convert the mean values of the perturbed GEF results of one 
+        simulation object to `float` once, after the pickle file is loaded.
+
+        Parameters
+        ----------
+        sim_obj : ``McPUFF_program.Random_Parameter_value`` or ``McPUFF_program.TMC_Object``
+            Object with the GEF results of one perturbed simulation.
+
+        Returns
+        -------
+        perturbed_GEF_mean_values : `dict` [`str`, `float`]
+            The entries of ``perturbed_GEF_results`` whose key starts with
+            'mean_value_', e.g. 'mean_value_TXE', as `float`. The dictionary
+            is also stored on ``sim_obj`` as ``perturbed_GEF_mean_values``.
+
+        See Also
+        --------
+        ``McPUFF_program.read_and_clear_GEF_results()``
+        ``McPUFF_program.Reaction.GEF_mean_values()``
+
+        Notes
+        -----
+        ``perturbed_GEF_results`` itself is not changed, all its data is
+        still of `str` type. The example methods read the mean values from
+        ``perturbed_GEF_mean_values`` instead, so a string is not parsed 
+        again for each analysis of the same object. Objects from this 
+        version of McPUFF already have ``perturbed_GEF_mean_values`` when 
+        they are loaded and are not converted again.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.coerce_numeric_results(tmc_obj)['mean_value_TXE']
+        float
+        """
+        if not getattr(sim_obj,'perturbed_GEF_mean_values',None):                                                               # None (class attribute) for files from earlier versions of McPUFF.
+            sim_obj.perturbed_GEF_mean_values = main_program.Reaction.GEF_mean_values(sim_obj.perturbed_GEF_results)
+        return sim_obj.perturbed_GEF_mean_values
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def load_pickle_file(pth_pickle_file):
+        """Load a ``Reaction`` object from a McPUFF `pickle` file.
+
+        Parameters
+        ----------
+        pth_pickle_file : `str`
+            Local path to `pickle` file with serialized simulation data.
+
+        Returns
+        -------
+        reac_obj : ``McPUFF_program.Reaction``
+            Object with the results of a McPUFF simulation.
+
+        Notes
+        -----
+        McPUFF writes the `pickle` file compressed with `gzip`. Files 
+        from earlier versions of McPUFF are plain `pickle` files. The two
+        are told apart by the two first bytes of the file (the `gzip` 
+        magic number), so both can be loaded independent of file name.
+        The file is opened once with a 4 MB read buffer; a `gzip` file is
+        decompressed while it is read.
+
+        The header with the program mode at the start of the file is 
+        skipped, see ``McPUFF_Perturbed_Data.read_pickle_header()``.
+
+        The file is loaded with ``McPUFF_Unpickler``, which refuses to
+        create anything but McPUFF objects, `numpy` arrays and built-in 
+        types. A manipulated file can therefore not run code when it is 
+        loaded.
+
+        The ``Reaction`` object is written with `pickle` protocol 5. The
+        data of every `numpy` array is then stored in-band as a raw 
+        buffer, without the intermediate `bytes` copy of older protocols.
+        The data is decompressed by `gzip` while it is read. The fission 
+        fragment yield arrays (``unperturbed_FY`` and all 
+        ``perturbed_FY``) are stored byte shuffled and are restored into
+        new arrays by ``McPUFF_program.Reaction.__setstate__()``. Files 
+        written with older protocols load as before.
+
+        Examples
+        --------
+        >>> reac_obj = McPUFF_Perturbed_Data.load_pickle_file(
+                        "/local/path/to/pickle/TMC_Z92_A236_n_E2.53e-08MeV.pkl.gz")
+        [reac_obj (Reaction object)]
+        """
+        with open(pth_pickle_file,'rb',buffering=1<<22) as f:                                                                  # 4 MB buffer: few large reads of the (large) file instead of many 8 kB reads.
+            is_gzip_file = f.read(2) == b'\x1f\x8b'                                                                             # gzip magic number.
+            f.seek(0)
+            pickle_stream = gzip.GzipFile(fileobj=f) if is_gzip_file else f
+            if pickle_stream.read(4) not in main_program.Reaction.pickle_header.values():                                     # No header in files from earlier versions of McPUFF.
+                pickle_stream.seek(0)
+            reac_obj = McPUFF_Unpickler(pickle_stream).load()                                                                   # Only McPUFF and numpy objects. Yield arrays are un-shuffled into new arrays (Reaction.__setstate__).
+        del f, is_gzip_file, pickle_stream
+        return reac_obj
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def correlation_with_first_column(data_vec):
+        """Calculate the Pearson correlation coefficient between the first
+        column and each of the other columns of an array.
+
+        Parameters
+        ----------
+        data_vec : `numpy.ndarray` (number of simulations,number of columns)
+            Perturbed parameter value in column 0 and fission observables 
+            in the other columns, one simulation per row. Several such 
+            arrays of the same shape can be given stacked as one array 
+            (number of arrays,number of simulations,number of columns).
+
+        Returns
+        -------
+        correlations : `numpy.ndarray` (number of columns - 1,)
+            Correlation coefficient of column 0 with column 1, 2, ...
+            For stacked input: (number of arrays,number of columns - 1).
+
+        See Also
+        --------
+        `numpy.corrcoef()`
+
+        Notes
+        -----
+        Gives the same values as ``np.corrcoef(data_vec[:,0],data_vec[:,k])[0,1]``
+        for each column ``k``, but centres column 0 once and computes all 
+        coefficients with one matrix-vector product instead of a 2x2 
+        correlation matrix per column. Stacked arrays are all handled by 
+        the same `numpy.einsum()` calls. A constant column gives `nan`, as 
+        with `numpy.corrcoef()`.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.correlation_with_first_column(param_data_vec)
+        [numpy.ndarray (5,)]
+        """
+        centred_data = data_vec - np.mean(data_vec,axis=-2,keepdims=True)                                                      # All columns centred in one pass.
+        column_norms = np.sqrt(np.einsum('...ij,...ij->...j',centred_data,centred_data))                                       # Sqrt of sum of squares per column.
+        with np.errstate(divide='ignore',invalid='ignore'):
+            correlations = np.einsum('...i,...ij->...j',centred_data[...,0],centred_data[...,1:])/(column_norms[...,:1]*column_norms[...,1:])
+        del centred_data,column_norms
+        return np.clip(correlations,-1,1)                                                                                      # Rounding can give |r| slightly above 1.
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def correlation_of_rows_with_columns(row_data,column_data):
+        """Calculate the Pearson correlation coefficient between each row
+        of one array and each column of another array.
+
+        Parameters
+        ----------
+        row_data : `numpy.ndarray` (number of parameters,number of simulations)
+            E.g. the perturbed values of each parameter, one row per 
+            parameter.
+        column_data : `numpy.ndarray` (number of simulations,number of columns)
+            E.g. fission observables shared by all parameters, one 
+            simulation per row.
+
+        Returns
+        -------
+        correlations : `numpy.ndarray` (number of parameters,number of columns)
+            Correlation coefficient of row ``i`` of ``row_data`` with column 
+            ``k`` of ``column_data`` in element ``[i,k]``.
+
+        See Also
+        --------
+        ``McPUFF_Perturbed_Data.correlation_with_first_column()``
+        `numpy.corrcoef()`
+
+        Notes
+        -----
+        Only the centred sums of products are needed for the coefficients.
+        Each row and each column is centred once and all coefficients are
+        then given by one matrix product. In the ``TMC`` mode all 
+        parameters share the same fission observables, so the columns are
+        centred once for all parameters instead of once per parameter. The
+        data is centred before the products are summed, which avoids the 
+        loss of precision of the closed form with raw sums 
+        (n*Sxy - Sx*Sy). A constant row or column gives `nan`, as with 
+        `numpy.corrcoef()`.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.correlation_of_rows_with_columns(param_values,ratio_data)
+        [numpy.ndarray (number of parameters,5)]
+        """
+        centred_rows = row_data - np.mean(row_data,axis=1,keepdims=True)                                                       # All rows centred in one pass.
+        centred_columns = column_data - np.mean(column_data,axis=0)                                                            # All columns centred in one pass.
+        row_norms = np.sqrt(np.einsum('ij,ij->i',centred_rows,centred_rows))                                                    # Sqrt of sum of squares per row.
+        column_norms = np.sqrt(np.einsum('ij,ij->j',centred_columns,centred_columns))                                           # Sqrt of sum of squares per column.
+        with np.errstate(divide='ignore',invalid='ignore'):
+            correlations = (centred_rows @ centred_columns)/np.outer(row_norms,column_norms)
+        del centred_rows,centred_columns,row_norms,column_norms
+        return np.clip(correlations,-1,1)                                                                                      # Rounding can give |r| slightly above 1.
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def read_pickle_header(pth_pickle_file):
+        """Read the program mode of a McPUFF `pickle` file without loading 
+        the simulation data.
+
+        Parameters
+        ----------
+        pth_pickle_file : `str`
+            Local path to `pickle` file with serialized simulation data.
+
+        Returns
+        -------
+        file_mode : `str` or `None`
+            "TMC" or "Single_Parameters". `None` if the file has no McPUFF 
+            header (files from earlier versions of McPUFF, or other files).
+
+        See Also
+        --------
+        ``McPUFF_program.Reaction.pickle_header``
+        ``McPUFF_Perturbed_Data.load_pickle_file()``
+
+        Notes
+        -----
+        Only the first bytes of the file are read (and decompressed). 
+        Files that are not McPUFF files are therefore rejected without 
+        being loaded, independent of their size.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.read_pickle_header(
+                        "/local/path/to/pickle/Z92_A236_n_E2.53e-08MeV.pkl.gz")
+        ["TMC"]
+        """
+        try:
+            with open(pth_pickle_file,'rb') as f:
+                is_gzip_file = f.read(2) == b'\x1f\x8b'                                                                         # gzip magic number.
+                f.seek(0)
+                header = (gzip.GzipFile(fileobj=f) if is_gzip_file else f).read(4)
+        except (OSError,EOFError):                                                                                              # Not a readable (gzip) file.
+            return None
+        file_mode = None
+        for mode,mode_header in main_program.Reaction.pickle_header.items():
+            if header == mode_header:
+                file_mode = mode
+        return file_mode
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def analyze_modified_parameters(Mod_param_obj_list):
+        """Calculate the ratios of fission observables and their 
+        correlation with the parameter value for all perturbed GEF 
+        parameters from ``Single_Parameters`` mode simulations.
+
+        Parameters
+        ----------
+        Mod_param_obj_list : `list` [``McPUFF_program.Modified_Parameter``]
+            Parameter objects with the ``Random_Parameter_value`` objects 
+            of all simulations of each parameter.
+
+        Returns
+        -------
+        param_data_dict : `dict` [`str`, `numpy.ndarray` (number of randoms,6)]
+            For each parameter name, one row per simulation. Columns: 
+            [0]=pert_param_val,[1]=E1/E2,[2]=TXE/TKE,[3]=Q_bar,
+            [4]=E1(n)/E2(n),[5]=E1(g)/E2(g).
+        correlation_data_dict : `dict` [`str`, `numpy.ndarray` (5,)]
+            For each parameter name, the correlation coefficient of the 
+            parameter value with each of the ratios in columns 1-5.
+
+        See Also
+        --------
+        ``McPUFF_Perturbed_Data.Correlation_division_Eexc_light_heavy_Single_Parameters()``
+        ``McPUFF_Perturbed_Data.stack_perturbed_FY()``
+
+        Notes
+        -----
+        The simulations of all parameters are stacked in one array, so the
+        means and ratios of all simulations are calculated with one set of 
+        `numpy` calls instead of one set per parameter. The rows of each 
+        parameter are then split off (as views) for the correlations. The
+        number of simulations may differ between parameters. When it does
+        not, the correlations of all parameters are also calculated with
+        one call.
+
+        Examples
+        --------
+        >>> param_data_dict, correlation_data_dict = \
+                McPUFF_Perturbed_Data.analyze_modified_parameters(Mod_param_obj_list)
+        [dict, dict]
+        """
+        #------------------- COLLECT 'RANDOM_PARAMETER_VALUE' OBJECTS OF ALL PARAMETERS IN ONE LIST ---------------#
+        rand_param_obj_list = [rand_param_obj for modified_param in Mod_param_obj_list for rand_param_obj in modified_param.list_of_Random_Parameter_Value_objects]
+        first_row_of_param = np.cumsum([len(modified_param.list_of_Random_Parameter_Value_objects) for modified_param in Mod_param_obj_list])[:-1]   # Where the rows of the next parameter start.
+        stacked_FY, number_of_fission_events = McPUFF_Perturbed_Data.stack_perturbed_FY(rand_param_obj_list,[7,9,11,13,15,17])   # (6,number of simulations,max events) and (number of simulations,).
+        #------------ CREATE VECTOR WITH VALUES FOR RATIOS FOR ALL SIMULATIONS OF ALL PARAMETERS AT ONCE ----------#
+        #   Rows after the last fission event are zero, so the sum over all rows divided by the number of fission events is the mean.
+        #------------------------------ E1, E2, E1(n), E2(n), E1(g), E2(g) ----------------------------------------#
+        E1,E2,E1_n,E2_n,E1_g,E2_g = np.sum(stacked_FY,axis=2,dtype=np.float64)/number_of_fission_events                               # One row of means per column.
+        del stacked_FY
+        #------------------------------------ TXE/TKE AND avg(Q_bar) ---------------------------------------------#
+        #   Float values converted once by McPUFF (McPUFF_program.Reaction.GEF_mean_values()). One pass over the objects.
+        #   Name of dictionary key can be looked up in McPUFF_program.read_and_clear_GEF_results()
+        TXE,TKE,Q_bar = np.array([(mean_values['mean_value_TXE'],mean_values['mean_value_TKE_pre'],mean_values['mean_value_Q_bar'])
+                                  for mean_values in (rand_param_obj.perturbed_GEF_mean_values for rand_param_obj in rand_param_obj_list)]).T
+        #-------------------------- ASSIGN DATA TO DATA VECTOR (ONE ROW PER SIMULATION) ---------------------------#
+        param_data_all = np.zeros((len(rand_param_obj_list),6))                                                                        # Holds simulation info for all simulations of all parameters.
+        param_data_all[:,0] = [float(rand_param_obj.pert_param_val) for rand_param_obj in rand_param_obj_list]                        # Perturbed parameter value
+        param_data_all[:,1] = E1/E2                                                                                                     # average E1/E2
+        param_data_all[:,2] = TXE/TKE                                                                                                   # average TXE/TKE
+        param_data_all[:,3] = Q_bar                                                                                                     # average Q_bar
+        param_data_all[:,4] = E1_n/E2_n                                                                                                 # average E1(n)/E2(n)
+        param_data_all[:,5] = E1_g/E2_g                                                                                                 # average E1(g)/E2(g) 
+        #----------------------------- SPLIT PER PARAMETER AND CALCULATE CORRELATION COEFFICIENTS -----------------#
+        param_data_vecs = np.split(param_data_all,first_row_of_param)                                                                  # Views, one per parameter.
+        if all(len(param_data_vec) == len(param_data_vecs[0]) for param_data_vec in param_data_vecs):                                  # Same number of simulations for all parameters. 
+            correlations = McPUFF_Perturbed_Data.correlation_with_first_column(param_data_all.reshape(len(param_data_vecs),-1,6))      # All parameters in one call.
+        else:
+            correlations = [McPUFF_Perturbed_Data.correlation_with_first_column(param_data_vec) for param_data_vec in param_data_vecs]
+        param_data_dict = {}                                                                                                            # Holds simulation info for each modified parameter.
+        correlation_data_dict = {}                                                                                                      # Holds correlation info for each modified parameter.
+        for modified_param,param_data_vec,correlation_data_vec in zip(Mod_param_obj_list,param_data_vecs,correlations):
+            param_data_dict[f'{modified_param.param_name}'] = param_data_vec
+            correlation_data_dict[f'{modified_param.param_name}'] = correlation_data_vec                                                # Off-diagonal element of the 2x2 correlation matrix for each of the 5 ratios.
+        del param_data_vecs,correlations
+        return param_data_dict, correlation_data_dict
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def write_correlation_coefficients(pth_output_file,correlation_data_dict):
+        """Write a table with the correlation coefficients of each 
+        parameter to a text file.
+
+        Parameters
+        ----------
+        pth_output_file : `str`
+            Local path to the text file. An existing file is overwritten.
+        correlation_data_dict : `dict` [`str`, `numpy.ndarray` (5,)]
+            Correlation coefficients of each parameter with E1/E2, TXE/TKE,
+            Q_bar, E1(n)/E2(n) and E1(g)/E2(g). One line is written per 
+            key, in the order of the dictionary.
+
+        Returns
+        -------
+        Function has no return value.
+
+        See Also
+        --------
+        ``McPUFF_Perturbed_Data.Correlation_division_Eexc_light_heavy_Single_Parameters()``
+        ``McPUFF_Perturbed_Data.Correlation_division_Eexc_light_heavy_TMC()``
+
+        Notes
+        -----
+        The whole table is built as one string and written with one call,
+        so the text is encoded once and the file is only open while it is
+        written.
+        The format ' 7.4f' gives a space in place of the sign for positive 
+        values, so all columns line up without a test of the sign.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.write_correlation_coefficients("/local/path/correlation_coefficients.txt",correlation_data_dict)
+        []
+        """
+        column_distance = [5,5,5,8,5]                                                                                              # Spaces after each column.
+        table_header = 'Parameter name'.ljust(19," ")+'E1/E2'.ljust(12," ")+'TXE/TKE'.ljust(12," ")+'Q_bar'.ljust(10," ")+'E1(n)/E2(n)'.ljust(15," ")+'E1(g)/E2(g)'+'\n'+78*'-'+'\n'
+        table_body = ''.join(str(para_name).ljust(18," ")+''.join(f'{correlation: 7.4f}'+distance*' ' for correlation,distance in zip(correlations,column_distance))+'\n'
+                             for para_name,correlations in correlation_data_dict.items())                                                   # Sign or space, then 4 decimals (7 characters).
+        with open(pth_output_file, 'w', encoding='utf-8') as outputfile:                                                       # Fixed encoding, not the locale default.
+            outputfile.write(table_header+table_body)                                                                          # Encoded and written once.
+        del column_distance,table_header,table_body
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def linear_least_squares(x_data,y_data):
+        """Fit a straight line to data points with the method of least 
+        squares.
+
+        Parameters
+        ----------
+        x_data : `numpy.ndarray` (number of points,)
+            x values, e.g. perturbed parameter values.
+        y_data : `numpy.ndarray` (number of points,)
+            y values, e.g. a ratio of fission observables.
+
+        Returns
+        -------
+        slope : `float`
+            Slope of the fitted line.
+        intercept : `float`
+            Value of the fitted line at x = 0.
+
+        See Also
+        --------
+        `numpy.polyfit()`
+
+        Notes
+        -----
+        Gives the same line as ``np.polyfit(x_data,y_data,deg=1)``, but 
+        with the closed-form solution on centred data instead of a least
+        squares solver on a Vandermonde matrix. The slope is 
+        sum((x - mean(x))*(y - mean(y)))/sum((x - mean(x))**2).
+
+        Examples
+        --------
+        >>> b, a = McPUFF_Perturbed_Data.linear_least_squares(x_data,y_data)
+        [float, float]
+        """
+        x_mean = np.mean(x_data)
+        y_mean = np.mean(y_data)
+        centred_x = x_data - x_mean
+        slope = float(np.dot(centred_x,y_data - y_mean)/np.dot(centred_x,centred_x))
+        intercept = float(y_mean - slope*x_mean)
+        del x_mean,y_mean,centred_x
+        return slope, intercept
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
+    def prefetch_pickle_files(list_of_pickle_paths):
+        """Ask the operating system to start reading `pickle` files into
+        memory before they are loaded.
+
+        Parameters
+        ----------
+        list_of_pickle_paths : `list` [`str`]
+            Local paths to `pickle` files with serialized simulation data.
+
+        Returns
+        -------
+        Function has no return value.
+
+        See Also
+        --------
+        ``McPUFF_Perturbed_Data.load_pickle_file()``
+        `os.posix_fadvise()` (url: 
+        <https://docs.python.org/3/library/os.html#os.posix_fadvise>)
+
+        Notes
+        -----
+        When the files are not in the page cache (e.g. first analysis 
+        after a simulation on a cluster), loading is limited by the disk.
+        `os.posix_fadvise()` with ``POSIX_FADV_WILLNEED`` returns at once
+        and lets the kernel read all files in the background with many 
+        requests in flight, while the first files are already being 
+        unpickled. The advice is only a hint. It is skipped where 
+        `os.posix_fadvise()` is not available (Windows, macOS) or is 
+        rejected by the file system.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.prefetch_pickle_files(
+                    ["/local/path/to/pickle/TMC_Z92_A236_n_E2.53e-08MeV.pkl.gz"])
+        []
+        """
+        if not hasattr(os,'posix_fadvise'):
+            return
+        for pth_pickle_file in list_of_pickle_paths:
+            try:
+                fd = os.open(pth_pickle_file,os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd,0,0,os.POSIX_FADV_WILLNEED)                                                             # Length 0: whole file.
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass                                                                                                            # Only a hint. File is read normally when loaded.
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
                 
     #***************************************************************************************************************************#    
     #                                                       PLOTS                                                               #
     #***************************************************************************************************************************#  
                            
+    def plot_least_squares_fit(x_data,y_data,pth_png_file,dpi=300,show_plot=True):
+        """Plot simulation results of one parameter with a least squares 
+        fitted line and save the plot as a `png` file.
+
+        Parameters
+        ----------
+        x_data : `numpy.ndarray` (number of simulations,)
+            Perturbed parameter values.
+        y_data : `numpy.ndarray` (number of simulations,)
+            Average E1(n)/E2(n) of each simulation.
+        pth_png_file : `str`
+            Local path to the `png` file.
+        dpi : `int`, optional
+            Resolution of the saved plot. 300 (default) for publication,
+            a lower value saves faster.
+        show_plot : `bool`, optional
+            If `True` (default), ``matplotlib.pyplot.show()`` is called,
+            which blocks until the window is closed. If `False`, the figure
+            is closed after it is saved.
+
+        Returns
+        -------
+        Function has no return value.
+
+        See Also
+        --------
+        ``McPUFF_Perturbed_Data.linear_least_squares()``
+
+        Notes
+        -----
+        Without a display, `matplotlib` selects the non-interactive 'Agg' 
+        backend itself, and ``matplotlib.pyplot.show()`` does not block.
+
+        Examples
+        --------
+        >>> McPUFF_Perturbed_Data.plot_least_squares_fit(param_data_dict['T_orbital'][:,0],
+                param_data_dict['T_orbital'][:,4],'/local/path/Scatterplot_parameter.png',show_plot=False)
+        []
+        """
+        fig, ax = plt.subplots(figsize = (12,8))
+        ax.scatter(x_data, y_data, s=60, alpha=0.7, edgecolors="k",label='E1(n)/E2(n) for parameter')                              # Add label text.
+        b, a = McPUFF_Perturbed_Data.linear_least_squares(x_data, y_data)
+        xseq = np.linspace(x_data.min(), x_data.max(), num=100)
+        ax.plot(xseq, a + b * xseq, color="r",ls='--', lw=2.5,label='least squares fit')
+        ax.set_xlabel('Parameter values'); ax.set_ylabel('average E1(n)/E2(n)')
+        ax.legend()
+        plt.title('Least squares fit avg(E1(n)/E2(n)) vs parameter 100 sims')                                                      # Add title text.
+        plt.savefig(pth_png_file,dpi=dpi,format='png')
+        if show_plot == True:
+            plt.show()
+        else:
+            plt.close(fig)                                                                                                          # Frees the figure. Figures left open add up in batch runs.
+        del ax,b,a,xseq
+    #------------------------------------------------------- END OF METHOD --------------------------------------------#
+
     #======================================================================================================================================================#
     #               EXAMPLE OF LOADING A PICKLE FILE FOR 'SINGLE_PARAMETERS' MODE AND CALCULATING THE CORRELATION COEFFICIENTS                             #
     #               FOR DIVISION OF EXCITATION ENERGY BETWEEN THE LIGHT AND HEAVY OBJECT FOR VARIOUS FISSION OBSERVABLES.                                  #                            
     #======================================================================================================================================================#  
                           
-    def Correlation_division_Eexc_light_heavy_Single_Parameters(MPD_obj):
+    def Correlation_division_Eexc_light_heavy_Single_Parameters(MPD_obj,show_plot=True):
         """Example of how to load data from a `pickle` file after a McPUFF
         ``Single_Parameters`` mode simulation.
 
@@ -221,6 +870,9 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
         MPD_obj : `object` [``McPUFF_Perturbed_Data``]
             A McPUFF_Perturbed_Data object instantiated from a ``McPUFF``
             simulation `pickle` file.
+        show_plot : `bool`, optional
+            Show the plot in a window (default). Use `False` for batch
+            runs, the plot is then only saved to file.
 
         Returns
         -------
@@ -252,103 +904,28 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
         []
         """
         #----------------------------- CREATE LIST WITH ALL MODIFIED PARAMETER OBJECTS ----------------------------#
-        Mod_param_obj_list = []                                                                                                         # Collect 'Modified_Parameter' objects from all simulations in one list.
-        list_param_names = []                                                                                                           # List of selected GEF parameter names for indexing.
         #----------------------------------------------------------------------------------------------------------#
         #   Loop through all 'Reaction' objects in 'list_of_reac_objects'.                                         #
         #       Loop through all 'Modified_Parameter' objects in each 'Reaction' object.                           #
         #           Loop through all 'Random_Parameter_value' objects in each 'Modified_Parameter' object.         #
         #----------------------------------------------------------------------------------------------------------#
-        #------------------------ LOOP THROUGH ALL 'REACTION' OBJECTS IN 'LIST_OF_REAC_OBJECTS' -------------------#
-        for reac_obj in MPD_obj.list_of_Reac_objects:                                                                                   # Read data from each 'Reaction' object.
-            if isinstance(reac_obj,main_program.Reaction):
-                #------------ LOOP THROUGH ALL 'MODIFIED_PARAMETER' OBJECTS IN EACH 'REACTION' OBJECT -------------#
-                for mod_param_obj in reac_obj.list_of_Mod_Param_objects:                                                                # Read data from each 'Modified_Parameter' object
-                    if isinstance(mod_param_obj,main_program.Modified_Parameter):
-                        Mod_param_obj_list.append(mod_param_obj)
-                        list_param_names.append(mod_param_obj.param_name)
-        #----------------------------- CREATE EMPTY DICTIONARY WITH PARAMETER NAMES -------------------------------#
-        param_data_dict = {key: {} for key in list_param_names}                                                                         # Holds simulation info for each modified parameter.
-        correlation_data_dict = {key: {} for key in list_param_names}                                                                   # Holds correlation info for each modified parameter.
-        #----------------------------- CREATE VECTOR WITH VALUES FOR RATIOS ---------------------------------------#
+        Mod_param_obj_list = [mod_param_obj for reac_obj in MPD_obj.list_of_Reac_objects for mod_param_obj in reac_obj.list_of_Mod_Param_objects]    # Collect 'Modified_Parameter' objects from all simulations in one list.
+        #------------------ LISTS ARE FILLED BY McPUFF WITH ONE TYPE OF OBJECT. CHECK THE TYPE ONCE ---------------#
+        if not (isinstance(Mod_param_obj_list[0],main_program.Modified_Parameter) and 
+                    isinstance(Mod_param_obj_list[0].list_of_Random_Parameter_Value_objects[0],main_program.Random_Parameter_value)):
+            print('No "Single_Parameters" simulation objects found in McPUFF_Perturbed_Data object')
+            sys.exit()
+        list_param_names = [mod_param_obj.param_name for mod_param_obj in Mod_param_obj_list]                                          # List of selected GEF parameter names for indexing. Built once, with known length.
+        #----------------------------- CREATE VECTOR WITH VALUES FOR RATIOS AND CORRELATIONS FOR ALL PARAMETERS ---#
         #   Columns: [0]=pert_param_val,[1]=E1/E2,[2]=TXE/TKE,[3]=Q_bar,[4]=E1(n)/E2(n),[5]=E1(g)/E2(g)
-        for modified_param in Mod_param_obj_list: 
-            if isinstance(modified_param,main_program.Modified_Parameter):
-                #----------------------------------- CREATE EMPTY DATA ARRAY --------------------------------------#
-                number_of_randoms = len(modified_param.list_of_Random_Parameter_Value_objects)
-                param_data_vec = np.zeros((number_of_randoms,6))                                                                        # Holds simulation info for each random number.
-                #----- LOOP THROUGH ALL 'RANDOM_PARAMETER_VALUE' OBJECTS IN EACH 'MODIFIED_PARAMETER' OBJECT ------#
-                for n,rand_param_obj in enumerate(modified_param.list_of_Random_Parameter_Value_objects):                               # Read data from each 'Random_Parameter_value' object.
-                    if isinstance(rand_param_obj,main_program.Random_Parameter_value): 
-                        number_of_fission_events = len(rand_param_obj.perturbed_FY[np.nonzero(rand_param_obj.perturbed_FY[:,0]),0][0])  # Number of nonzero elements in array.
-                        #------------------------------------- E1/E2 ----------------------------------------------#
-                        E1 = np.mean(rand_param_obj.perturbed_FY[0:number_of_fission_events,7][0])   
-                        E2 = np.mean(rand_param_obj.perturbed_FY[0:number_of_fission_events,9][0])
-                        #------------------------------------ TXE/TKE ---------------------------------------------#
-                        TXE   = float(rand_param_obj.perturbed_GEF_results['mean_value_TXE'][0])                                        # Name of dictionary key can be looked up in McPUFF_program.read_and_clear_GEF_results()
-                        TKE   = float(rand_param_obj.perturbed_GEF_results['mean_value_TKE_pre'][0]) 
-                        #---------------------------------- avg(Q_bar) --------------------------------------------#     
-                        Q_bar = float(rand_param_obj.perturbed_GEF_results['mean_value_Q_bar'][0])     
-                        #---------------------------------- E1(n)/E2(n) -------------------------------------------#                                                                    
-                        E1_n  = np.mean(rand_param_obj.perturbed_FY[0:number_of_fission_events,11])
-                        E2_n  = np.mean(rand_param_obj.perturbed_FY[0:number_of_fission_events,13])
-                        #---------------------------------- E1(g)/E2(g) -------------------------------------------# 
-                        E1_g  = np.mean(rand_param_obj.perturbed_FY[0:number_of_fission_events,15])
-                        E2_g  = np.mean(rand_param_obj.perturbed_FY[0:number_of_fission_events,17])                                                                                                                   
-                        #-------------------------- ASSIGN DATA TO DATA VECTOR ------------------------------------#
-                        param_data_vec[n,0] = float(rand_param_obj.pert_param_val)  # Perturbed parameter value
-                        param_data_vec[n,1] = E1/E2                                 # average E1/E2
-                        param_data_vec[n,2] = TXE/TKE                               # average TXE/TKE
-                        param_data_vec[n,3] = Q_bar                                 # average Q_bar
-                        param_data_vec[n,4] = E1_n/E2_n                             # average E1(n)/E2(n)
-                        param_data_vec[n,5] = E1_g/E2_g                             # average E1(g)/E2(g) 
-                #---------------------------------- END RANDOM PARAMETER LOOP -------------------------------------#
-                #---------------------------------- ASSIGN DATA TO DICTIONARY -------------------------------------#
-                param_data_dict[f'{rand_param_obj.param_name}'] = param_data_vec
-                #----------------------------- CALCULATE CORRELATION COEFFICIENTS ---------------------------------#
-                correlation_data_vec = np.zeros((5,2,2))                                                                                # Multidimensional array. Correlation data shape is 2x2-matrix. Array is 5 x (2x2).
-                corr_E1_E2   = np.corrcoef(param_data_vec[:,0],param_data_vec[:,1])
-                corr_TXE_TKE = np.corrcoef(param_data_vec[:,0],param_data_vec[:,2])
-                corr_Q_bar   = np.corrcoef(param_data_vec[:,0],param_data_vec[:,3])
-                corr_E1n_E2n = np.corrcoef(param_data_vec[:,0],param_data_vec[:,4])
-                corr_E1g_E2g = np.corrcoef(param_data_vec[:,0],param_data_vec[:,5])
-                correlation_data_vec[0,:,:] = corr_E1_E2
-                correlation_data_vec[1,:,:] = corr_TXE_TKE
-                correlation_data_vec[2,:,:] = corr_Q_bar
-                correlation_data_vec[3,:,:] = corr_E1n_E2n
-                correlation_data_vec[4,:,:] = corr_E1g_E2g
-                correlation_data_dict[f'{rand_param_obj.param_name}'] = correlation_data_vec
-                del E1,E2,TXE,TKE,E1_n,E2_n,E1_g,E2_g,n,correlation_data_vec,corr_E1_E2,corr_TXE_TKE,corr_Q_bar,corr_E1n_E2n,corr_E1g_E2g,param_data_vec
+        param_data_dict, correlation_data_dict = McPUFF_Perturbed_Data.analyze_modified_parameters(Mod_param_obj_list)                 # Dictionaries with simulation and correlation info for each modified parameter.
         #----------------------------------------- PRINT RESULTS TO FILE ------------------------------------------#                 
-        with open("/__local_path__/correlation_coefficients.txt", 'w') as outputfile:                                               # Add local path to save position.
-            outputfile.write('Parameter name'.ljust(19," ")+'E1/E2'.ljust(12," ")+'TXE/TKE'.ljust(12," ")+'Q_bar'.ljust(10," ")+'E1(n)/E2(n)'.ljust(15," ")+'E1(g)/E2(g)'+'\n')
-            outputfile.write(78*'-'+'\n')
-            for para_name in list_param_names:
-                string = str(para_name).ljust(18," ")
-                for i in range(5):
-                    if i == 3:
-                        distance = 8
-                    else:
-                        distance = 5
-                    if correlation_data_dict[para_name][i,0,1]<0:
-                        string += str('{:05.4f}'.format(correlation_data_dict[para_name][i,0,1]))+distance*' '
-                    else:
-                        string += ' '+str('{:05.4f}'.format(correlation_data_dict[para_name][i,0,1]))+distance*' '
-                outputfile.write(string+'\n')
+        McPUFF_Perturbed_Data.write_correlation_coefficients("/__local_path__/correlation_coefficients.txt",                        # Add local path to save position.
+                                                             {para_name: correlation_data_dict[para_name] for para_name in list_param_names})
         #--------------------------------------------- PLOT RESULTS -----------------------------------------------# 
         #--------------------------------- Plot scatter data with regression line  --------------------------------#      
-        fig, ax = plt.subplots(figsize = (12,8))
-        x_data = param_data_dict['_Delta_S0'][:,0]                                                                                 # Add name of parameter to plot.
-        y_data = param_data_dict['_Delta_S0'][:,4]                                                                                 # Add name of parameter to plot.
-        ax.scatter(x_data, y_data, s=60, alpha=0.7, edgecolors="k",label='E1(n)/E2(n) for parameter')                              # Add label text.
-        b, a = np.polyfit(x_data, y_data, deg=1)
-        xseq = np.linspace(min(x_data), max(x_data), num=100)
-        ax.plot(xseq, a + b * xseq, color="r",ls='--', lw=2.5,label='least squares fit')
-        ax.set_xlabel('Parameter values'); ax.set_ylabel('average E1(n)/E2(n)')
-        ax.legend()
-        plt.title('Least squares fit avg(E1(n)/E2(n)) vs parameter 100 sims')                                                      # Add title text.
-        plt.savefig('/__local_path__/Scatterplot_parameter.png',dpi=300,format='png')                                              # Add local path to save position.
-        plt.show()               
+        McPUFF_Perturbed_Data.plot_least_squares_fit(param_data_dict['_Delta_S0'][:,0],param_data_dict['_Delta_S0'][:,4],                          # Add name of parameter to plot.
+                                                     '/__local_path__/Scatterplot_parameter.png',show_plot=show_plot)                          # Add local path to save position.
 #------------------------------------------------------- END OF METHOD --------------------------------------------#
 #------------------------------------------------------- END OF EXAMPLE -------------------------------------------#
         
@@ -357,7 +934,7 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
 #               FOR DIVISION OF EXCITATION ENERGY BETWEEN THE LIGHT AND HEAVY OBJECT FOR VARIOUS FISSION OBSERVABLES.                                  #                            
 #======================================================================================================================================================#  
                         
-    def Correlation_division_Eexc_light_heavy_TMC(MPD_obj):
+    def Correlation_division_Eexc_light_heavy_TMC(MPD_obj,show_plot=True):
         """Example of how to load data from a `pickle` file after a McPUFF
         ``TMC`` mode simulation.
 
@@ -366,6 +943,9 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
         MPD_obj : `object` [``McPUFF_Perturbed_Data``]
             A McPUFF_Perturbed_Data object instantiated from a ``McPUFF``
             simulation `pickle` file.
+        show_plot : `bool`, optional
+            Show the plot in a window (default). Use `False` for batch
+            runs, the plot is then only saved to file.
 
         Returns
         -------
@@ -417,92 +997,54 @@ class McPUFF_Perturbed_Data(main_program.TMC_Mod_Param_object):
         #----------------------------------------------------------------------------------------------------------#
 
         #----------------------------- CREATE EMPTY DICTIONARY WITH PARAMETER NAMES -------------------------------#
-        if isinstance(MPD_obj.list_of_TMC_Objects[0],main_program.TMC_Object):
-            param_data_dict = {key: [] for key in MPD_obj.list_of_TMC_Objects[0].dictionary_unpert_param_name_val}                      # Holds simulation info for each modified parameter.
-            correlation_data_dict = {key: {} for key in MPD_obj.list_of_TMC_Objects[0].dictionary_unpert_param_name_val}                # Holds correlation info for each modified parameter.
+        if not (isinstance(MPD_obj.list_of_TMC_Objects[0],main_program.TMC_Object) and                                                   # Lists are filled by McPUFF with one type of object. Check the type once.
+                    isinstance(MPD_obj.list_of_TMC_Objects[0].list_of_TMC_Mod_Param_objects[0],main_program.TMC_Mod_Param_object)):
+            print('No "TMC" simulation objects found in McPUFF_Perturbed_Data object')
+            sys.exit()
+        number_of_randoms = len(MPD_obj.list_of_TMC_Objects)
+        param_data_dict = {key: np.zeros((number_of_randoms,6)) for key in MPD_obj.list_of_TMC_Objects[0].dictionary_unpert_param_name_val}   # Holds simulation info for each modified parameter. One row per TMC_Object.
+        #------------------------- COLLECT FY OF ALL 'TMC_OBJECTS' IN ONE ARRAY (ONE ROW PER OBSERVABLE) ---------#
+        stacked_FY, number_of_fission_events = McPUFF_Perturbed_Data.stack_perturbed_FY(MPD_obj.list_of_TMC_Objects,[7,9,11,13,15,17])  # (6,number of TMC_Objects,max events) and (number of TMC_Objects,).
+        #------------ CREATE VECTOR WITH VALUES FOR RATIOS FOR ALL TMC_OBJECTS (ALL PERTURBED RUNS) AT ONCE -------#
+        #   Columns: [0]=pert_param_val,[1]=E1/E2,[2]=TXE/TKE,[3]=Q_bar,[4]=E1(n)/E2(n),[5]=E1(g)/E2(g)
+        #   Rows after the last fission event are zero, so the sum over all rows divided by the number of fission events is the mean.
+        #------------------------------ E1, E2, E1(n), E2(n), E1(g), E2(g) ----------------------------------------#
+        E1,E2,E1_n,E2_n,E1_g,E2_g = np.sum(stacked_FY,axis=2,dtype=np.float64)/number_of_fission_events                               # Each column is contiguous. One row of means per column.
+        #------------------------------------ TXE/TKE AND avg(Q_bar) ---------------------------------------------#
+        #   Float values converted once by McPUFF (McPUFF_program.Reaction.GEF_mean_values()). One pass over the objects.
+        #   Name of dictionary key can be looked up in McPUFF_program.read_and_clear_GEF_results()
+        TXE,TKE,Q_bar = np.array([(mean_values['mean_value_TXE'],mean_values['mean_value_TKE_pre'],mean_values['mean_value_Q_bar'])
+                                  for mean_values in (tmc_obj.perturbed_GEF_mean_values for tmc_obj in MPD_obj.list_of_TMC_Objects)]).T
+        param_values = {key: [0.0]*number_of_randoms for key in param_data_dict}                                                      # Python lists: item assignment of a float is cheaper than for a numpy array.
         # ----------------------- LOOP THROUGH ALL 'TMC_OBJECTS' IN 'LIST_OF_TMC_OBJECTS' -------------------------#
         for k,tmc_obj in enumerate(MPD_obj.list_of_TMC_Objects):
-            if isinstance(tmc_obj,main_program.TMC_Object):
-                #------------ CREATE VECTOR WITH VALUES FOR RATIOS FOR EACH TMC_OBJECT (EACH PERTURBED RUN) -------#
-                #   Columns: [0]=pert_param_val,[1]=E1/E2,[2]=TXE/TKE,[3]=Q_bar,[4]=E1(n)/E2(n),[5]=E1(g)/E2(g)
-                number_of_fission_events = len(tmc_obj.perturbed_FY[np.nonzero(tmc_obj.perturbed_FY[:,0]),0][0])                        # Number of nonzero elements in array.
-                #------------------------------------- E1/E2 ------------------------------------------------------#
-                E1 = np.mean(tmc_obj.perturbed_FY[0:number_of_fission_events,7][0])   
-                E2 = np.mean(tmc_obj.perturbed_FY[0:number_of_fission_events,9][0])
-                #------------------------------------ TXE/TKE -----------------------------------------------------#
-                TXE   = float(tmc_obj.perturbed_GEF_results['mean_value_TXE'][0])                                                       # Name of dictionary key can be looked up in McPUFF_program.read_and_clear_GEF_results()
-                TKE   = float(tmc_obj.perturbed_GEF_results['mean_value_TKE_pre'][0]) 
-                #---------------------------------- avg(Q_bar) ----------------------------------------------------#     
-                Q_bar = float(tmc_obj.perturbed_GEF_results['mean_value_Q_bar'][0])     
-                #---------------------------------- E1(n)/E2(n) ---------------------------------------------------#                                                                    
-                E1_n  = np.mean(tmc_obj.perturbed_FY[0:number_of_fission_events,11])
-                E2_n  = np.mean(tmc_obj.perturbed_FY[0:number_of_fission_events,13])
-                #---------------------------------- E1(g)/E2(g) ---------------------------------------------------# 
-                E1_g  = np.mean(tmc_obj.perturbed_FY[0:number_of_fission_events,15])
-                E2_g  = np.mean(tmc_obj.perturbed_FY[0:number_of_fission_events,17])      
-                #--- LOOP THROUGH ALL 'TMC_MOD_PARAM' OBJECTS IN 'LIST_OF_TMC_MOD_PARAM_OBJECT' OBJECTS -----------#                                                                                                             
-                for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects:
-                    if isinstance(tmc_mod_param_obj,main_program.TMC_Mod_Param_object):
-                        #-------------------- CREATE EMPTY DATA ARRAY ---------------------------------------------#
-                        TMC_Mod_Param_data_vec = np.zeros((1,6))
-                        #-------------------------- ASSIGN DATA TO DATA VECTOR ------------------------------------#
-                        TMC_Mod_Param_data_vec[0,0] = float(tmc_mod_param_obj.pert_param_val)                                           # Perturbed parameter value
-                        TMC_Mod_Param_data_vec[0,1] = E1/E2                                                                             # average E1/E2
-                        TMC_Mod_Param_data_vec[0,2] = TXE/TKE                                                                           # average TXE/TKE
-                        TMC_Mod_Param_data_vec[0,3] = Q_bar                                                                             # average Q_bar
-                        TMC_Mod_Param_data_vec[0,4] = E1_n/E2_n                                                                         # average E1(n)/E2(n)
-                        TMC_Mod_Param_data_vec[0,5] = E1_g/E2_g                                                                         # average E1(g)/E2(g) 
-                        #-------------------------- ASSIGN DATA TO DICTIONARY -------------------------------------#
-                        param_data_dict[f'{tmc_mod_param_obj.param_name}'].append(TMC_Mod_Param_data_vec)
-                        del TMC_Mod_Param_data_vec
-                        #------------------- END 'TMC_MOD_PARAM_OBJECT' OBJECTS LOOP ------------------------------#
-                #---------------------------------- END 'TMC_OBJECT' LOOP -----------------------------------------#
-        #------------------------------------ CALCULATE CORRELATION COEFFICIENTS ----------------------------------#
+            #--- LOOP THROUGH ALL 'TMC_MOD_PARAM' OBJECTS IN 'LIST_OF_TMC_MOD_PARAM_OBJECT' OBJECTS ---------------#                                                                                                             
+            for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects:
+                param_values[tmc_mod_param_obj.param_name][k] = float(tmc_mod_param_obj.pert_param_val)                                # Perturbed parameter value
+                #----------------------- END 'TMC_MOD_PARAM_OBJECT' OBJECTS LOOP ----------------------------------#
+            #-------------------------------------- END 'TMC_OBJECT' LOOP -----------------------------------------#
         for parameter_name in param_data_dict:
-            stacked_data = np.vstack(param_data_dict[parameter_name])                                                                   # Stack data from arrays in list of arrays into one array.
-            correlation_data_vec = np.zeros((5,2,2))                                                                                    # Multidimensional array. Correlation data shape is 2x2-matrix. Array is 5 x (2x2).
-            corr_E1_E2   = np.corrcoef(stacked_data[:,0],stacked_data[:,1])
-            corr_TXE_TKE = np.corrcoef(stacked_data[:,0],stacked_data[:,2])
-            corr_Q_bar   = np.corrcoef(stacked_data[:,0],stacked_data[:,3])
-            corr_E1n_E2n = np.corrcoef(stacked_data[:,0],stacked_data[:,4])
-            corr_E1g_E2g = np.corrcoef(stacked_data[:,0],stacked_data[:,5])
-            correlation_data_vec[0,:,:] = corr_E1_E2
-            correlation_data_vec[1,:,:] = corr_TXE_TKE
-            correlation_data_vec[2,:,:] = corr_Q_bar
-            correlation_data_vec[3,:,:] = corr_E1n_E2n
-            correlation_data_vec[4,:,:] = corr_E1g_E2g
-            correlation_data_dict[parameter_name] = correlation_data_vec        
-        del E1,E2,TXE,TKE,E1_n,E2_n,E1_g,E2_g,k,correlation_data_vec,corr_E1_E2,corr_TXE_TKE,corr_Q_bar,corr_E1n_E2n,corr_E1g_E2g
+            param_data_dict[parameter_name][:,0] = param_values[parameter_name]                                                         # One conversion per parameter.
+        #------------------------------ ASSIGN RATIOS SHARED BY ALL PARAMETERS TO DATA ARRAYS ---------------------#
+        #   Columns 1-5 are calculated once and copied into the preallocated array of each parameter as one block.
+        ratio_data = np.column_stack((E1/E2,                                                                                            # average E1/E2
+                                      TXE/TKE,                                                                                          # average TXE/TKE
+                                      Q_bar,                                                                                            # average Q_bar
+                                      E1_n/E2_n,                                                                                        # average E1(n)/E2(n)
+                                      E1_g/E2_g))                                                                                       # average E1(g)/E2(g) 
+        for parameter_name in param_data_dict:
+            param_data_dict[parameter_name][:,1:] = ratio_data
+        #------------------------------------ CALCULATE CORRELATION COEFFICIENTS ----------------------------------#
+        #   The ratio columns are shared by all parameters and are centred once. One row of coefficients per parameter.
+        correlations = McPUFF_Perturbed_Data.correlation_of_rows_with_columns(np.array([param_data_dict[parameter_name][:,0] for parameter_name in param_data_dict]),ratio_data)
+        correlation_data_dict = dict(zip(param_data_dict,correlations))                                                             # Holds correlation info for each modified parameter.
+        del stacked_FY,number_of_fission_events,E1,E2,TXE,TKE,Q_bar,E1_n,E2_n,E1_g,E2_g,k,param_values,ratio_data,correlations
         #----------------------------------------- PRINT RESULTS TO FILE ------------------------------------------#                 
-        with open("/__local_path__/correlation_coefficients.txt", 'w') as outputfile:                                                  # Add local path to save position.
-            outputfile.write('Parameter name'.ljust(19," ")+'E1/E2'.ljust(12," ")+'TXE/TKE'.ljust(12," ")+'Q_bar'.ljust(10," ")+'E1(n)/E2(n)'.ljust(15," ")+'E1(g)/E2(g)'+'\n')
-            outputfile.write(78*'-'+'\n')
-            for para_name in param_data_dict:
-                string = str(para_name).ljust(18," ")
-                for i in range(5):
-                    if i == 3:
-                        distance = 8
-                    else:
-                        distance = 5
-                    if correlation_data_dict[para_name][i,0,1]<0:
-                        string += str('{:05.4f}'.format(correlation_data_dict[para_name][i,0,1]))+distance*' '
-                    else:
-                        string += ' '+str('{:05.4f}'.format(correlation_data_dict[para_name][i,0,1]))+distance*' '
-                outputfile.write(string+'\n')
+        McPUFF_Perturbed_Data.write_correlation_coefficients("/__local_path__/correlation_coefficients.txt",correlation_data_dict)     # Add local path to save position.
         #--------------------------------------------- PLOT RESULTS -----------------------------------------------# 
         #--------------------------------- Plot scatter data with regression line  --------------------------------#      
-        fig, ax = plt.subplots(figsize = (12,8))        
-        x_data = np.vstack(param_data_dict['T_orbital'])[:,0]                                                                           # Add name of parameter to plot.
-        y_data = np.vstack(param_data_dict['T_orbital'])[:,4]                                                                           # Add name of parameter to plot.
-        ax.scatter(x_data, y_data, s=60, alpha=0.7, edgecolors="k",label='E1(n)/E2(n) for parameter')                                   # Add label text.
-        b, a = np.polyfit(x_data, y_data, deg=1)
-        xseq = np.linspace(min(x_data), max(x_data), num=100)
-        ax.plot(xseq, a + b * xseq, color="r",ls='--', lw=2.5,label='least squares fit')
-        ax.set_xlabel('Parameter values'); ax.set_ylabel('average E1(n)/E2(n)')
-        ax.legend()
-        plt.title('Least squares fit avg(E1(n)/E2(n)) vs parameter 100 sims')                                                           # Add title text.
-        plt.savefig('/__local_path__/Scatterplot_parameter.png',dpi=300,format='png')                                                  # Add local path to save position.
-        plt.show()    
+        McPUFF_Perturbed_Data.plot_least_squares_fit(param_data_dict['T_orbital'][:,0],param_data_dict['T_orbital'][:,4],                          # Add name of parameter to plot.
+                                                     '/__local_path__/Scatterplot_parameter.png',show_plot=show_plot)                          # Add local path to save position.
 #------------------------------------------------------- END OF METHOD --------------------------------------------#
 #------------------------------------------------------- END OF EXAMPLE -------------------------------------------#
 #------------------------------------------------------- END OF CLASS ---------------------------------------------#
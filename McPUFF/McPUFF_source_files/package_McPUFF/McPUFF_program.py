@@ -23,7 +23,7 @@ GEF and TALYS. The script takes user information about:
 - If TALYS simulations should be included. 
 - GEF and TALYS input data.
 - Output path for results. 
-The script stores the results in a `pickle` file.
+The script stores the results in a `gzip` compressed `pickle` file.
 The script deletes all GEF and TALYS simulation files and folders
 after the results are stored in the ``Reaction`` object. 
 
@@ -38,16 +38,113 @@ from package_McPUFF import Gaussian_GEF_Param
 from package_McPUFF import GEF_input
 from package_McPUFF import Parameters_to_vary
 from package_McPUFF import TALYS_Input
-from subprocess import PIPE, DEVNULL
-from threading import Thread
+from subprocess import DEVNULL
 import concurrent.futures
+import multiprocessing
 import numpy as np
 import subprocess
+import contextlib
+import itertools
+import hashlib
 import shutil
 import pickle
+import queue
+import gzip
 import math
 import sys
 import os
+class McPUFF_Pickler(pickle.Pickler):
+    """Pickler that writes the `pickle` file of McPUFF, with the fission
+    fragment yield arrays byte shuffled.
+     
+    Parameters
+    ----------
+    file : `file object`
+        Open binary file (or `gzip` file) to write the ``Reaction`` 
+        object to.
+    protocol : `int`
+        `pickle` protocol.
+
+    See Also
+    --------
+    ``Reaction.shuffle_FY_state()``
+    ``Reaction.__setstate__()``
+    `pickle` — Custom Reduction for Types, Functions, and Other Objects 
+    (url: <https://docs.python.org/3/library/pickle.html#reducer-override>)
+
+    Notes
+    -----
+    The byte shuffle only pays off when the file is compressed. Objects 
+    that the worker processes send to the main process are pickled by 
+    `concurrent.futures` with the standard pickler and are not shuffled.
+    The objects are written as by the standard pickler, only the 
+    attributes are replaced, so ``McPUFF_Unpickler`` needs no other 
+    names to load them.
+
+    Examples
+    --------
+    >>> with gzip.open("Z92_A236_n_E2.53e-08MeV.pkl.gz","wb") as pickle_file:
+            McPUFF_Pickler(pickle_file,protocol=5).dump(reac)
+    []
+    """
+    #------------------------------------------------------ CLASS METHODS ------------------------------------------------------#
+    def reducer_override(self,obj):
+        if not isinstance(obj,Reaction):
+            return NotImplemented                                                                                               # All other objects are pickled as usual.
+        new_object_function,new_object_arguments,state = obj.__reduce_ex__(2)[:3]                                              # Same for all protocols >= 2 as the standard pickler (copyreg.__newobj__, written as the NEWOBJ opcode).
+        return new_object_function,new_object_arguments,Reaction.shuffle_FY_state(state)
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+#----------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
+
+class McPUFF_Unpickler(pickle.Unpickler):
+    """Unpickler that only creates McPUFF objects, `numpy` arrays and 
+    built-in Python types when a `pickle` file is loaded.
+     
+    Parameters
+    ----------
+    file : `file object`
+        Open binary file (or `gzip` file) with a pickled ``Reaction`` 
+        object or with cached GEF or TALYS results.
+
+    See Also
+    --------
+    ``McPUFF_Perturbed_Data.load_pickle_file()``
+    ``Reaction.load_cache_file()``
+    `pickle` — Restricting Globals (url: 
+    <https://docs.python.org/3/library/pickle.html#restricting-globals>)
+
+    Notes
+    -----
+    A `pickle` file can name any importable function, which is called 
+    when the file is loaded. Loading a manipulated file with 
+    `pickle.load()` can therefore run arbitrary code. McPUFF files only 
+    need the classes and functions in ``allowed_globals``. Any other name
+    raises `pickle.UnpicklingError` before it is imported or called.
+
+    Examples
+    --------
+    >>> with open("Output_McPUFF/GEF_cache/6f1ed002ab5595859014ebf0951522d9.pkl","rb") as cache_file:
+            cached_results = McPUFF_Unpickler(cache_file).load()
+    [tuple]
+    """
+    #--------------------------------------------------- CLASS ATTRIBUTES ------------------------------------------------------#
+    allowed_globals = {'package_McPUFF.McPUFF_program':{'Reaction','Modified_Parameter','Random_Parameter_value','TMC_Object','TMC_Mod_Param_object'},
+                       'numpy':{'dtype','ndarray'},
+                       'numpy._core.multiarray':{'_reconstruct','scalar'},                                                      # numpy >= 2.0
+                       'numpy.core.multiarray':{'_reconstruct','scalar'},                                                       # numpy < 2.0
+                       'numpy._core.numeric':{'_frombuffer'},                                                                   # pickle protocol 5, numpy >= 2.0
+                       'numpy.core.numeric':{'_frombuffer'},                                                                    # pickle protocol 5, numpy < 2.0
+                       '_codecs':{'encode'}}                                                                                    # bytes in pickle protocol 2
+    """Module names and the names in each module that a McPUFF `pickle`
+    file may contain (`dict` [`str`, `set` [`str`]])."""
+    #------------------------------------------------------ CLASS METHODS ------------------------------------------------------#
+    def find_class(self,module,name):
+        if name not in McPUFF_Unpickler.allowed_globals.get(module,()):
+            raise pickle.UnpicklingError(f'"{module}.{name}" is not allowed in a McPUFF pickle file')
+        return super().find_class(module,name)
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+#----------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
+
 class Reaction:
     """Main object that holds all information about reaction being 
     investigated as well as all simulation results.
@@ -117,6 +214,37 @@ class Reaction:
     ``unperturbed_ignored_events``, it is possible to recreate the number
     of times a certain fission event has occured.
 
+    In the ``Single_Parameters`` mode one thread per parameter 
+    (`concurrent.futures.ThreadPoolExecutor`) hands the simulations of 
+    its parameter to a pool of worker processes 
+    (`concurrent.futures.ProcessPoolExecutor`), so that the parsing of 
+    the GEF output is not serialized by the GIL. The threads only wait.
+    In the ``TMC`` mode the simulations are run by worker processes
+    (`concurrent.futures.ProcessPoolExecutor`) for the same reason. The 
+    simulations are sent to the workers in chunks and only the small 
+    ``TMC_Object`` of each simulation is pickled on the way back. Each 
+    ``TMC`` worker process is pinned to its own CPU, see 
+    ``Reaction.pin_TMC_worker_process()``. The workers of both modes are
+    started from a fork server that has imported `numpy` and McPUFF 
+    once, see ``Reaction.worker_process_context()``. The unperturbed 
+    simulation runs alongside the perturbed simulations of both modes, 
+    in a `concurrent.futures.ThreadPoolExecutor` with one thread. An 
+    exception in it is raised again by the ``result()`` of its future.
+    Scripts that create a ``Reaction`` object must protect the call 
+    with ``if __name__ == "__main__":``.
+    
+    The fission fragment yield arrays are byte shuffled before they are 
+    compressed into the `pickle` file, see ``McPUFF_Pickler``.
+
+    The attributes are declared as class attributes set to `None` to 
+    document them, and set on every object in the constructor. The 
+    classes do not use `__slots__`: the objects are inspected with 
+    `vars(object)`, the subclasses ``Modified_Parameter``, 
+    ``Random_Parameter_value``, ``TMC_Object`` and 
+    ``TMC_Mod_Param_object`` would keep a `__dict__` anyway, and the 
+    `pickle` files of earlier versions of McPUFF are restored into the
+    `__dict__` of the objects.
+
     References
     ----------
     .. [1] P. Karlsson, "Total Monte Carlo of the fission model in
@@ -148,7 +276,7 @@ class Reaction:
                                     "/local/path/modified/TALYS/",
                                         "/local/path/main/Python/script",
                                                             True,"TMC")
-    ["Z92_A236_n_E2.53e-08MeV.pkl"]
+    ["Z92_A236_n_E2.53e-08MeV.pkl.gz"]
     """
     #--------------------------------------------------- CLASS ATTRIBUTES ------------------------------------------------------#
     distribution_flag = None
@@ -201,10 +329,126 @@ class Reaction:
     See also ``McPUFF_program.read_and_clear_GEF_results()``."""
     reaction_info = None
     """Holds information about:``Mc_runs``,``Z_target``,``A_compound``
-    ,``E_reaction``,``num_of_rand`` 
-    (`dict` [`int`, `int`, `int`, `float`, `int`])."""
+    ,``E_reaction``,``num_of_rand``
+    (`dict` [`int`, `int`, `int`, `float`, `int`]).
+
+    Written once per simulation run and read once when the `pickle` file
+    is loaded. Kept as a `dict` of built-in types, so that the `pickle`
+    file needs no extra class for it (see
+    ``McPUFF_program.McPUFF_Unpickler``) and the keys of files from
+    earlier versions still work."""
+    storage_dtype = np.float32
+    """dtype of the fission fragment yield, GEF and TALYS result arrays
+    that are stored in the `pickle` file (`numpy.dtype`).
+    
+    Mean values and standard deviations are always calculated with
+    `numpy.float64` and then stored with this dtype. The statistical 
+    uncertainty of the Monte Carlo sampling is far larger than the 
+    rounding error of `numpy.float32`. Change to `numpy.float64` here 
+    to store results in double precision."""
+    pickle_header = {'TMC':b'MCT\x01','Single_Parameters':b'MCS\x01'}
+    """Four bytes written before the pickled ``Reaction`` object in the 
+    `pickle` file, one per program mode (`dict` [`str`, `bytes`]).
+    
+    Lets ``McPUFF_Perturbed_Data`` identify the mode of a file without 
+    loading it. The last byte is a format version."""
+    pickle_FY_dtype = None
+    """dtype of ``unperturbed_FY`` and ``perturbed_FY`` in the `pickle` 
+    file only (`numpy.dtype` or `None`).
+    
+    `None` keeps ``storage_dtype``. `numpy.float16` halves the size of the 
+    arrays in the file and in memory after loading. The arrays are only
+    converted when the file is written (``Reaction.shuffle_FY_state()``,
+    called by ``McPUFF_Pickler``). Results sent from the worker 
+    processes and held by the ``Reaction`` object during the run keep 
+    ``storage_dtype``. The ".ff" files for TALYS are written before and 
+    are not affected. Note that `float16` 
+    has about 3 significant digits and that yields below 6e-5 lose 
+    precision (subnormal numbers), so it is only suitable when the 
+    stored yields are used for averages and correlations. Reductions in
+    ``McPUFF_Perturbed_Data`` are made with `numpy.float64`."""
+    element_symbols = {90:'Th',92:'U',94:'Pu',96:'Cm'}
+    """Symbol of the chemical element for each atomic number 
+    (`dict` [`int`, `str`]).
+
+    Used in the path to the ".ff" files of the target in the GEF library
+    of TALYS, e.g. "gef/U236". Add an element here to simulate it."""
+    pickle_compresslevel = 3
+    """`gzip` compression level of the `pickle` file (`int`, 0-9).
+
+    1 is fastest, 9 gives the smallest file. The fission yield arrays are
+    mostly zeros and repeated Z and A values, so even level 1 gives a much
+    smaller file than no compression. Level 0 stores the data 
+    uncompressed in `gzip` format. The files are read the same way for
+    all levels."""
+    keep_TALYS_output_file = False
+    """If `True`, the screen output of TALYS is written to the 
+    "_output.out" file in the TALYS working directory (`boolean`).
+
+    McPUFF reads its results from the other TALYS output files. The 
+    screen output is not read and, by default, it is discarded without 
+    being written to disc. See ``Reaction.open_TALYS_output_file()``."""
+    GEF_working_dir_in_RAM = False
+    """If `True`, the GEF working directory is created in "/dev/shm" 
+    (RAM, tmpfs) instead of in the McPUFF output folder (`boolean`).
+
+    Every GEF simulation creates and deletes its "ctl", "dmp", "out" and
+    "tmp" folders, which in RAM costs no disc access. The ".lmd" file of
+    every running GEF simulation must then fit in "/dev/shm", which in a
+    container can be as small as 64 MB. The folder is deleted after the 
+    `pickle` file is written, but is left in RAM if McPUFF exits early.
+    Ignored if "/dev/shm" does not exist."""
+    use_GEF_cache = False
+    """If `True`, the results of every GEF simulation are stored in the 
+    GEF cache folder and reused by later simulations with identical GEF
+    input (`boolean`).
+
+    Only useful when the same input is simulated again, e.g. the 
+    unperturbed simulation when McPUFF is run again or the "max-min"
+    distribution. See ``Reaction.run_GEF_simulation()``. Every 
+    simulation adds a file to the cache folder, also in ``TMC`` mode 
+    where the input practically never repeats. Empty the folder by 
+    deleting its files."""
+    use_TALYS_cache = False
+    """If `True`, the results of every TALYS simulation are stored in the
+    TALYS cache folder and reused by later simulations with identical 
+    fission yields and reaction (`boolean`).
+
+    Hits only occur when the GEF results repeat, see 
+    ``Reaction.use_GEF_cache`` and ``Reaction.run_TALYS_simulation()``.
+    Every simulation adds a file to the cache folder. Empty the folder
+    by deleting its files."""
+    random_seed = None
+    """Seed of the random number generator (`int` or `None`).
+
+    All random numbers of a simulation are drawn from one 
+    `numpy.random.Generator` (PCG64) created with this seed in 
+    ``Reaction.__init__``. The same seed and input give the same 
+    perturbed parameter values. `None` draws a new seed from the 
+    operating system for every simulation."""
+    number_of_CPUs = len(os.sched_getaffinity(0)) if hasattr(os,'sched_getaffinity') else (os.cpu_count() or 1)
+    """Number of CPU's McPUFF may use, read once when McPUFF is imported 
+    (`int`).
+
+    On Linux this is the number of CPU's the process is allowed to run 
+    on, which on a cluster node or in a container can be fewer than the
+    CPU's of the computer reported by `os.cpu_count()`. The worker 
+    counts of both modes are calculated from this number."""
+    distributions_per_mode = {'Single_Parameters':('uniform','normal','max-min'),'TMC':('uniform','normal')}
+    """Program modes and the distributions random numbers can be drawn
+    from in each mode (`dict` [`str`, `tuple` [`str`]]).
+
+    Checked in the constructor before any folder is created or any 
+    simulation is started."""
     #------------------------------------------------------ CONSTRUCTOR --------------------------------------------------------#
     def __init__(self,Z_target,A_compound,E_reaction,runs_MC,number_of_randoms,dist_flag,pth_GEF_program,pth_TALYS_program,pth_main,with_TALYS,prog_flag):   
+        #---------------------------- CHECK PROGRAM MODE AND DISTRIBUTION BEFORE ANY WORK IS STARTED ---------------------------#
+        if prog_flag not in Reaction.distributions_per_mode:                            # A typo must not cost an unperturbed GEF simulation.
+            print(f'Incorrect program flag "{prog_flag}". Use one of {list(Reaction.distributions_per_mode)}.')
+            sys.exit('Exiting program')
+        if dist_flag not in Reaction.distributions_per_mode[prog_flag]:
+            print(f'The "{dist_flag}"-distribution does not exist in "{prog_flag}" mode. Use one of {list(Reaction.distributions_per_mode[prog_flag])}')
+            sys.exit('Exiting program')
         self.distribution_flag = dist_flag                                              # String: Determines which distribution random numbers are drawn from.
         self.With_TALYS_flag = with_TALYS                                               # Boolean:Determines if run TALYS too
         self.program_flag = prog_flag                                                   # String: Determines if single_parameter or TMC-run
@@ -232,71 +476,205 @@ class Reaction:
         [5,8,10,11,12,14,16,20,24,26,27,28,30,38,39,40,41,48,49,50,51,52,
         53,54,56,60,65,81,82,83,84,85,86,89,96]"""
         dict_unpert_param_name_val = {}                                         
+        lines_without_parameters = {55,98}                                              # Lines in source file without a parameter value to read (see package_McPUFF.Parameters_to_vary).
+        wanted_lines = {i for i in param_to_vary if i not in lines_without_parameters}  # SKip lines without parameters in source file.
         with open(path_dict['GEF_program_path'] +'Parameters.bas', 'r') as f:           # Open parameter source file in GEF. 
-            list_of_parameters = f.readlines()                                          # Create list of lines in file.
-            for i in param_to_vary:  
-                if i!=55 and i!=98:                                                     # SKip lines without parameters in source file.
-                    rad=list_of_parameters[i].split()                                   # Split line into separate strings.
-                    dict_unpert_param_name_val[rad[0]]=rad[2]                           # Store name and unperturbed value.
-        number_of_parameters = len(param_to_vary)                                       # Number of parameters used. Needed to determine how many CPU's to use (see below).
+            list_of_parameters = {line_number: line for line_number,line in enumerate(itertools.islice(f,max(wanted_lines,default=-1)+1)) 
+                                  if line_number in wanted_lines}                       # Only the wanted lines are kept. Reading stops after the last one.
+        for i in param_to_vary:  
+            if i in wanted_lines:
+                rad=list_of_parameters[i].split()                                       # Split line into separate strings.
+                dict_unpert_param_name_val[rad[0]]=float(rad[2])                        # Store name and unperturbed value. Converted from text once, here.
+        number_of_parameters = len(dict_unpert_param_name_val)                          # Number of parameters used. Needed to determine how many CPU's to use (see below).
         self.dictionary_unpert_param_name_val = dict_unpert_param_name_val              # Store in Reaction object.
-        del f,i, list_of_parameters, param_to_vary                            
+        del f,i, list_of_parameters, param_to_vary, wanted_lines, lines_without_parameters
+        if with_TALYS == True and not os.path.isdir(path_dict['TALYS_ff_file_path']):   # Perturbed ".ff" files are written to this folder. Checked before any simulation is started.
+            print(f'The folder of ".ff" files for the target, "{path_dict["TALYS_ff_file_path"]}", does not exist in the GEF library of TALYS.')
+            sys.exit('Exiting program')
         #------------------------------------ CREATE UNPERTURBED FISSION YIELDS (FY) FOR COMPARISON ----------------------------#
-        try:
-            unperturbed_thread = Custom_Thread(target=Reaction.create_unperturbed_FY, args=[Z_target,A_compound,E_reaction,runs_MC,with_TALYS,path_dict]) 
-            """Create Custom thread for unperturbed FY. 
+        unperturbed_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)    # Runs while the perturbed simulations of either mode are performed below.
+        unperturbed_future = unperturbed_executor.submit(Reaction.create_unperturbed_FY,Z_target,A_compound,E_reaction,runs_MC,with_TALYS,path_dict)
+        """Future for the result dictionary of the unperturbed simulation.
 
-            Must be custom to be able to retrieve results."""      
-            unperturbed_thread.start()                                                                                                                         
-        except Exception as e:
-            sys.exit(e)                                                                                                                                         
+        See ``Reaction.create_unperturbed_FY()``."""
+        random_generator = np.random.default_rng(Reaction.random_seed)                 # PCG64. All random numbers of the simulation come from this generator. See ``Reaction.random_seed``.
         #------------------------------------ CREATE PERTURBED FY IN 'SINGLE_PARAMETERS' MODE ----------------------------------#
         if self.program_flag == 'Single_Parameters':                                    # Program slow if all processors used. Computer internal processing can use available CPU's for multi-thread processing. 
-            number_of_workers = math.floor((os.cpu_count()-2)/3)                        # Determines number of parameters simulated in parallel.
+            number_of_workers = max(1,min(math.floor((Reaction.number_of_CPUs-2)/3),number_of_parameters))    # Determines number of parameters simulated in parallel. At least one and no more than there are parameters.
+            max_processes_single = max(1,min(math.floor(Reaction.number_of_CPUs*(2/3)),number_of_parameters*int(number_of_randoms)))  # One GEF-run per worker process. Use 2/3 of available CPU's, at least one and no more than there are simulations.
+            parameter_generators = dict(zip(dict_unpert_param_name_val,random_generator.spawn(number_of_parameters)))  # One independent child generator per parameter, in parameter order. Same numbers whatever order the threads run in.
             #----------- PERFORM MULTI-THREAD SIMULATIONS ASYNCHRONOUSLY USING PYTHONS 'CONCURRENT FUTURES' MODULE -------------#
-            try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=number_of_workers) as parameter_executor:   
+            try:                                                                        # One process pool shared by all parameter threads. The threads only submit simulations and collect the results of their parameter.
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_processes_single,mp_context=Reaction.worker_process_context()) as perturbed_single_executor, \
+                     concurrent.futures.ThreadPoolExecutor(max_workers=number_of_workers) as parameter_executor:   
                     future_mod_param_obj = {parameter_executor.submit(Reaction.perturbed_calculations_single_parameter,key,dict_unpert_param_name_val,
-                                                                    Z_target,A_compound,E_reaction,runs_MC,number_of_randoms,number_of_workers,with_TALYS,dist_flag,path_dict): key for key in dict_unpert_param_name_val}  
-                future_done = concurrent.futures.as_completed(future_mod_param_obj)     # Completion time of simulations vary. Collect results asynchronously.
-                for mod_param_obj in future_done:                                       # Simulation results for each parameter collected in its own 'Modified_Parameter' object.
-                    self.list_of_Mod_Param_objects.append(mod_param_obj.result())       # 'Modified_Parameter' objects stored in list in main 'Reaction' object.    
+                                                                    Z_target,A_compound,E_reaction,runs_MC,number_of_randoms,perturbed_single_executor,with_TALYS,dist_flag,path_dict,parameter_generators[key]) for key in dict_unpert_param_name_val}  
+                    while future_mod_param_obj:                                         # Completion time of simulations vary. Collect results while the others are still running.
+                        future_done, future_mod_param_obj = concurrent.futures.wait(future_mod_param_obj,return_when=concurrent.futures.FIRST_COMPLETED)   # Finished futures are dropped from the pending set.
+                        for mod_param_obj in future_done:                               # Simulation results for each parameter collected in its own 'Modified_Parameter' object.
+                            self.list_of_Mod_Param_objects.append(mod_param_obj.result())   # 'Modified_Parameter' objects stored in list in main 'Reaction' object.    
             except Exception as e:
                 print('Encountered a problem in Threadpool in main.\n')
                 sys.exit(e)
-            del number_of_parameters,number_of_workers,parameter_executor,future_mod_param_obj,future_done
+            del number_of_parameters,number_of_workers,max_processes_single,parameter_generators,perturbed_single_executor,parameter_executor,future_mod_param_obj,future_done,random_generator
         #----------------------------------------------- CREATE PERTURBED FY IN 'TMC' MODE -------------------------------------#
         elif self.program_flag == 'TMC':                                                # Program slow if all processors used. Computer internal processing can use available CPU's for multithread processing.
-            max_multithreads_TMC = math.floor(os.cpu_count()*(2/3))                     # One GEF-run per random number. All param at once. Use 2/3 of available CPU's.
-            #----------- PERFORM MULTI-THREAD SIMULATIONS ASYNCHRONOUSLY USING PYTHONS 'CONCURRENT.FUTURES' MODULE -------------#
-            try:                                                
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_multithreads_TMC) as perturbed_TMC_executor:   # Max_workers is really max-2 because main and unpert thread.
-                    future_tmc_obj = {perturbed_TMC_executor.submit(Modified_Parameter.create_perturbed_TMC_FY,dict_unpert_param_name_val,n,Z_target,A_compound,
-                                        E_reaction,runs_MC,path_dict,with_TALYS,dist_flag):n for n in range(int(number_of_randoms))}
-                future_done = concurrent.futures.as_completed(future_tmc_obj)           # Completion time of simulations vary. Collect results asynchronously.
-                for tmc_obj in future_done:                                             # Simulation results for all parameters collected in 'TMC_Object' object.
-                    self.list_of_TMC_Objects.append(tmc_obj.result())                   # 'TMC_Object' objects stored in list in main 'Reaction' object.
+            max_multithreads_TMC = max(1,min(math.floor(Reaction.number_of_CPUs*(2/3)),int(number_of_randoms)))     # One GEF-run per random number. All param at once. Use 2/3 of available CPU's, at least one and no more than there are simulations.
+            TMC_chunksize = max(1,int(number_of_randoms)//(4*max_multithreads_TMC))     # Number of simulations sent to a worker process at a time. Reduces dispatch overhead for many short simulations.
+            pin_TMC_workers = True                                                      # Pin each worker process (and its GEF and TALYS runs) to its own CPU. Set to False to let the OS schedule freely.
+            #--------------------------------- ONE CPU PER WORKER PROCESS, HANDED OUT WHEN THE WORKER STARTS --------------------#
+            if pin_TMC_workers == True and hasattr(os,'sched_getaffinity'):             # CPU affinity is only available on Linux.
+                available_CPUs = sorted(os.sched_getaffinity(0))
+            else:
+                available_CPUs = [None]                                                 # None: worker is not pinned.
+            #------------------------- START WORKERS FROM A FORK SERVER WITH McPUFF AND NUMPY ALREADY IMPORTED -------------------#
+            TMC_context = Reaction.worker_process_context()                             # Fork server is started without the running unperturbed simulation thread. Safe to fork from.
+            CPU_queue = TMC_context.Queue()
+            for worker_number in range(max_multithreads_TMC):
+                CPU_queue.put(available_CPUs[worker_number % len(available_CPUs)])
+            #------------- DRAW ALL RANDOM NUMBERS AT ONCE. ONE ROW PER SIMULATION, ONE COLUMN PER PARAMETER -------------------#
+            if dist_flag == 'uniform':
+                standard_random_numbers = random_generator.random((int(number_of_randoms),len(dict_unpert_param_name_val)))           # Uniform in [0,1[. Scaled to each parameter in ``TMC_Mod_Param_object``.
+            elif dist_flag == 'normal':
+                standard_random_numbers = random_generator.standard_normal((int(number_of_randoms),len(dict_unpert_param_name_val)))  # Standard normal. Scaled to each parameter in ``TMC_Mod_Param_object``.
+            #------------ PERFORM MULTI-PROCESS SIMULATIONS USING PYTHONS 'CONCURRENT.FUTURES' MODULE --------------------------#
+            try:                                                                        # Processes instead of threads: parsing of GEF output in ``Reaction.FY_results()`` is not limited by the GIL.
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_multithreads_TMC,mp_context=TMC_context,
+                                                            initializer=Reaction.pin_TMC_worker_process,initargs=(CPU_queue,)) as perturbed_TMC_executor:   
+                    results_tmc_obj = perturbed_TMC_executor.map(Modified_Parameter.create_perturbed_TMC_FY,itertools.repeat(dict_unpert_param_name_val),   # One future per chunk, not per simulation. The random number index is the position in the results, no future-to-index dictionary is kept.
+                                        range(int(number_of_randoms)),itertools.repeat(Z_target),itertools.repeat(A_compound),itertools.repeat(E_reaction),
+                                            itertools.repeat(runs_MC),itertools.repeat(path_dict),itertools.repeat(with_TALYS),itertools.repeat(dist_flag),
+                                                standard_random_numbers,chunksize=TMC_chunksize)
+                    for tmc_obj in results_tmc_obj:                                     # Simulation results for all parameters collected in 'TMC_Object' objects, stored in list in main 'Reaction' object (in order of random number).
+                        tmc_obj.dictionary_unpert_param_name_val = dict_unpert_param_name_val                       # Every chunk of results is unpickled with its own copy. Share one dictionary instead.
+                        for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects:
+                            tmc_mod_param_obj.param_name = sys.intern(tmc_mod_param_obj.param_name)                 # One string object per parameter name. Stored once in the `pickle` file.
+                        self.list_of_TMC_Objects.append(tmc_obj)
             except Exception as e:
                 sys.exit(e) 
-            del max_multithreads_TMC,perturbed_TMC_executor,future_tmc_obj,future_done   
-        else:
-            print('Incorrect program flag- Exiting program')
-            sys.exit()
-        #------------------------------------------ COLLECT DATA FROM UNPERTURBED THREAD ---------------------------------------#
-        unperturbed_thread.join()                                                       # Main thread waits for unperturbed thread to complete.
-        self.unperturbed_FY = unperturbed_thread.unperturbed_FY
-        self.unperturbed_GEF_results = unperturbed_thread.unperturbed_GEF_results
-        self.unperturbed_TALYS_results = unperturbed_thread.unperturbed_TALYS_results
-        self.unperturbed_ignored_events = unperturbed_thread.unperturbed_ignored_events
-        del unperturbed_thread
+            del max_multithreads_TMC,TMC_chunksize,pin_TMC_workers,available_CPUs,TMC_context,CPU_queue,worker_number,standard_random_numbers,perturbed_TMC_executor,results_tmc_obj,random_generator   
+        #------------------------------------------ COLLECT DATA FROM UNPERTURBED SIMULATION -----------------------------------#
+        try:
+            unperturbed_result_dict = unperturbed_future.result()                       # Main thread waits for unperturbed simulation to complete. Exceptions in the simulation are raised here.
+        except Exception as e:
+            print('Encountered a problem in the unperturbed simulation.\n')
+            sys.exit(e)
+        finally:
+            unperturbed_executor.shutdown()
+        self.unperturbed_FY = unperturbed_result_dict['FY_TALYS_format']
+        self.unperturbed_GEF_results = unperturbed_result_dict['GEF_data_dict']
+        self.unperturbed_TALYS_results = unperturbed_result_dict['TALYS_data_dict']
+        self.unperturbed_ignored_events = unperturbed_result_dict['unpert_ignored_events']
+        del unperturbed_executor,unperturbed_future,unperturbed_result_dict
         #--------------------------------------------------- PICKLE RESULTS ----------------------------------------------------#
-        with open(os.path.join(path_dict['PKL_path'],f'Z{Z_target}_A{A_compound}_n_E{E_reaction}MeV.pkl'), 'wb') as Reac_object:
-            pickle.dump(self, Reac_object)   
+        with gzip.open(os.path.join(path_dict['PKL_path'],f'Z{Z_target}_A{A_compound}_n_E{E_reaction}MeV.pkl.gz'), 'wb', compresslevel=Reaction.pickle_compresslevel) as Reac_object:
+            Reac_object.write(Reaction.pickle_header[self.program_flag])                   # Program mode. Read without loading the object.
+            McPUFF_Pickler(Reac_object, protocol=5).dump(self)                          # Fission yields byte shuffled in the file only. Protocol 5: NumPy arrays are written from their own buffers (PickleBuffer) without an intermediate bytes copy. Compressed with fast gzip level.
+            # The array buffers are kept in-band (no 'buffer_callback'). Out-of-band buffers would be written to the same gzip stream
+            # and would not move fewer bytes, and at loading an in-band array already uses the memory it is read into without a copy.
         del Reac_object
+        if path_dict['GEF_working_dir_path'].startswith('/dev/shm'):                  # GEF working directory in RAM (see ``Reaction.GEF_working_dir_in_RAM``) is not kept after the run.
+            Reaction.remove_folder(path_dict['GEF_working_dir_path'])
     #------------------------------------------------------ CLASS METHODS ------------------------------------------------------#
+    def shuffle_FY_state(state):
+        """Return the attributes to be stored in the `pickle` file, with 
+        the fission fragment yield arrays byte shuffled.
+        
+        Parameters
+        ----------
+        state : `dict`
+            Attributes (``__dict__``) of a ``Reaction`` object or of an 
+            object that inherits from it.
+
+        Returns
+        -------
+        shuffled_state : `dict`
+            Copy of ``state``. ``unperturbed_FY`` and ``perturbed_FY`` are
+            replaced by a dictionary with the ``shape``, ``dtype`` and 
+            ``byte_planes`` of the array.
+
+        See Also
+        --------
+        ``McPUFF_Pickler``
+        ``Reaction.__setstate__()``
+
+        Notes
+        -----
+        Only called by ``McPUFF_Pickler``, which writes the `pickle` file 
+        at the end of the constructor. Objects sent between the worker 
+        processes and the main process are pickled without it and keep 
+        their arrays as they are.
+        The bytes of the `float32` yield arrays are reordered so that the 
+        first byte of every number is stored first, then the second byte 
+        of every number and so on (byte shuffle). The sign, exponent and 
+        high mantissa bytes of the yields vary little between numbers in 
+        the same array, which makes the shuffled arrays compress better 
+        and faster with `gzip`. The ``byte_planes`` array (`numpy.uint8`) 
+        is still written in-band with `pickle` protocol 5.
+        If ``Reaction.pickle_FY_dtype`` is set, the arrays are converted to
+        that dtype before they are shuffled.
+
+        Examples
+        --------
+        >>> shuffled_state = Reaction.shuffle_FY_state(vars(reac))
+        [shuffled_state]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        shuffled_state = state.copy()
+        for FY_key in ('unperturbed_FY','perturbed_FY'):
+            FY = shuffled_state.get(FY_key)
+            if isinstance(FY,np.ndarray):
+                if Reaction.pickle_FY_dtype is not None:
+                    FY = FY.astype(Reaction.pickle_FY_dtype)                                                                    # Smaller dtype in the pickle file only.
+                shuffled_state[FY_key] = {'shape':FY.shape,'dtype':FY.dtype.str,                                                  # Needed to restore array.
+                                          'byte_planes':np.ascontiguousarray(FY).view(np.uint8).reshape(-1,FY.dtype.itemsize).T.copy()}     # Row k holds byte k of every number.
+        del FY_key,FY
+        return shuffled_state
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def __setstate__(self,state):
+        """Restore the attributes of an object loaded from a `pickle` 
+        file and undo the byte shuffle of the fission fragment yield 
+        arrays.
+        
+        Parameters
+        ----------
+        state : `dict`
+            Attributes stored in the `pickle` file, see 
+            ``Reaction.shuffle_FY_state()``.
+
+        Returns
+        -------
+        Function has no return value.
+
+        See Also
+        --------
+        ``Reaction.shuffle_FY_state()``
+
+        Notes
+        -----
+        `pickle` files from earlier versions of McPUFF, and objects sent 
+        from the worker processes, store the yield arrays as 
+        `numpy.ndarray`. These are restored as they are.
+
+        Examples
+        --------
+        Called by `pickle.load()`.
+        >>> reac.__setstate__(state)
+        []
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        for FY_key in ('unperturbed_FY','perturbed_FY'):
+            FY = state.get(FY_key)
+            if isinstance(FY,dict):
+                state[FY_key] = FY['byte_planes'].T.copy().view(np.dtype(FY['dtype'])).reshape(FY['shape'])                     # Byte k of every number back in place.
+        self.__dict__.update(state)
+        del FY_key,FY
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
     def clear_MyParameters_dat(GEF_cwd_path):
-        """Writes empty string into file, replacing whatever was there to
-        make room for new perturbed parameter values.
+        """Empties the "MyParameters.dat" file, if it exists, to make room
+        for new perturbed parameter values.
         
         Parameters
         ----------
@@ -309,17 +687,17 @@ class Reaction:
 
         Examples
         --------
-        Function replaces content of 'MyParameters.dat' file with 
-        empty string.
+        Function truncates the 'MyParameters.dat' file to zero length.
         >>> Reaction.clear_MyParameters_dat("/local/path/modified/GEF")
         []
         """
         #-----------------------------------------------------------------------------------------------------------------------#
         path_MyParameters_file = os.path.join(GEF_cwd_path,'MyParameters.dat')
-        if os.path.isfile(path_MyParameters_file):
-            with open(path_MyParameters_file, 'w') as MyParam_dat_file:
-                MyParam_dat_file.write('')
-            del path_MyParameters_file,MyParam_dat_file
+        try:
+            os.truncate(path_MyParameters_file,0)                                                                               # Empty the file in place. No file object is opened.
+        except FileNotFoundError:
+            pass                                                                                                                # No file to clear.
+        del path_MyParameters_file
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
             
     def create_paths_and_directories(Z_target,A_compound,pth_GEF_program,pth_TALYS_program,pth_main):
@@ -358,7 +736,8 @@ class Reaction:
                 Path to McPUFF output folder (`str`).
             ``"GEF_working_dir_path"``
                 Path to modified GEF output folder in McPUFF output folder
-                (`str`).
+                (`str`), or in "/dev/shm" if 
+                ``Reaction.GEF_working_dir_in_RAM`` is `True`.
             ``"TALYS_working_dir_path"``
                 Path to modified TALYS output folder in McPUFF output 
                 folder (`str`).
@@ -369,14 +748,22 @@ class Reaction:
                 (`str`).
             ``"TALYS_ff_file_path"``
                 Path to modified GEF library of ".ff" files (`str`).
+            ``"GEF_cache_path"``
+                Path to folder with cached GEF results (`str`). The folder
+                is only created if ``Reaction.use_GEF_cache`` is `True`. 
+                See ``Reaction.run_GEF_simulation()``.
+            ``"TALYS_cache_path"``
+                Path to folder with cached TALYS results (`str`). The 
+                folder is only created if ``Reaction.use_TALYS_cache`` is
+                `True`. See ``Reaction.run_TALYS_simulation()``.
 
             Notes
             -----
             The ``TALYS_ff_file_path`` below must be in the format of the 
             default ".ff" files in the GEF library. The name includes
-            the symbol of the chemical element. This `if` statement
-            can be extended if simulations are to be performed for
-            other elements.
+            the symbol of the chemical element, which is looked up in
+            ``Reaction.element_symbols``. The dictionary can be extended
+            if simulations are to be performed for other elements.
             
             Examples
             --------
@@ -386,50 +773,40 @@ class Reaction:
                         "/local_path/","Output_McPUFF_path":"/local_path/",
                         "GEF_working_dir_path":"/local_path/","TALYS_working_dir_path":
                         "/local_path/","TALYS_input_path":"/local_path/",
-                        "PKL_path":"/local_path/","TALYS_ff_file_path":"/local_path/"}]
+                        "PKL_path":"/local_path/","TALYS_ff_file_path":"/local_path/",
+                        "GEF_cache_path":"/local_path/","TALYS_cache_path":"/local_path/"}]
         """
         #-----------------------------------------------------------------------------------------------------------------------#
         GEF_program_path = os.path.join(pth_GEF_program,"")                                     # Path GEF executable. The empty string at the end adds a '/'
         TALYS_program_path = os.path.join(pth_TALYS_program,"")		                            # Path TALYS executable
-        if not os.path.isdir(os.path.join(os.path.dirname(pth_main),'Output_McPUFF')):          # If not exist, create folder for storing all program output.     
-            prog_out_dir_name = os.path.join(os.path.dirname(pth_main),'Output_McPUFF')         # Location of output folder can be chosen by user.    
-            os.mkdir(prog_out_dir_name)
-            Output_McPUFF_path = os.path.join(prog_out_dir_name,"")
-            del prog_out_dir_name
-        else:
-            Output_McPUFF_path = os.path.join(os.path.dirname(pth_main),'Output_McPUFF',"")    
-        if not os.path.isdir(os.path.join(Output_McPUFF_path,'GEF_working_directory')):			# If not exist, create GEF-working_directory and create path
-            dir_path = os.path.join(Output_McPUFF_path,'GEF_working_directory')			        # Creates GEF output folder within McPUFF output folder.
-            os.mkdir(dir_path)
-            GEF_working_dir_path = os.path.join(dir_path,"")
-            del dir_path
-        else:
-           GEF_working_dir_path = os.path.join(Output_McPUFF_path,'GEF_working_directory',"")   
-        if not os.path.isdir(os.path.join(Output_McPUFF_path,'TALYS_working_directory')):       # If not exist, create TALYS-working_directory and create path
-            dir_path = os.path.join(Output_McPUFF_path,'TALYS_working_directory')               # Creates TALYS output folder within McPUFF output folder.
-            os.mkdir(dir_path)
-            TALYS_working_dir_path = os.path.join(dir_path,"")
-            del dir_path
-        else:
-            TALYS_working_dir_path = os.path.join(Output_McPUFF_path,'TALYS_working_directory',"") 		
+        Output_McPUFF_path = os.path.join(os.path.dirname(pth_main),'Output_McPUFF',"")        # Location of output folder can be chosen by user.    
+        GEF_working_dir_path = os.path.join(Output_McPUFF_path,'GEF_working_directory',"")      # GEF output folder within McPUFF output folder.
+        if Reaction.GEF_working_dir_in_RAM == True and os.path.isdir('/dev/shm'):
+            GEF_working_dir_path = os.path.join('/dev/shm',f'McPUFF_GEF_working_directory_{os.getpid()}',"")  # GEF output folder in RAM. Process ID keeps simultaneous McPUFF runs apart.
+        TALYS_working_dir_path = os.path.join(Output_McPUFF_path,'TALYS_working_directory',"")  # TALYS output folder within McPUFF output folder.
         TALYS_input_path = os.path.join(TALYS_working_dir_path,'TALYS_folder_')                 # Create path to where to place TALYS input file.          
-        if not os.path.isdir(os.path.join(Output_McPUFF_path,'pickle_results')):                # If not exist, create pickle file folder and create path.
-            dir_path = os.path.join(Output_McPUFF_path,'pickle_results')                        # Creates pickle file folder within McPUFF output folder.
-            os.mkdir(dir_path)
-            PKL_path = os.path.join(dir_path,"")
-            del dir_path
-        else:
-            PKL_path = os.path.join(Output_McPUFF_path,'pickle_results')
-        PKL_path = os.path.join(Output_McPUFF_path,'pickle_results',"")
-        # This if-statement can be extended to include other elements. See 'Notes'.
-        if Z_target == 92:                                                                       
-            TALYS_ff_file_path = os.path.join(os.path.dirname(pth_TALYS_program),'structure','fission','ff','gef',f'U{str(A_compound)}',"")
-        if Z_target == 94:
-            TALYS_ff_file_path = os.path.join(os.path.dirname(pth_TALYS_program),'structure','fission','ff','gef',f'Pu{str(A_compound)}',"")
+        PKL_path = os.path.join(Output_McPUFF_path,'pickle_results',"")                         # Pickle file folder within McPUFF output folder.
+        GEF_cache_path = os.path.join(Output_McPUFF_path,'GEF_cache',"")                        # Folder for cached GEF results.
+        TALYS_cache_path = os.path.join(Output_McPUFF_path,'TALYS_cache',"")                    # Folder for cached TALYS results.
+        #--------------------------------- CREATE OUTPUT FOLDERS IF THEY DO NOT EXIST ------------------------------------------#
+        output_folders = [GEF_working_dir_path,TALYS_working_dir_path,PKL_path]
+        if Reaction.use_GEF_cache == True:
+            output_folders.append(GEF_cache_path)                                               # Cache folders only when the cache is used. See ``Reaction.use_GEF_cache``.
+        if Reaction.use_TALYS_cache == True:
+            output_folders.append(TALYS_cache_path)
+        for folder_path in output_folders:
+            os.makedirs(folder_path,exist_ok=True)                                              # Also creates the McPUFF output folder. No check before: one call per folder and no error if another process creates it at the same time.
+        del output_folders,folder_path
+        # Reaction.element_symbols can be extended to include other elements. See 'Notes'.
+        if Z_target not in Reaction.element_symbols:
+            print(f'No element symbol for Z = {Z_target} in Reaction.element_symbols. Needed for the path to the ".ff" files in the GEF library.')
+            sys.exit('Exiting program')
+        TALYS_ff_file_path = os.path.join(os.path.dirname(pth_TALYS_program),'structure','fission','ff','gef',f'{Reaction.element_symbols[Z_target]}{str(A_compound)}',"")
         #----------------------------------------- CREATE DICTIONARY TO RETURN ----------------------------------------------------#
         path_dict = {'GEF_program_path':GEF_program_path,'TALYS_program_path':TALYS_program_path,'Output_McPUFF_path':Output_McPUFF_path,
                      'GEF_working_dir_path':GEF_working_dir_path,'TALYS_working_dir_path':TALYS_working_dir_path,'TALYS_input_path':TALYS_input_path,
-                     'PKL_path':PKL_path,'TALYS_ff_file_path':TALYS_ff_file_path}
+                     'PKL_path':PKL_path,'TALYS_ff_file_path':TALYS_ff_file_path,'GEF_cache_path':GEF_cache_path,
+                     'TALYS_cache_path':TALYS_cache_path}
         return path_dict
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
@@ -486,9 +863,15 @@ class Reaction:
         simulation results separate when multi-threading and to 
         distinguish perturbed ".ff" files in the GEF library [1]_.
 
-        In case ``With_TALYS_flag`` = "False", the function returns 
+        In case ``With_TALYS_flag`` = "False", the function returns
         ``TALYS_data_dict`` as an empty dictionary.
 
+        This function performs one GEF and one TALYS simulation, one
+        after the other, since TALYS needs the GEF results. It runs in a
+        thread of the main process while the perturbed simulations,
+        each with its own ID and working directories, are run in
+        parallel by worker processes (see ``Reaction.__init__``).
+
         See Also
         --------
         ``Reaction.create_paths_and_directories()``
@@ -528,34 +911,53 @@ class Reaction:
         GEF_DMP_EN_path = GEF_data_paths['GEF_DMP_EN_path']                                                 # Local path to individual unperturbed GEF simulation "EN.dat" file.
         Reaction.clear_MyParameters_dat(GEF_cwd_path)                                                       # Clears MyParameters.dat of previous values.
         Reaction.eraseFolders(GEF_cwd_path)                                                                 # Make sure folders with old results are erased before start.
-        with subprocess.Popen(["GEF"],stdin=PIPE,stdout=DEVNULL,cwd=GEF_cwd_path) as GEF_process:   
-            GEF_process.communicate(input=b'\n')
-        FY_TALYS_format,unpert_ignored_events = Reaction.FY_results(GEF_LMD_path,A_compound,Z_target)
-        GEF_data_dict = Reaction.read_and_clear_GEF_results(GEF_cwd_path,GEF_DAT_path,GEF_DMP_EN_path)      # Reads and stores data from GEF .dat file
-        del GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_process
+        FY_TALYS_format,unpert_ignored_events,GEF_data_dict = Reaction.run_GEF_simulation(GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_DMP_EN_path,
+                                                                                            A_compound,Z_target,path_dict['GEF_cache_path'])    # Run GEF (or reuse cached results) and read results.
+        del GEF_cwd_path,GEF_LMD_path,GEF_DAT_path
         #------------------------------------------------ RUN TALYS SIMULATION ---------------------------------------------------#
         if With_TALYS_flag == True:            
-            Reaction.print_TALYS_ff_files(TALYS_ff_file_path,FY_TALYS_format,Z_target,A_compound,E_reaction,unique_unpert_thread_ID)
-            TALYS_unpert_input_command = 'talys' 
-            TALYS_unpert_input_file    = f'{unique_unpert_thread_ID}_input.in' 
-            TALYS_unpert_output_file   = f'{unique_unpert_thread_ID}_output.out' 
-            TALYS_unpert_cwd           = os.path.join(TALYS_input_path+f'{unique_unpert_thread_ID}',"")     # Empty string at end add a '/' to file name.
-            TALYS_Input.create_TALYS_input_file(TALYS_input_path,unique_unpert_thread_ID,TALYS_unpert_input_file,Z_target,A_compound,E_reaction)
-            try: 
-                subprocess.run(["bash","-c",str(f"{TALYS_unpert_input_command} < {TALYS_unpert_input_file} > {TALYS_unpert_output_file}")],stdout=DEVNULL,cwd=TALYS_unpert_cwd)
-            except FileNotFoundError as e:
-                print(f'TALYS could not run because it cannot find the input file.\n{e}\n')
-                sys.exit(e)
-            except subprocess.CalledProcessError as e:
-                print(f'An error occured while running TALYS\n{e}\n')
-                sys.exit()
-            TALYS_data_dict = Reaction.read_and_clear_TALYS_results(TALYS_unpert_cwd,TALYS_ff_file_path,unique_unpert_thread_ID) 
-            del TALYS_unpert_input_command,TALYS_unpert_input_file,TALYS_unpert_output_file,TALYS_unpert_cwd
+            TALYS_data_dict = Reaction.run_TALYS_simulation(TALYS_input_path,TALYS_ff_file_path,unique_unpert_thread_ID,FY_TALYS_format,
+                                                            Z_target,A_compound,E_reaction,path_dict['TALYS_cache_path'])    # Run TALYS (or reuse cached results) and read results.
         #----------------------------------------------- IMPORTANT INDENTATION -------------------------------------------------#
         unperturbed_result_dict = {'FY_TALYS_format':FY_TALYS_format,'GEF_data_dict':GEF_data_dict,'TALYS_data_dict':TALYS_data_dict,'unpert_ignored_events':unpert_ignored_events}
         return unperturbed_result_dict 
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
+    def remove_folder(folder_path):
+        """Delete a folder and everything in it, if it exists.
+
+        Parameters
+        ----------
+        folder_path : `str`
+            Local path to folder that is to be deleted.
+
+        Returns
+        -------
+        Function has no return value.
+
+        Notes
+        -----
+        ``shutil.rmtree`` is already implemented with ``os.scandir`` and 
+        ``os.unlink``/``os.rmdir`` relative to an open directory file 
+        descriptor on platforms that support it (Linux included, see 
+        ``shutil.rmtree.avoids_symlink_attacks``), so no path lookup is 
+        repeated per file. A missing folder is caught instead of checked 
+        for beforehand, saving one ``stat`` call per folder.
+
+        Examples
+        --------
+        Function deletes files and folders at specified location.
+
+        >>> Reaction.remove_folder("/local/path/GEF/output/")
+        []
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        try:
+            shutil.rmtree(folder_path)
+        except FileNotFoundError:
+            pass
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
     def delete_GEF_result_folder(GEF_results_folder_path):     
         """Delete GEF output data from simulation.
         
@@ -578,8 +980,7 @@ class Reaction:
         []
         """      
         #-----------------------------------------------------------------------------------------------------------------------#
-        if os.path.isdir(GEF_results_folder_path):
-            shutil.rmtree(GEF_results_folder_path)    
+        Reaction.remove_folder(GEF_results_folder_path)
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
             
     def delete_TALYS_ff_files(pth_TALYS_FY_folder,unique_thread_ID):
@@ -615,10 +1016,16 @@ class Reaction:
         []
         """
         #-----------------------------------------------------------------------------------------------------------------------#
-        for file_name in os.scandir(pth_TALYS_FY_folder):
-            if file_name.is_file() and file_name.name.endswith(str(unique_thread_ID).lower()+'.ff'):
-                os.remove(os.path.join(pth_TALYS_FY_folder,file_name.name))
-        del file_name
+        perturbed_ff_suffix = str(unique_thread_ID).lower()+'.ff'                                # Built once instead of once per file in folder.
+        folder_fd = os.open(pth_TALYS_FY_folder,os.O_RDONLY|os.O_DIRECTORY)
+        try:
+            with os.scandir(pth_TALYS_FY_folder) as folder_entries:
+                for file_name in folder_entries:
+                    if file_name.name.endswith(perturbed_ff_suffix) and file_name.is_file():
+                        os.unlink(file_name.name,dir_fd=folder_fd)                                  # Unlink relative to folder, no path string built or looked up.
+        finally:
+            os.close(folder_fd)
+        del perturbed_ff_suffix, folder_fd
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
         
     def delete_TALYS_result_files(path_TALYS_cwd):
@@ -643,8 +1050,7 @@ class Reaction:
         []
         """      
         #-----------------------------------------------------------------------------------------------------------------------#
-        if os.path.isdir(path_TALYS_cwd):
-            shutil.rmtree(path_TALYS_cwd)
+        Reaction.remove_folder(path_TALYS_cwd)
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
             
     def eraseFolders(GEF_cwd_path):
@@ -681,14 +1087,8 @@ class Reaction:
         []
         """
         #-----------------------------------------------------------------------------------------------------------------------#
-        if os.path.isdir(os.path.join(GEF_cwd_path,'ctl')):
-            shutil.rmtree(os.path.join(GEF_cwd_path,'ctl',""))
-        if os.path.isdir(os.path.join(GEF_cwd_path,'dmp')):
-            shutil.rmtree(os.path.join(GEF_cwd_path,'dmp',""))
-        if os.path.isdir(os.path.join(GEF_cwd_path,'out')):
-            shutil.rmtree(os.path.join(GEF_cwd_path,'out',""))
-        if os.path.isdir(os.path.join(GEF_cwd_path,'tmp')):
-            shutil.rmtree(os.path.join(GEF_cwd_path,'tmp',""))
+        for GEF_folder_name in ('ctl','dmp','out','tmp'):
+            Reaction.remove_folder(os.path.join(GEF_cwd_path,GEF_folder_name))
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
             
     def FY_results(LMD_path,A_compound,Z_target):
@@ -735,6 +1135,7 @@ class Reaction:
         See Also
         --------
         ``Reaction.GEF_FY_for_TALYS()``
+        ``Reaction.sum_lmd_plus_energies()``
         ``Reaction. runs_MC``
         GEF 2023-V1.1 "ReadMe" file:<https://www.khschmidts-nuclear-web.eu/GEF_code/GEF-2023-1-1/Standalone/Readme.txt>
 
@@ -747,9 +1148,21 @@ class Reaction:
         When the user chooses the GEF option "lmd+", the ".lmd" file 
         changes format and has to be handled differently. This is checked
         for by a "try-catch" clause. If the `numpy.loadtxt()` encounters
-        an uneven number of columns it is an ".lmd+" file and is 
+        an uneven number of columns it is an ".lmd+" file and is
         pre-processed by this function.
 
+        Since `numpy` 1.23, `numpy.loadtxt()` parses the text in C. It
+        reads the ".lmd" file, and the FY lines of an ".lmd+" file, about
+        as fast as a C based reader in another package would, so McPUFF
+        needs no dependency besides `numpy` for it. The failed attempt
+        on an ".lmd+" file stops at its second line.
+
+        The lines of an ".lmd+" file are sorted by their first character
+        in one Python loop. Finding each kind of line with the `re`
+        module instead (one ``re.findall()`` over the whole file per
+        kind) was measured to be about five times slower, since every
+        pattern has to scan the complete file.
+
         The return value "FY_TALYS_format" is an numpy array with a number 
         of lines equal to the number of GEF Monte Carlo simulations, e.g 
         1e6 (See the "See Also" section) specified by the user. 
@@ -798,86 +1211,58 @@ class Reaction:
         [numpy.ndarray (number of GEF MC simulations, 19), 42]
         """
         #--------------------------------------------- READ GEF OUTPUT DATA-----------------------------------------------------#
+        FY_columns_in_LMD = (2,4,3,5,22,18,19)                                                                          # Z1, A1sci, Z2, A2sci, TKEpre, Eexc1, Eexc2 in the order of FY columns 0-6.
         try: 
             if os.path.isfile(LMD_path) and os.path.getsize(LMD_path)!=0:                                               # Check if ".lmd" file exists and is not empty.
                 try:                                                                                                    # Check if the user chose GEF option "lmd" or "lmd+".
-                    lmdData = np.loadtxt(LMD_path,dtype=np.float32,comments='*',usecols=(2,3,4,5,18,19,22))
-                    FY = np.zeros((len(lmdData[:,0]),7),dtype=np.float32)                                               # Allocate array for simulation with "lmd" option (without neutron and gamma energies per fragment).
+                    FY = np.loadtxt(LMD_path,dtype=np.float32,comments='*',usecols=FY_columns_in_LMD,ndmin=2)            # Read straight into the FY array for simulation with "lmd" option (without neutron and gamma energies per fragment).
                 except Exception as e:                                                                                  # Pre-processes ".lmd+" file.
+                    #--------------------- SORT THE LINES IN ONE PASS: FY DATA AND THE EIGHT KINDS OF ENERGY LINES -------------------#
+                    FY_line_start = str(Z_target)                                                                                       # Lines with FY data start with the atomic number of the target.
+                    lmd_plus_data = []                                                                                                  # Lines with FY data (without energy data).
+                    energy_lines = {str(line_type): [] for line_type in range(1,9)}                                                     # Lines with energy data, by their first character '1'-'8' (which is removed).
                     with open(LMD_path,'r') as LMD_plus_file:
-                        All_lmd_plus_data = LMD_plus_file.readlines()     
+                        for line in LMD_plus_file:                                                                                      # Lines are read while sorted. The whole file is never held in memory as a list of unsorted lines.
+                            line = line.strip()                                                                                         # Every line is stripped once, instead of once per kind of line.
+                            if line.startswith(FY_line_start):
+                                lmd_plus_data.append(line)
+                            elif line[:1] in energy_lines:                                                                              # FY lines start with '9' (Z = 90-96), never with '1'-'8'. No need to test them twice.
+                                energy_lines[line[:1]].append(line[1:])
+                    del line
                     #------------------------------- FY DATA WITHOUT GAMMA RAY ENERGES -----------------------------------------#                
-                    lmd_plus_data = [line.strip() for line in All_lmd_plus_data if line.strip().startswith(str(Z_target))]              # Singles out lines with FY data (removes energy data).
-                    lmdData = np.loadtxt(lmd_plus_data ,dtype=np.float32,comments='*',usecols=(2,3,4,5,18,19,22))                       # FY data identical to when using GEF "lmd" option.
-                    FY = np.zeros((len(lmdData[:,0]),11),dtype=np.float32)                                                              # Allocate array for simulation with "lmd+" option (with neutron and gamma energies per fragment).
+                    lmdData = np.loadtxt(lmd_plus_data ,dtype=np.float32,comments='*',usecols=FY_columns_in_LMD,ndmin=2)                # FY data identical to when using GEF "lmd" option.
+                    del lmd_plus_data
+                    FY = np.empty((len(lmdData[:,0]),11),dtype=np.float32)                                                              # Allocate array for simulation with "lmd+" option (with neutron and gamma energies per fragment). Every column is written below, no zero fill needed.
+                    FY[:,:7] = lmdData                                                                                                  # Columns 0-6 hold the same data as with the "lmd" option. All seven columns in one copy.
+                    del lmdData
                     #---------------------------------- NEUTRON ENERGY LIGHT FRAGMENTS -----------------------------------------#
-                    E_n_light_frag       = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(1))]          # Lines with energy of emitted n in light fragment (and remove '1').
+                    E_n_light_frag       = energy_lines['1']                                                                            # Lines with energy of emitted n in light fragment (and remove '1').
                     #---------------------------------- NEUTRON ENERGY LIGHT FRAGMENTS -----------------------------------------#
-                    E_n_heavy_frag       = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(2))]          # Lines with energy of emitted n in heavy fragment (and remove '2').
+                    E_n_heavy_frag       = energy_lines['2']                                                                            # Lines with energy of emitted n in heavy fragment (and remove '2').
                     #------------------------------- GAMMMA RAY ENERGY LIGHT FRAGMENTS -----------------------------------------#
-                    E_competition_g_light_frag       = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(3))]    # Lines with energy of emitted g in competition with n light fragment (and remove '3').
-                    E_statistical_g_light_frag       = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(4))]    # Lines with energy of statistical g in light fragment after neutrons (and remove '4').
-                    E_prompt_collective_g_light_frag = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(5))]    # Lines with energy of prompt collective g light fragment, final state GS (and remove '5').
+                    E_competition_g_light_frag       = energy_lines['3']                                                                      # Lines with energy of emitted g in competition with n light fragment (and remove '3').
+                    E_statistical_g_light_frag       = energy_lines['4']                                                                      # Lines with energy of statistical g in light fragment after neutrons (and remove '4').
+                    E_prompt_collective_g_light_frag = energy_lines['5']                                                                      # Lines with energy of prompt collective g light fragment, final state GS (and remove '5').
                     #------------------------------- GAMMMA RAY ENERGY HEAVY FRAGMENTS -----------------------------------------#
-                    E_competition_g_heavy_frag       = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(6))]    # Lines with energy of emitted g in competition with n heavy fragment (and remove '6').
-                    E_statistical_g_heavy_frag       = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(7))]    # Lines with energy of statistical g in heavy fragment after neutrons (and remove '7').
-                    E_prompt_collective_g_heavy_frag = [line.strip()[1:] for line in All_lmd_plus_data if line.strip().startswith(str(8))]    # Lines with energy of prompt collective g heavy fragment, final state GS (and remove '8').
-                    #--------- SUM NEUTRON AND GAMMA RAY ENERGIES FOR DIFFERENT CONTRIBUTIONS AND COLLECT IN ARRAY -------------#
-                    # Columns: [0]=E(n)_light,[1]=E(n)_heavy,[2]=E(g)_comp_light,[3]=E(g)_stat_light,[4]=E(g)_coll_light,[5]=E(g)_comp_heavy,[6]=E(g)_stat_heavy,[7]=E(g)_coll_heavy
-                    E_values_n_g = np.zeros((len(lmdData[:,0]),8))                                                                                                             
-                    for i,line in enumerate(E_n_light_frag):                                                                            # ================== Store data for ========================#    
-                        location_n_in_string = [loc for loc in range(0,len(line.split()),4)]                                            # Picks out every fourth element in list (neutron energies)
-                        E_values_n_g[i,0] = np.sum([line.split()[n] for n in location_n_in_string],dtype=np.float32)                    # [0] = E(n) light fragment.
-                        del i,line,location_n_in_string
-                    for i,line in enumerate(E_n_heavy_frag):
-                        location_n_in_string = [loc for loc in range(0,len(line.split()),4)]                                            # Picks out every fourth element in list (neutron energies)
-                        E_values_n_g[i,1] = np.sum([line.split()[n] for n in location_n_in_string],dtype=np.float32)                    # [1] = E(n) heavy fragment.
-                        del i,line,location_n_in_string
-                    for i,line in enumerate(E_competition_g_light_frag):
-                        E_values_n_g[i,2] = np.sum([float(energy) for energy in line.split() if energy[0].isdigit()],dtype=np.float32)  # [2] = E(g) competition light fragment.
-                        del i,line
-                    for i,line in enumerate(E_statistical_g_light_frag):
-                        E_values_n_g[i,3] = np.sum([float(energy) for energy in line.split() if energy[0].isdigit()],dtype=np.float32)  # [3] = E(g) statistical light fragment.
-                        del i,line
-                    for i,line in enumerate(E_prompt_collective_g_light_frag):
-                        E_values_n_g[i,4] = np.sum([float(energy) for energy in line.split() if energy[0].isdigit()],dtype=np.float32)  # [4] = E(g) collective light fragment.
-                        del i,line
-                    for i,line in enumerate(E_competition_g_heavy_frag):
-                        E_values_n_g[i,5] = np.sum([float(energy) for energy in line.split() if energy[0].isdigit()],dtype=np.float32)  # [5] = E(g) competition heavy fragment.
-                        del i,line
-                    for i,line in enumerate(E_statistical_g_heavy_frag):
-                        E_values_n_g[i,6] = np.sum([float(energy) for energy in line.split() if energy[0].isdigit()],dtype=np.float32)  # [6] = E(g) statistical heavy fragment.
-                        del i,line
-                    for i,line in enumerate(E_prompt_collective_g_heavy_frag):
-                        E_values_n_g[i,7] = np.sum([float(energy) for energy in line.split() if energy[0].isdigit()],dtype=np.float32)  # [7] = E(g) collective heavy fragment.
-                        del i,line
-                   #----------------------------------- ADD NEUTRON AND GAMMA ENERGIES TO LMD DATA ARRAY -----------------------#          
-                    FY[:,7]  += E_values_n_g[:,0]                                                                                       # Add energy of neutrons from light fragment to FY array col 7.
-                    FY[:,8]  += E_values_n_g[:,1]                                                                                       # Add energy of neutrons from heavy fragment to FY array col 8.
-                    FY[:,9]  += E_values_n_g[:,2] + E_values_n_g[:,3] + E_values_n_g[:,4]                                               # Add energy of all gamma emissions from light fragments to FY array col 9.
-                    FY[:,10] += E_values_n_g[:,5] + E_values_n_g[:,6] + E_values_n_g[:,7]                                               # Add energy of all gamma emissions from light fragments to FY array col 10.
-                    del LMD_plus_file,All_lmd_plus_data,lmd_plus_data,E_n_light_frag,E_n_heavy_frag,E_competition_g_light_frag,E_statistical_g_light_frag,E_prompt_collective_g_light_frag,
-                    E_competition_g_heavy_frag,E_statistical_g_heavy_frag,E_prompt_collective_g_heavy_frag,E_values_n_g 
-                #-------------------------------- PICK OUT DATA FROM LMD DATA ARRAY --------------------------------------------#    
-                Z1     = lmdData[:,0]       # Col:  2  in LMD/LMD+ file.     
-                Z2     = lmdData[:,1]       # Col:  3  in LMD/LMD+ file.        
-                A1sci  = lmdData[:,2]       # Col:  4  in LMD/LMD+ file.        
-                A2sci  = lmdData[:,3]       # Col:  5  in LMD/LMD+ file. 
-                Eexc1  = lmdData[:,4]       # Col: 18  in LMD/LMD+ file. 
-                Eexc2  = lmdData[:,5]       # Col: 19  in LMD/LMD+ file. 
-                TKEpre = lmdData[:,6]       # Col: 22  in LMD/LMD+ file.  
-                #----------------------------------- POPULATE FY VECTOR WITH LMD DATA ------------------------------------------#
-                FY[slice(0,len(Z1)),0]     = Z1
-                FY[slice(0,len(A1sci)),1]  = A1sci 
-                FY[slice(0,len(Z2)),2]     = Z2
-                FY[slice(0,len(A2sci)),3]  = A2sci
-                FY[slice(0,len(TKEpre)),4] = TKEpre 
-                FY[slice(0,len(Eexc1)),5]  = Eexc1
-                FY[slice(0,len(Eexc2)),6]  = Eexc2
+                    E_competition_g_heavy_frag       = energy_lines['6']                                                                      # Lines with energy of emitted g in competition with n heavy fragment (and remove '6').
+                    E_statistical_g_heavy_frag       = energy_lines['7']                                                                      # Lines with energy of statistical g in heavy fragment after neutrons (and remove '7').
+                    E_prompt_collective_g_heavy_frag = energy_lines['8']                                                                      # Lines with energy of prompt collective g heavy fragment, final state GS (and remove '8').
+                    #--------- SUM NEUTRON AND GAMMA RAY ENERGIES FOR DIFFERENT CONTRIBUTIONS AND ADD TO LMD DATA ARRAY --------#
+                    # Each sum is written to its FY column directly. No scratch array with one column per contribution is allocated.
+                    number_of_lines = len(FY[:,0])
+                    FY[:,7]  = Reaction.sum_lmd_plus_energies(E_n_light_frag,number_of_lines,True)                                     # Add energy of neutrons from light fragment to FY array col 7.
+                    FY[:,8]  = Reaction.sum_lmd_plus_energies(E_n_heavy_frag,number_of_lines,True)                                     # Add energy of neutrons from heavy fragment to FY array col 8.
+                    FY[:,9]  = (Reaction.sum_lmd_plus_energies(E_competition_g_light_frag,number_of_lines,False)                       # Add energy of all gamma emissions from light fragments to FY array col 9.
+                                 + Reaction.sum_lmd_plus_energies(E_statistical_g_light_frag,number_of_lines,False)                     # (competition + statistical + collective)
+                                 + Reaction.sum_lmd_plus_energies(E_prompt_collective_g_light_frag,number_of_lines,False))
+                    FY[:,10] = (Reaction.sum_lmd_plus_energies(E_competition_g_heavy_frag,number_of_lines,False)                       # Add energy of all gamma emissions from heavy fragments to FY array col 10.
+                                 + Reaction.sum_lmd_plus_energies(E_statistical_g_heavy_frag,number_of_lines,False)                     # (competition + statistical + collective)
+                                 + Reaction.sum_lmd_plus_energies(E_prompt_collective_g_heavy_frag,number_of_lines,False))
+                    del LMD_plus_file,FY_line_start,energy_lines,E_n_light_frag,E_n_heavy_frag,E_competition_g_light_frag,E_statistical_g_light_frag,E_prompt_collective_g_light_frag,
+                    E_competition_g_heavy_frag,E_statistical_g_heavy_frag,E_prompt_collective_g_heavy_frag,number_of_lines 
                 #------------------------------------- CREATE FY IN ".FF" FILE FORMAT ------------------------------------------#
-                num_of_events = len(lmdData[:,0])                                                                                       # Number of GEF simulations. Needed for calculating yields. 
+                num_of_events = len(FY[:,0])                                                                                            # Number of GEF simulations. Needed for calculating yields. 
                 FY_TALYS_format, ignored_events = Reaction.GEF_FY_for_TALYS(FY,A_compound,num_of_events)
-                del lmdData,Z1,A1sci,Z2,A2sci,TKEpre,Eexc1,Eexc2
                 return FY_TALYS_format, ignored_events
             else:
                 raise UserWarning("UserWarning: loadtxt: Empty input file: "+LMD_path)
@@ -926,6 +1311,7 @@ class Reaction:
         See Also
         --------
         ``Reaction.FY_results()``
+        ``Reaction.mean_and_std_per_event()``
         `numpy.mean()`(url:
         <https://numpy.org/doc/stable/reference/generated/numpy.mean.html>)
 
@@ -946,8 +1332,11 @@ class Reaction:
 
         When calculating the mean value and standard deviations for the 
         FY_results, dtype = `numpy.float64`is used because `numpy.float32`
-        and lower can lead to erronous results. See the Python 
-        documentaion.
+        and lower can lead to erronous results. See the Python
+        documentaion. Only the sums are accumulated in `numpy.float64`
+        (see ``Reaction.mean_and_std_per_event()``). The ``FY`` array
+        with one row per GEF event stays `numpy.float32` and is never
+        copied to `numpy.float64` as a whole.
 
         The ``FY_TALYS`` array holding the ".lmd" data from GEF is 
         initialized to 300 rows. Since a numpy array is contiguous, it 
@@ -981,24 +1370,24 @@ class Reaction:
         #--------------- CREATE FY_TALYS VECTOR WITH NUMBER OF COLUMNS DEPENDING ON GEF OPTION LMD OR LMD+ ---------------------#
         rows, columns = np.shape(FY)
         if columns == 7:                                    
-            FY_TALYS = np.zeros((300,11),dtype=np.float32)                                                                          # columns = 7 for GEF lmd option. Add 4 for mean and std vectors.
+            FY_TALYS = np.zeros((300,11),dtype=Reaction.storage_dtype)                                                               # columns = 7 for GEF lmd option. Add 4 for mean and std vectors.
         else:
-            FY_TALYS = np.zeros((300,19),dtype=np.float32)                                                                          # columns = 11 for GEF lmd+ option. Add 8 for mean and std vectors.
+            FY_TALYS = np.zeros((300,19),dtype=Reaction.storage_dtype)                                                               # columns = 11 for GEF lmd+ option. Add 8 for mean and std vectors.
         del rows
         #------------------------------------- DELETE MULTI-CHANCE FISSION EVENTS ----------------------------------------------#
-        index_Multichance_fission = np.where(FY[:,1]+FY[:,3] != A_compound)                                                         # Check if mass number of light and heavy fragment matches compound nucleus mass number.
-        if index_Multichance_fission[0].size > 0: 
-            FY = np.delete(FY[:,:],index_Multichance_fission[0],axis=0)                                                             # Delete rows with multi-chance fission events.
-        del index_Multichance_fission 
+        first_chance_fission = FY[:,1]+FY[:,3] == A_compound                                                                        # Check if mass number of light and heavy fragment matches compound nucleus mass number.
+        if not first_chance_fission.all(): 
+            FY = FY[first_chance_fission]                                                                                           # Delete rows with multi-chance fission events.
+        del first_chance_fission 
         #------------------------------- SWAP PLACES OF ELEMENTS IF AL > AH BEFORE PERFORMING AVERAGES -------------------------#
-        index_Al_larger_than_Ah = np.where(FY[:,1] > FY[:,3])
-        if index_Al_larger_than_Ah[0].size > 0:
-            for row_number in index_Al_larger_than_Ah[0]:
-                FY[row_number,0],FY[row_number,2],FY[row_number,1],FY[row_number,3] = \
-                FY[row_number,2], FY[row_number,0],FY[row_number,3], FY[row_number,1]   
+        index_Al_larger_than_Ah = np.flatnonzero(FY[:,1] > FY[:,3])
+        if index_Al_larger_than_Ah.size > 0:
+            FY[index_Al_larger_than_Ah[:,np.newaxis],[0,1,2,3]] = FY[index_Al_larger_than_Ah[:,np.newaxis],[2,3,0,1]]               # All rows at once: Z1,A1 <-> Z2,A2. The right side is a copy.
         del index_Al_larger_than_Ah  
         #------------------------------------ REMOVE EVENTS THAT ONLY OCCUR ONCE -----------------------------------------------#
-        unique_yields ,index_unique, unique_counts = np.unique(FY[:,0:4], return_index=True, return_counts=True, axis=0) 
+        event_key = ((FY[:,0].astype(np.int64)*512 + FY[:,1].astype(np.int64))*512 + FY[:,2].astype(np.int64))*512 + FY[:,3].astype(np.int64)   # One integer per (Z1,A1,Z2,A2). Z and A are integers below 512, so the keys sort like the rows.
+        unique_yields ,index_unique, index_inverse, unique_counts = np.unique(event_key, return_index=True, return_inverse=True, return_counts=True) 
+        index_inverse = np.reshape(index_inverse,-1)                                                                                # Unique event number for every row in FY (flattened, shape differs between numpy versions).
         index_event_occur_more_than_once = np.nonzero(unique_counts > 1) 
         index_to_pick = index_unique[index_event_occur_more_than_once[0]]                                                           # Pick out index of unique events that occur more than once.
         #----------------------------------- POPULATE [0] = Z1, [1] = A2, [2] = Z2, [3] = A2 -----------------------------------#
@@ -1010,28 +1399,203 @@ class Reaction:
         ignored_events = np.count_nonzero(unique_counts == 1) 
         FY_TALYS[slice(len(index_to_pick)),4] = unique_counts[index_event_occur_more_than_once[0]]/(len(FY[:,0])-ignored_events)    # Divide by those events that are left to get the yield as a fraction.
         #---------------------- POPULATE [5] = TKE, [6] = TXE, [7] = Eexc1, [8] = Wl, [9] = Eexc2, [10] = Wh -------------------#
-        for k, row in enumerate(unique_yields[index_event_occur_more_than_once]):
-            ind = (row == FY[:,0:4]).all(axis=1).nonzero() 
-            FY_TALYS[k,5]  = np.mean(FY[ind[0],4], dtype=np.float64)                    # [5]  = TKE.
-            FY_TALYS[k,6]  = np.mean(FY[ind[0],5] + FY[ind[0],6], dtype=np.float64)     # [6]  = TXE.            
-            FY_TALYS[k,7]  = np.mean(FY[ind[0],5], dtype=np.float64)                    # [7]  = Eexc1 (E* light fragment).
-            FY_TALYS[k,8]  = np.std(FY[ind[0],5], dtype=np.float64, ddof=1)             # [8]  = Wl (std(E*), light fragment).
-            FY_TALYS[k,9]  = np.mean(FY[ind[0],6], dtype=np.float64)                    # [9]  = Eexc2 (E* heavy fragment).
-            FY_TALYS[k,10] = np.std(FY[ind[0],6], dtype=np.float64, ddof=1)             # [10] = Wh (std(E*), heavy fragment).
-            #-------------------------- POPULATE neutron and gamma energies and std --------------------------------------------#
-            if columns == 11:   # If simulation is with GEF "lmd+" option.
-                FY_TALYS[k,11]  = np.mean(FY[ind[0],7], dtype=np.float64)               # [11] = Mean neutron energies of light fragments.
-                FY_TALYS[k,12]  = np.std(FY[ind[0],7], dtype=np.float64, ddof=1)        # [12] = Std neutron energies of light fragments.
-                FY_TALYS[k,13]  = np.mean(FY[ind[0],8], dtype=np.float64)               # [13] = Mean neutron energies of heavy fragments.
-                FY_TALYS[k,14]  = np.std(FY[ind[0],8], dtype=np.float64, ddof=1)        # [14] = Std neutron energies of heavy fragments.
-                FY_TALYS[k,15]  = np.mean(FY[ind[0],9], dtype=np.float64)               # [15] = Mean gamma energies of light fragments.
-                FY_TALYS[k,16]  = np.std(FY[ind[0],9], dtype=np.float64, ddof=1)        # [16] = Std gamma energies of light fragments.
-                FY_TALYS[k,17]  = np.mean(FY[ind[0],10], dtype=np.float64)              # [17] = Mean gamma energies of heavy fragments.
-                FY_TALYS[k,18]  = np.std(FY[ind[0],10], dtype=np.float64, ddof=1)       # [18] = Std gamma energies of heavy fragments.
-        del unique_yields,index_unique,unique_counts,index_event_occur_more_than_once,index_to_pick,num_of_events,k,row,ind,columns
+        n = len(index_to_pick)                                                                                                      # All unique events are reduced at once, one column at a time.
+        FY_TALYS[:n,5], _            = Reaction.mean_and_std_per_event(FY[:,4],index_inverse,unique_counts,index_event_occur_more_than_once[0])           # [5]  = TKE.
+        FY_TALYS[:n,6], _            = Reaction.mean_and_std_per_event(FY[:,5]+FY[:,6],index_inverse,unique_counts,index_event_occur_more_than_once[0]) # [6]  = TXE.
+        FY_TALYS[:n,7], FY_TALYS[:n,8]  = Reaction.mean_and_std_per_event(FY[:,5],index_inverse,unique_counts,index_event_occur_more_than_once[0])     # [7]  = Eexc1, [8]  = Wl (std(E*), light fragment).
+        FY_TALYS[:n,9], FY_TALYS[:n,10] = Reaction.mean_and_std_per_event(FY[:,6],index_inverse,unique_counts,index_event_occur_more_than_once[0])     # [9]  = Eexc2, [10] = Wh (std(E*), heavy fragment).
+        #------------------------------ POPULATE neutron and gamma energies and std ------------------------------------------#
+        if columns == 11:   # If simulation is with GEF "lmd+" option.
+            FY_TALYS[:n,11], FY_TALYS[:n,12] = Reaction.mean_and_std_per_event(FY[:,7],index_inverse,unique_counts,index_event_occur_more_than_once[0])  # [11],[12] = Mean and std neutron energies of light fragments.
+            FY_TALYS[:n,13], FY_TALYS[:n,14] = Reaction.mean_and_std_per_event(FY[:,8],index_inverse,unique_counts,index_event_occur_more_than_once[0])  # [13],[14] = Mean and std neutron energies of heavy fragments.
+            FY_TALYS[:n,15], FY_TALYS[:n,16] = Reaction.mean_and_std_per_event(FY[:,9],index_inverse,unique_counts,index_event_occur_more_than_once[0])  # [15],[16] = Mean and std gamma energies of light fragments.
+            FY_TALYS[:n,17], FY_TALYS[:n,18] = Reaction.mean_and_std_per_event(FY[:,10],index_inverse,unique_counts,index_event_occur_more_than_once[0]) # [17],[18] = Mean and std gamma energies of heavy fragments.
+        del event_key,unique_yields,index_unique,index_inverse,unique_counts,index_event_occur_more_than_once,index_to_pick,num_of_events,n,columns
         return FY_TALYS, ignored_events
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
+    def program_file_identity(program_name):
+        """Identify the executable file of a program on the path.
+        
+        Parameters
+        ----------
+        program_name : `str`
+            Name of the program, e.g. "GEF" or "talys".
+
+        Returns
+        -------
+        program_identity : `str`
+            Path, size and modification time (ns) of the executable, or 
+            only the program name if it is not found on the path.
+
+        See Also
+        --------
+        ``Reaction.GEF_input_hash()``
+        `shutil.which()`
+
+        Notes
+        -----
+        Part of the hashes of the GEF and TALYS caches. McPUFF runs 
+        modified versions of GEF and TALYS. When one of them is rebuilt 
+        or replaced, its executable changes and cached results of the 
+        earlier version are no longer used.
+
+        Examples
+        --------
+        >>> Reaction.program_file_identity("GEF")
+        ["/local/path/modified/GEF/GEF 1934520 1704374400000000000"]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        program_path = shutil.which(program_name)                                                                               # Same lookup on the path as when the program is started.
+        if program_path is None:
+            return program_name
+        program_stat = os.stat(program_path)
+        program_identity = f'{program_path} {program_stat.st_size} {program_stat.st_mtime_ns}'
+        del program_path,program_stat
+        return program_identity
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def load_cache_file(cache_file_path):
+        """Load cached GEF or TALYS results.
+        
+        Parameters
+        ----------
+        cache_file_path : `str`
+            Local path to a file in the GEF or TALYS cache folder.
+
+        Returns
+        -------
+        cached_results : `tuple` or `dict`
+            Results as stored by ``Reaction.run_GEF_simulation()`` or 
+            ``Reaction.run_TALYS_simulation()``.
+
+        See Also
+        --------
+        ``McPUFF_Unpickler``
+
+        Notes
+        -----
+        The cache files are `pickle` files and are loaded with 
+        ``McPUFF_Unpickler``, the same way as the `pickle` file with the
+        McPUFF results. A manipulated file in the cache folder can then
+        not run code when it is loaded.
+
+        Examples
+        --------
+        >>> Reaction.load_cache_file("Output_McPUFF/TALYS_cache/6f1ed002ab5595859014ebf0951522d9.pkl")
+        [dict]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        with open(cache_file_path,'rb') as cache_file:
+            cached_results = McPUFF_Unpickler(cache_file).load()
+        del cache_file
+        return cached_results
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def GEF_input_hash(GEF_cwd_path):
+        """Create a hash of all GEF input files of a simulation.
+        
+        Parameters
+        ----------
+        GEF_cwd_path : `str`
+            Local path to individual GEF simulation folder.
+
+        Returns
+        -------
+        GEF_hash : `str`
+            Hexadecimal `hashlib.blake2b` digest of the GEF input.
+
+        See Also
+        --------
+        ``Reaction.run_GEF_simulation()``
+        ``package_McPUFF.GEF_input``
+
+        Notes
+        -----
+        The hash is computed from the contents of "file.in", of the input
+        file in the "in" folder and of "MyParameters.dat". Together they
+        hold the reaction, the number of Monte Carlo simulations, the GEF
+        options and the perturbed parameter values. The path, size and 
+        modification time of the GEF executable are included as well,
+        see ``Reaction.program_file_identity()``. The folder name of the
+        simulation is not included, so two simulations with identical 
+        input get the same hash.
+
+        Examples
+        --------
+        >>> Reaction.GEF_input_hash("/local/path/GEF/output/GEF_TMC_5/")
+        ["6f1ed002ab5595859014ebf0951522d9"]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        GEF_hash = hashlib.blake2b(Reaction.program_file_identity('GEF').encode(),digest_size=16)                               # A rebuilt GEF gets new hashes.
+        GEF_in_folder = os.path.join(GEF_cwd_path,'in')
+        GEF_input_files = [os.path.join(GEF_cwd_path,'file.in'),os.path.join(GEF_cwd_path,'MyParameters.dat')] + \
+                          sorted(entry.path for entry in os.scandir(GEF_in_folder) if entry.is_file())
+        for file_path in GEF_input_files:
+            GEF_hash.update(os.path.basename(file_path).encode())                                                                  # File name is part of the input (e.g. target element).
+            with open(file_path,'rb') as GEF_input_file:
+                GEF_hash.update(GEF_input_file.read())
+        del GEF_in_folder,GEF_input_files,file_path,GEF_input_file
+        return GEF_hash.hexdigest()
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def mean_and_std_per_event(values,index_inverse,unique_counts,index_to_keep):
+        """Mean value and standard deviation of a GEF quantity for every 
+        unique fission event, computed for all events at once.
+        
+        Parameters
+        ----------
+        values : `numpy.ndarray` (number of GEF MC simulations,)
+            One column of the "raw" GEF fission fragment yield data, e.g.
+            TKE or E* of the light fragment.
+        index_inverse : `numpy.ndarray` (number of GEF MC simulations,)
+            Unique fission event that each row in ``values`` belongs to, 
+            as returned by `numpy.unique()` with `return_inverse=True`.
+        unique_counts : `numpy.ndarray` (number of unique fission events,)
+            Number of times each unique fission event occured.
+        index_to_keep : `numpy.ndarray`
+            Index of the unique fission events to return results for.
+            
+        Returns
+        -------
+        mean : `numpy.ndarray` (len(index_to_keep),)
+            dtype = (`numpy.float64`). Mean value per fission event.
+        std : `numpy.ndarray` (len(index_to_keep),)
+            dtype = (`numpy.float64`). Standard deviation (ddof=1) per 
+            fission event.
+
+        See Also
+        --------
+        ``Reaction.GEF_FY_for_TALYS()``
+        `numpy.bincount()`(url:
+        <https://numpy.org/doc/stable/reference/generated/numpy.bincount.html>)
+
+        Notes
+        -----
+        Replaces a Python loop that built a boolean mask over all GEF 
+        fission events for each unique fission event. Here the sums for
+        all fission events are accumulated in a single pass with 
+        `numpy.bincount()`, which always accumulates in `numpy.float64`. 
+        The standard deviation is computed in two passes (sum of squared 
+        deviations from the mean) to give the same result as 
+        `numpy.std(..., ddof=1)`.
+
+        Examples
+        --------
+        >>> mean, std = Reaction.mean_and_std_per_event(FY[:,5],index_inverse,
+                                                            unique_counts,index_to_keep)
+        [numpy.ndarray (200,), numpy.ndarray (200,)]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        mean_all = np.bincount(index_inverse,weights=values,minlength=len(unique_counts))/unique_counts                        # Mean value of every unique fission event.
+        deviation = values - mean_all[index_inverse]                                                                            # Deviation of every GEF event from the mean of its fission event.
+        sum_of_squares = np.bincount(index_inverse,weights=deviation*deviation,minlength=len(unique_counts))
+        mean = mean_all[index_to_keep]
+        std = np.sqrt(sum_of_squares[index_to_keep]/(unique_counts[index_to_keep]-1))                                          # ddof=1. Events that only occur once are not kept.
+        del mean_all,deviation,sum_of_squares
+        return mean, std
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
     def create_GEF_workingdir_and_inputfile(unique_param_ID,Z_target,A_compound,E_reaction,MC_runs,GEF_working_dir_path):
         """Create individual GEF output folder and individual input file.
         
@@ -1119,13 +1683,14 @@ class Reaction:
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
     def perturbed_calculations_single_parameter(key,dict_unpert_param_name_val,Z_target,A_compound,E_reaction,runs_MC,num_of_rand,
-                                                                        num_of_workers,With_TALYS_flag,distribution_flag,path_dict):  
+                                                                        perturbed_single_executor,With_TALYS_flag,distribution_flag,path_dict,random_generator):  
         """Multi-thread simulations using "concurrent.futures" for the 
         "Single_Parameters" mode.
         
-        This function creates separate threads for parallel simulations.
-        It calls the "Modified_Parameter.create_perturbed_FY()" function
-        which performs the individual simulations.
+        This function submits the simulations of a parameter to the 
+        worker processes shared by all parameters. It calls the 
+        "Modified_Parameter.create_perturbed_FY()" function which performs
+        the individual simulations.
 
         Parameters
         ----------
@@ -1144,8 +1709,9 @@ class Reaction:
         num_of_rand : `int`
             The number of random numbers to produce, which is the same as
             the number of perturbed simulations to be performed.
-        num_of_workers : `int`
-            The number of CPU's to use for multi-threading.
+        perturbed_single_executor : `concurrent.futures.ProcessPoolExecutor`
+            Process pool shared by all parameters, created in 
+            ``Reaction.__init__``.
 
             See the "See Also" section.
         With_TALYS_flag : `boolean`
@@ -1155,6 +1721,9 @@ class Reaction:
             "normal" or "max-min" distributions.
         path_dict : `dict` [`str`,`str`,`str`,`str`,`str`,`str`,`str`]
             Dictionary with local paths needed for simulations.
+        random_generator : `numpy.random.Generator`
+            Generator of the parameter, spawned from the seeded generator
+            in ``Reaction.__init__``. See ``Reaction.random_seed``.
 
         Returns
         -------
@@ -1186,18 +1755,22 @@ class Reaction:
         ``Modified_Parameter.create_perturbed_FY()`` function. That 
         function creates a ``Random_Parameter_value`` object for each
         randomly perturbation which, when completed, is stored in the 
-        ``Modified_Parameter`` object. Due to the `"ALL_COMPLETED"` 
-        argument, the `concurrent.futures.ThreadPoolExecutor` then waits
-        until all random perturbations for a parameter are completed. This
-        procedure is necessary to ensure that a ``Random_Parameter_value``
-        object is not stored in the wrong ``Modified_Parameter`` object 
-        when multiple threads are running asynchronously.   
+        ``Modified_Parameter`` object. The results are stored as they 
+        complete (`"FIRST_COMPLETED"`), and the function returns when all
+        random perturbations for a parameter are completed. All calls 
+        submit to one `concurrent.futures.ProcessPoolExecutor`, so the 
+        number of worker processes does not grow with the number of 
+        parameter threads. Each call only waits for its own futures. This
+        procedure is necessary to ensure that a ``Random_Parameter_value`` object is
+        not stored in the wrong ``Modified_Parameter`` object when 
+        multiple threads are running asynchronously.   
 
         Examples
         --------
         >>> obj = Reaction.perturbed_calculations_single_parameter("_Delta_S0",
-                dict_unpert_param_name_val,92,236,2.53e-8,1e6,500,40,
-                False,"normal",path_dict):
+                dict_unpert_param_name_val,92,236,2.53e-8,1e6,500,
+                perturbed_single_executor,False,"normal",path_dict,
+                np.random.default_rng(1)):
         [obj (Modified_Parameter object)]  
         """ 
         #-----------------------------------------------------------------------------------------------------------------------#    
@@ -1205,26 +1778,127 @@ class Reaction:
         """Name of GEF parameter to perturb."""
         unpert_param_value = dict_unpert_param_name_val[key]
         """Default GEF parameter value."""
-        mod_param_object = Modified_Parameter(param_name,unpert_param_value,num_of_rand,distribution_flag)
+        mod_param_object = Modified_Parameter(param_name,unpert_param_value,num_of_rand,distribution_flag,random_generator)
         """Perturbed parameter object"""  
-        simultaneous_threads_per_param = math.floor((os.cpu_count()-num_of_workers)/2)  
-        """Determines number of cpu's that are used for each parameter. """
+        if distribution_flag == 'uniform':
+            special_case_standard_rand_nums = random_generator.random(len(mod_param_object.list_of_rand_num))           # Uniform in [0,1[. Only used if the parameter is a special case parameter.
+        elif distribution_flag == 'normal':
+            special_case_standard_rand_nums = random_generator.standard_normal(len(mod_param_object.list_of_rand_num))  # Standard normal. Only used if the parameter is a special case parameter.
+        else:
+            special_case_standard_rand_nums = [None]*len(mod_param_object.list_of_rand_num)                             # "max-min" distribution uses no random numbers.
+        """Standard random numbers for special case parameters, one per 
+        simulation. See ``Modified_Parameter.create_perturbed_parameter_value()``."""
         #----------------------------------------START MULTI-THREAD SIMULATIONS-------------------------------------------------# 
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=simultaneous_threads_per_param) as perturbed_single_executor:  
-                future_rand_param_val = {perturbed_single_executor.submit(Modified_Parameter.create_perturbed_FY,param_name,
-                                            unpert_param_value,rand_num,n,Z_target,A_compound,E_reaction,
-                                                runs_MC,With_TALYS_flag,distribution_flag,path_dict): rand_num for n, rand_num in enumerate(mod_param_object.list_of_rand_num)}
-            future_done,future_not_done = concurrent.futures.wait(future_rand_param_val,return_when="ALL_COMPLETED")
-            for rand_param_obj in future_done:
-                mod_param_object.list_of_Random_Parameter_Value_objects.append(rand_param_obj.result())
-            del param_name,unpert_param_value,future_rand_param_val,future_done,future_not_done,perturbed_single_executor
+            future_rand_param_val = {perturbed_single_executor.submit(Modified_Parameter.create_perturbed_FY,param_name,                  # Processes: parsing of GEF output in ``Reaction.FY_results()`` is not limited by the GIL.
+                                        unpert_param_value,rand_num,n,Z_target,A_compound,E_reaction,
+                                            runs_MC,With_TALYS_flag,distribution_flag,path_dict,special_case_standard_rand_nums[n]) for n, rand_num in enumerate(mod_param_object.list_of_rand_num)}
+            while future_rand_param_val:                                                                                        # Store results as they complete. Finished futures are dropped from the pending set.
+                future_done,future_rand_param_val = concurrent.futures.wait(future_rand_param_val,return_when=concurrent.futures.FIRST_COMPLETED)
+                for rand_param_obj in future_done:
+                    mod_param_object.list_of_Random_Parameter_Value_objects.append(rand_param_obj.result())
+            del param_name,unpert_param_value,special_case_standard_rand_nums,future_rand_param_val,future_done,perturbed_single_executor
             return mod_param_object
         except Exception as e:
             print('Encountered a problem in perturbed_calculations_single_parameter()\n')
             print(e)
             sys.exit(e)
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def pin_TMC_worker_process(CPU_queue):
+        """Pin a worker process of the ``TMC`` mode to one CPU and limit
+        the threads of the programs it starts.
+        
+        Parameters
+        ----------
+        CPU_queue : `multiprocessing.Queue`
+            Queue with one CPU number per worker process. `None` means the
+            worker is not pinned.
+
+        Returns
+        -------
+        Function has no return value.
+
+        See Also
+        --------
+        ``Reaction.__init__``
+        `os.sched_setaffinity()`(url:
+        <https://docs.python.org/3/library/os.html#os.sched_setaffinity>)
+
+        Notes
+        -----
+        The function is the ``initializer`` of the process pool in the 
+        ``TMC`` mode and runs once in every worker process when it starts.
+        Each worker takes the next CPU from the queue, so the workers are
+        spread over different CPU's. GEF and TALYS are started by the 
+        worker and inherit its CPU affinity and environment. This keeps 
+        every simulation on one CPU (and its cache) instead of being moved
+        between CPU's, and between sockets on cluster nodes, by the OS.
+        
+        "OMP_NUM_THREADS" and "MKL_NUM_THREADS" are set to one, since the
+        parallelization is already done over the random numbers. 
+
+        Examples
+        --------
+        Called by ``concurrent.futures.ProcessPoolExecutor``.
+        >>> Reaction.pin_TMC_worker_process(CPU_queue)
+        []
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        os.environ['OMP_NUM_THREADS'] = '1'                                                                                     # Inherited by GEF and TALYS.
+        os.environ['MKL_NUM_THREADS'] = '1'
+        try:
+            worker_CPU = CPU_queue.get(timeout=1)
+        except queue.Empty:                                                                                                     # More workers started than CPU's handed out. Run unpinned.
+            return
+        if worker_CPU is not None:
+            os.sched_setaffinity(0,{worker_CPU})
+        del worker_CPU
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def worker_process_context():
+        """Return the `multiprocessing` context used to start the worker 
+        processes of the ``Single_Parameters`` and ``TMC`` modes.
+
+        Returns
+        -------
+        worker_context : `multiprocessing.context.BaseContext`
+            Fork server context where available, otherwise the default 
+            context of the platform.
+
+        See Also
+        --------
+        ``Reaction.__init__``
+        ``Reaction.perturbed_calculations_single_parameter()``
+
+        Notes
+        -----
+        Worker processes are forked from a fork server that has imported 
+        `numpy` and McPUFF once, instead of importing them once per 
+        worker. The fork server is started without the running threads of
+        the main process (e.g. the unperturbed simulation), so it is safe 
+        to fork from. The fork server is not available on Windows.
+
+        The fork server is a new Python process, not a copy of the main
+        process. The workers therefore never hold the ``Modified_Parameter``
+        and ``TMC_Object`` results collected in the main process so far,
+        however many simulations have finished. A worker receives only
+        the name of the function it runs (e.g.
+        ``Modified_Parameter.create_perturbed_TMC_FY``) and its arguments,
+        and returns the object of one simulation.
+
+        Examples
+        --------
+        >>> TMC_context = Reaction.worker_process_context()
+        [multiprocessing.context.ForkServerContext]
+        """
+        if 'forkserver' in multiprocessing.get_all_start_methods():                                                             # Not available on Windows.
+            worker_context = multiprocessing.get_context('forkserver')
+            worker_context.set_forkserver_preload(['numpy','package_McPUFF.McPUFF_program'])                                    # Imported once in the fork server, not once per worker.
+        else:
+            worker_context = multiprocessing.get_context()
+        return worker_context
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
             
     def print_TALYS_ff_files(pth_TALYS_folder,FY_TALYS_format,Z_target,A_compound,E_reaction,unique_thread_ID):
         """Create a perturbed fission fragment yield file (".ff") and
@@ -1278,7 +1952,9 @@ class Reaction:
         the values for E_kinetic in the file-name. They don't actually 
         have different energies. The user can choose these values to suit
         specfic simulations by entering them in the list variable 
-        ``energy_val``. 
+        ``energy_val``. Since the files are identical, the content is 
+        written to disk once and the other file is a hard link to it. 
+        Deleting one of the files does not affect the other.
         
         References
         ----------
@@ -1309,31 +1985,36 @@ class Reaction:
         else: 
             energy_val = ['6','7']
         
-        elements = {'92':'U','94':'Pu'}                                                                                                             # This dictionary can be extended to incorporate more elements.
-        """Dictionary of atomic number and chemical symbol of elements
-        used in simulations."""
         structure = 'Zl  Al   Zh  Ah   Yield       TKE[MeV]    TXE[MeV]'\
                     '    El[MeV]     Wl[MeV]     Eh[MeV]     Wh[MeV]' 
         """Required string format of ".ff" files in GEF library.""" 
         #============================ CODE FOR CREATING CUSTOM E-FILE IN THE GEF ".ff" FILE LIBRARY. ===========================#
-        #path_E_file = os.path.join(pth_TALYS_folder,f'{elements[str(Z_target)]}{str(A_compound)}_gef.E')
+        #path_E_file = os.path.join(pth_TALYS_folder,f'{Reaction.element_symbols[int(Z_target)]}{str(A_compound)}_gef.E')
         #if str(A_compound) == '239':
         #    with open(path_E_file,'w') as E_file:
         #        E_file.write('5.00e+00\n6.00e+00')
         #else:
         #    with open(path_E_file,'w') as E_file:
         #        E_file.write('6.00e+00\n7.00e+00')
+        #------------------------------------ FORMAT ".FF" FILE CONTENT ONCE FOR ALL FILES -------------------------------------#
+        ff_file_content = '# Z        =   {:>3}\n'.format(Z_target) + '# A        =   {:>3}\n'.format(A_compound) +\
+                          '# Ex (MeV) =   {:>3.2e}\n'.format(float(E_reaction)) +\
+                          '# Ntotal   =   {:>3}\n'.format(number_of_FY) + f'# {structure}\n' +\
+                          ''.join([f'{row[0]:>4.0f} {row[1]:>3.0f} {row[2]:>4.0f} {row[3]:>4.0f}  {row[4]:.4e}  {row[5]:.4e}  {row[6]:.4e}  {row[7]:.4e}  {row[8]:.4e}  {row[9]:.4e}  {row[10]:.4e}\n'
+                                   for row in FY_TALYS_format[FY_TALYS_format[:,0] != 0].tolist()])                                                 # Rows with data only. Python floats format faster than numpy scalars.
+        """Content of ".ff" file. Identical for all energy values, only the file name differs."""
         #------------------------------------ CREATE ".FF" FILE WITH FISSION FRAGMENT YIELDS------------------------------------#    
-        for i in range(len(energy_val)):                                                                                                            # Create ".ff" files according to E_kinetic values in `energy_val` list.
-            ff_file_name = f'{elements[str(Z_target)]}{str(A_compound)}_{str(energy_val[i])}.00e+00MeV_gef_{str(unique_thread_ID).lower()}.ff'                                 
-            with open(os.path.join(pth_TALYS_folder,ff_file_name), 'w') as TALYS_format:
-                TALYS_format.write('# Z        =   {:>3}\n'.format(Z_target) + '# A        =   {:>3}\n'.format(A_compound) +\
-                '# Ex (MeV) =   {:>3.2e}\n'.format(float(E_reaction)) +\
-                '# Ntotal   =   {:>3}\n'.format(number_of_FY) + f'# {structure}\n')
-                for row in FY_TALYS_format[:,:]:
-                    if row[0] !=0:
-                        TALYS_format.write(f'{row[0]:>4.0f} {row[1]:>3.0f} {row[2]:>4.0f} {row[3]:>4.0f}  {row[4]:.4e}  {row[5]:.4e}  {row[6]:.4e}  {row[7]:.4e}  {row[8]:.4e}  {row[9]:.4e}  {row[10]:.4e}\n')           
-        del number_of_FY,unique_thread_ID,energy_val,elements,structure,TALYS_format,ff_file_name,row,Z_target,A_compound,E_reaction
+        ff_file_paths = [os.path.join(pth_TALYS_folder,f'{Reaction.element_symbols[int(Z_target)]}{str(A_compound)}_{str(energy)}.00e+00MeV_gef_{str(unique_thread_ID).lower()}.ff')
+                         for energy in energy_val]                                                                                                  # One ".ff" file according to each E_kinetic value in `energy_val` list.
+        with open(ff_file_paths[0], 'w') as TALYS_format:
+            TALYS_format.write(ff_file_content)                                                                                                     # Content written to disk once.
+        for ff_file_path in ff_file_paths[1:]:
+            try:
+                os.link(ff_file_paths[0],ff_file_path)                                                                                              # Other energies: hard link to the same content. No extra data written.
+            except OSError:                                                                                                                         # File system without hard links. Write a copy.
+                with open(ff_file_path, 'w') as TALYS_format:
+                    TALYS_format.write(ff_file_content)
+        del number_of_FY,unique_thread_ID,energy_val,structure,TALYS_format,ff_file_paths,ff_file_content,Z_target,A_compound,E_reaction
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
         
     def read_and_clear_GEF_results(path_GEF_results,path_GEF_DAT,GEF_DMP_EN_path): 
@@ -1386,7 +2067,10 @@ class Reaction:
 
         The list variable ``headlines_wanted_data`` holds rows of text
         from the GEF output files used to find line index using the 
-        Python `str.index()` function. For a single value, one line index
+        Python `list.index()` function. For the ".dat" file, the line 
+        index of all headlines is found in one pass over the file and 
+        stored in the dictionary ``headline_index``, which is used in 
+        place of `index()`. For a single value, one line index
         is enough. For multiple values, using a start index and a stop 
         index is the most suitable way. The commented section below 
         provides examples. The user can add/remove data to be saved from
@@ -1486,53 +2170,53 @@ class Reaction:
                 #-------------------------------------- READ ".dat"-FILE AND CREATE INDEXES  -----------------------------------#
                 with open(path_GEF_DAT,'r') as GEF_dat_file:
                     dat_data = GEF_dat_file.readlines()
-                index_gamma_multi_func_of_A = [dat_data.index(headlines_wanted_data[0])+4, dat_data.index(headlines_wanted_data[1])-4] 
                 #----------------------------------  CHECK FOR AND REMOVE ERRONOUS DATA IN FILE  -------------------------------#       
-                #-------------- CREATE INDEXES FOR PROMPT GAMMA MULTIPLICITY AS A FUNCTION OF A (PRE-NEUTRON)-------------------#
-                for line in dat_data[index_gamma_multi_func_of_A[0]:index_gamma_multi_func_of_A[1]]:                    
-                    if '%' in line:                                                                     # Check if there are non-numerical entries.
-                        del dat_data[dat_data.index(line)]                                              # If so, remove line and update indexes.
-                        index_gamma_multi_func_of_A = [dat_data.index(headlines_wanted_data[0])+4, dat_data.index(headlines_wanted_data[1])-4] 
-                #-------------- CREATE INDEXES FOR PROMPT NEUTRON MULTIPLICITY AS A FUNCTION OF A (PRE-NEUTRON) ----------------#
-                index_prompt_neutron_multi_func_of_A_pre = [dat_data.index(headlines_wanted_data[4])+2, dat_data.index(headlines_wanted_data[5])-1] 
-                for line in dat_data[index_prompt_neutron_multi_func_of_A_pre[0]:index_prompt_neutron_multi_func_of_A_pre[1]]:    
-                    if '%' in line:                                                                     # Check if there are non-numerical entries.
-                        del dat_data[dat_data.index(line)]                                              # If so, remove line and update indexes.
-                        index_prompt_neutron_multi_func_of_A_pre = [dat_data.index(headlines_wanted_data[4])+2, dat_data.index(headlines_wanted_data[5])-1]
+                #----------- PROMPT GAMMA MULTIPLICITY AND PROMPT NEUTRON MULTIPLICITY AS A FUNCTION OF A (PRE-NEUTRON) --------#
+                for start_headline,start_offset,stop_headline,stop_offset in [(0,4,1,-4),(4,2,5,-1)]:
+                    table_start = dat_data.index(headlines_wanted_data[start_headline])+start_offset
+                    table_stop  = dat_data.index(headlines_wanted_data[stop_headline])+stop_offset
+                    dat_data[table_start:table_stop] = [line for line in dat_data[table_start:table_stop] if '%' not in line]  # Remove lines with non-numerical entries.
+                del start_headline,start_offset,stop_headline,stop_offset,table_start,table_stop
+                #------------------------------- FIND LINE INDEX OF ALL HEADLINES IN ONE PASS ----------------------------------#
+                headline_index = {}
+                """Line index of the first occurrence of each headline in ``dat_data``."""
+                dat_headlines = set(headlines_wanted_data[0:15])
+                for line_number,line in enumerate(dat_data):
+                    if line in dat_headlines and line not in headline_index:
+                        headline_index[line] = line_number
+                index_gamma_multi_func_of_A = [headline_index[headlines_wanted_data[0]]+4, headline_index[headlines_wanted_data[1]]-4] 
+                index_prompt_neutron_multi_func_of_A_pre = [headline_index[headlines_wanted_data[4]]+2, headline_index[headlines_wanted_data[5]]-1] 
                 #-------------- CREATE INDEXES FOR PROMPT NEUTRON MULTIPLICITY AS A FUNCTION OF A (POST-NEUTRON) ---------------#
-                #index_prompt_neutron_multi_func_of_A_post = [dat_data.index(headlines_wanted_data[5])+2, dat_data.index(headlines_wanted_data[6])-4]
-                #for line in dat_data[index_prompt_neutron_multi_func_of_A_post[0]:index_prompt_neutron_multi_func_of_A_post[1]]:    
-                #    if '%' in line:                                                                    # Check if there are non-numerical entries.
-                #        del dat_data[dat_data.index(line)]                                             # If so, remove line and update indexes.
-                #        index_prompt_neutron_multi_func_of_A_post = [dat_data.index(headlines_wanted_data[5])+2, dat_data.index(headlines_wanted_data[6])-4]
+                # Add (5,2,6,-4) to the list of tables above to remove erronous data from this table.
+                #index_prompt_neutron_multi_func_of_A_post = [headline_index[headlines_wanted_data[5]]+2, headline_index[headlines_wanted_data[6]]-4]
                 #----------------------------------------------- STORE GEF GAMMA DATA  -----------------------------------------#
                 #---------------------------------------------------------------------------------------------------------------#
                 #   [0]-[1]: Prompt gamma multiplicity as a function on mass A.   [2]: Mean gamma multiplicity as a function on mass A.
                 #   [3]: Mean gamma energy.
                 #---------------------------------------------------------------------------------------------------------------#
-                GEF_data['gamma_multi_func_of_A'] =  [np.loadtxt(dat_data,dtype=np.float32, skiprows=index_gamma_multi_func_of_A[0], 
+                GEF_data['gamma_multi_func_of_A'] =  [np.loadtxt(dat_data,dtype=Reaction.storage_dtype, skiprows=index_gamma_multi_func_of_A[0], 
                                                                                                     max_rows=(index_gamma_multi_func_of_A[1]-index_gamma_multi_func_of_A[0]))]
-                GEF_data['mean_gamma_multi'] = [dat_data[dat_data.index(headlines_wanted_data[2])-1].split()[3]]   
-                GEF_data['Mean gamma energy'] = [dat_data[dat_data.index(headlines_wanted_data[3])-2].split()[3]]  
+                GEF_data['mean_gamma_multi'] = [dat_data[headline_index[headlines_wanted_data[2]]-1].split()[3]]   
+                GEF_data['Mean gamma energy'] = [dat_data[headline_index[headlines_wanted_data[3]]-2].split()[3]]  
                 #--------------------------------------------- STORE GEF NEUTRON DATA  -----------------------------------------#
                 #---------------------------------------------------------------------------------------------------------------#
                 #   [4]-[5]: Prompt neutron multiplicity as function of A (pre-neutron).    [5]-[6]: Prompt neutron multiplicity as function of A (post-neutron).   
                 #   [7]: mean prompt neutron multiplicity as function of A from fragments.  [7]: Standard deviation of prompt n from fragments.
                 #   [8]: Mean neutron energy. 
                 #---------------------------------------------------------------------------------------------------------------#
-                GEF_data['prompt_neutron_multi_func_of_A_pre'] = [np.loadtxt(dat_data,dtype=np.float32,skiprows=index_prompt_neutron_multi_func_of_A_pre[0],
+                GEF_data['prompt_neutron_multi_func_of_A_pre'] = [np.loadtxt(dat_data,dtype=Reaction.storage_dtype,skiprows=index_prompt_neutron_multi_func_of_A_pre[0],
                                                                                         max_rows=(index_prompt_neutron_multi_func_of_A_pre[1]-index_prompt_neutron_multi_func_of_A_pre[0]))]
-                #GEF_data['prompt_neutron_multi_func_of_A_post'] = [np.loadtxt(dat_data,dtype=np.float32,skiprows=index_prompt_neutron_multi_func_of_A_post[0],
+                #GEF_data['prompt_neutron_multi_func_of_A_post'] = [np.loadtxt(dat_data,dtype=Reaction.storage_dtype,skiprows=index_prompt_neutron_multi_func_of_A_post[0],
                 #                                                                        max_rows=(index_prompt_neutron_multi_func_of_A_post[1]-index_prompt_neutron_multi_func_of_A_post[0]))]
-                GEF_data['mean_prompt_neutron_multi_from_frag'] = [dat_data[dat_data.index(headlines_wanted_data[7])-9].split()[4]]   
-                GEF_data['st_dev_prompt_neutron_multi_from_frag'] = [dat_data[dat_data.index(headlines_wanted_data[7])-8].split()[3]] 
-                GEF_data['mean_neutron_E'] = [dat_data[dat_data.index(headlines_wanted_data[8])+3].split()[4]]  
+                GEF_data['mean_prompt_neutron_multi_from_frag'] = [dat_data[headline_index[headlines_wanted_data[7]]-9].split()[4]]   
+                GEF_data['st_dev_prompt_neutron_multi_from_frag'] = [dat_data[headline_index[headlines_wanted_data[7]]-8].split()[3]] 
+                GEF_data['mean_neutron_E'] = [dat_data[headline_index[headlines_wanted_data[8]]+3].split()[4]]  
                 #--------------------------------------------- A VS TKE PRENEUTRON DATA ----------------------------------------#
                 #---------------------------------------------------------------------------------------------------------------#
                 #   [9]: Mean TKE pre-neutron.   [10]-[11]: A_TKE value ranges and Average TKE pre-neutron as a function of A. 
                 #---------------------------------------------------------------------------------------------------------------#
-                GEF_data['mean_value_TKE_pre'] = [dat_data[dat_data.index(headlines_wanted_data[9])-5].split()[4]]  
-                index_A_TKE_preneutron = [dat_data.index(headlines_wanted_data[10])+8, dat_data.index(headlines_wanted_data[11])-2]     
+                GEF_data['mean_value_TKE_pre'] = [dat_data[headline_index[headlines_wanted_data[9]]-5].split()[4]]  
+                index_A_TKE_preneutron = [headline_index[headlines_wanted_data[10]]+8, headline_index[headlines_wanted_data[11]]-2]     
                 Astart = dat_data[index_A_TKE_preneutron[0]-5].split()[4]   # Index from '--- A-TKE spectrum (pre-neutron)---\n' +8 -5. (Reuse index for A-TKE spectrum (pre-neutron)).
                 Astop  = dat_data[index_A_TKE_preneutron[0]-5].split()[6]
                 Estart = dat_data[index_A_TKE_preneutron[0]-5].split()[11]
@@ -1544,8 +2228,8 @@ class Reaction:
                 #---------------------------------------------------------------------------------------------------------------#
                 #    [9]: Mean TKE post-neutron.     [11]-[12]: A_TKE value ranges and Average TKE post-neutron as a function of A. 
                 #---------------------------------------------------------------------------------------------------------------#
-                #GEF_data['mean_value_TKE_post'] = [dat_data[dat_data.index(headlines_wanted_data[9])-5].split()[8]]  
-                #index_A_TKE_postneutron = [dat_data.index(headlines_wanted_data[11])+8, dat_data.index(headlines_wanted_data[12])]
+                #GEF_data['mean_value_TKE_post'] = [dat_data[headline_index[headlines_wanted_data[9]]-5].split()[8]]  
+                #index_A_TKE_postneutron = [headline_index[headlines_wanted_data[11]]+8, headline_index[headlines_wanted_data[12]]]
                 #Astart = dat_data[index_A_TKE_postneutron[0]-5].split()[4]  #Index from '--- A-TKE spectrum (post-neutron)---\n' +8 -5. Reuse index for A-TKE spectrum (post-neutron)).
                 #Astop  = dat_data[index_A_TKE_postneutron[0]-5].split()[6]
                 #Estart = dat_data[index_A_TKE_postneutron[0]-5].split()[11]
@@ -1556,16 +2240,16 @@ class Reaction:
                 #---------------------------------------------------------------------------------------------------------------#
                 #   [13]: Mean value Q-bar (MeV)
                 #---------------------------------------------------------------------------------------------------------------#
-                GEF_data['mean_value_Q_bar'] = [dat_data[dat_data.index(headlines_wanted_data[13])-4].split()[4]] 
+                GEF_data['mean_value_Q_bar'] = [dat_data[headline_index[headlines_wanted_data[13]]-4].split()[4]] 
                 #--------------------------------------------- MEAN VALUE TXE ------------------------------------------------#
                 #---------------------------------------------------------------------------------------------------------------#
                 #   [14]: Mean value TXE (MeV)
                 #---------------------------------------------------------------------------------------------------------------#
-                GEF_data['mean_value_TXE'] = [dat_data[dat_data.index(headlines_wanted_data[14])-4].split()[4]]             
+                GEF_data['mean_value_TXE'] = [dat_data[headline_index[headlines_wanted_data[14]]-4].split()[4]]             
                 #---------------------------------------------------------------------------------------------------------------#  
             except Exception as e:
                 sys.exit(e)
-            del GEF_dat_file,dat_data,index_gamma_multi_func_of_A,index_prompt_neutron_multi_func_of_A_pre,
+            del GEF_dat_file,dat_data,headline_index,dat_headlines,index_gamma_multi_func_of_A,index_prompt_neutron_multi_func_of_A_pre,
             index_A_TKE_preneutron# ,Astart,Astop,Estart,Estop,index_A_TKE_postneutron,index_prompt_neutron_multi_func_of_A_post
             #-------------------------------------- READ ".dmp"-FILE AND CREATE INDEXES  -----------------------------------#
             try:
@@ -1594,6 +2278,34 @@ class Reaction:
             sys.exit()
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
             
+    def GEF_mean_values(GEF_results):
+        """Convert the mean values in a dictionary with GEF results to 
+        `float`.
+
+        Parameters
+        ----------
+        GEF_results : `dict`
+            GEF simulation results from ``read_and_clear_GEF_results()``.
+            All values are lists of `str`.
+
+        Returns
+        -------
+        GEF_mean_values : `dict` [`str`, `float`]
+            The entries whose key starts with 'mean_value_', e.g. 
+            'mean_value_TXE', as `float`.
+
+        See Also
+        --------
+        ``McPUFF_program.read_and_clear_GEF_results()``
+
+        Examples
+        --------
+        >>> Reaction.GEF_mean_values(tmc_obj.perturbed_GEF_results)['mean_value_TXE']
+        float
+        """
+        return {key: float(value[0]) for key,value in GEF_results.items() if key.startswith('mean_value_')}
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+            
     def read_and_clear_TALYS_results(pth_TALYS_CWD,pth_TALYS_FY_folder,unique_thread_ID): 
         """Store selected simulation results from different TALYS output 
         files and then delete output data to save disc space and memory.
@@ -1633,7 +2345,8 @@ class Reaction:
         Notes
         -----
         The TALYS output files are identified by the start of the file
-        name string. The user can add/remove data to be stored by 
+        name string. Each file is read once and `numpy.loadtxt()` parses
+        the lines already in memory (header lines start with "#"). The user can add/remove data to be stored by 
         following the procedure for the existing data storage below.
 
         The TALYS output data for the prompt gamma multiplicity as a 
@@ -1675,7 +2388,7 @@ class Reaction:
                     path_file = os.path.join(pth_TALYS_CWD,file_name.name)
                     with open(path_file,'r') as file:   
                         data = file.readlines()
-                    TALYS_data[f'{data_to_read[0]}_Avg_emission_E_for_n_g_func_of_A'] = [np.loadtxt(path_file,dtype=np.float32)]
+                    TALYS_data[f'{data_to_read[0]}_Avg_emission_E_for_n_g_func_of_A'] = [np.loadtxt(data,dtype=Reaction.storage_dtype)]
                     del path_file,file,data
                 #--------------------------------------------------------------------------------------------------------------------------------#
                 # data_to_read[1] = nugA: Mean value of prompt gamma multiplicity and Average prompt gamma multiplicity as a function on mass A. #
@@ -1685,7 +2398,7 @@ class Reaction:
                     with open(path_file,'r') as file:   
                         data = file.readlines()
                     TALYS_data[f'{data_to_read[1]}_Mean_value_(nubar-prompt)'] = [data[2].split()[5]]
-                    TALYS_data[f'{data_to_read[1]}_Avg_prompt_gamma_multiplicity_func_of_A'] = [np.loadtxt(path_file,dtype=np.float32)]
+                    TALYS_data[f'{data_to_read[1]}_Avg_prompt_gamma_multiplicity_func_of_A'] = [np.loadtxt(data,dtype=Reaction.storage_dtype)]
                     del path_file,file,data
                 #-------------------------------------------------------------------------------------------------------------------------------------#
                 #  data_to_read[2] = nunA: Mean value of prompt neutron multiplicity and Average prompt neutron multiplicity as a function on mass A. # 
@@ -1695,7 +2408,7 @@ class Reaction:
                     with open(path_file,'r') as file:   
                         data = file.readlines()
                     TALYS_data[f'{data_to_read[2]}_Mean_value_(nubar_prompt)'] = [data[2].split()[5]]
-                    TALYS_data[f'{data_to_read[2]}_Avg_prompt_neutron_multiplicity_func_of_A'] = [np.loadtxt(path_file,dtype=np.float32)]
+                    TALYS_data[f'{data_to_read[2]}_Avg_prompt_neutron_multiplicity_func_of_A'] = [np.loadtxt(data,dtype=Reaction.storage_dtype)]
                     del path_file,file,data
                 #---------------------------------------------------------------------------------------------------------------#
                 #  data_to_read[3] = pfgs: Average energy of PFGS and PFGS (prompt fission gamma spectrum).                     #
@@ -1705,7 +2418,7 @@ class Reaction:
                     with open(path_file,'r') as file:   
                         data = file.readlines()
                     TALYS_data[f'{data_to_read[3]}_E_average_gamma_MeV'] = [data[3].split()[3]]
-                    TALYS_data[f'{data_to_read[3]}'] = [np.loadtxt(path_file,dtype=np.float32,usecols=(0,1))] 
+                    TALYS_data[f'{data_to_read[3]}'] = [np.loadtxt(data,dtype=Reaction.storage_dtype,usecols=(0,1))] 
                     del path_file,file,data
                 #---------------------------------------------------------------------------------------------------------------#
                 # data_to_read[4] = pfns: Average energy of PFNS and PFNS (prompt fission neutron spectrum).                    #
@@ -1715,7 +2428,7 @@ class Reaction:
                     with open(path_file,'r') as file:   
                         data = file.readlines()
                     TALYS_data[f'{data_to_read[4]}_E_average_neutron_MeV'] = [data[3].split()[3]]
-                    TALYS_data[f'{data_to_read[4]}'] = [np.loadtxt(path_file,dtype=np.float32,usecols=(0,1,2))]
+                    TALYS_data[f'{data_to_read[4]}'] = [np.loadtxt(data,dtype=Reaction.storage_dtype,usecols=(0,1,2))]
                     del path_file,file,data
                 #---------------------------------------------------------------------------------------------------------------#
                 # data_to_read[5] = Pnug: Mean number prompt gammas.                                                            #
@@ -1734,7 +2447,7 @@ class Reaction:
                     with open(path_file,'r') as file:   
                         data = file.readlines()
                     TALYS_data[f'{data_to_read[6]}_Mean_value_(nubar_prompt)'] = [data[2].split()[5]]
-                    TALYS_data[f'{data_to_read[6]}'] = [np.loadtxt(path_file,dtype=np.float32)]
+                    TALYS_data[f'{data_to_read[6]}'] = [np.loadtxt(data,dtype=Reaction.storage_dtype)]
                     del path_file,file,data
                 #---------------------------------------------------------------------------------------------------------------#
                 # data_to_read[7] = yieldA: Number of fission fragments.                                                        #
@@ -1747,7 +2460,7 @@ class Reaction:
                     with open(path_file,'r') as file:   
                         data = file.readlines()
                     TALYS_data[f'{data_to_read[7]}_Number_of_nuclides'] = [data[2].split()[4]]
-                    TALYS_data[f'{data_to_read[7]}'] = [np.loadtxt(path_file,dtype=np.float32,usecols=(0,1,2))]
+                    TALYS_data[f'{data_to_read[7]}'] = [np.loadtxt(data,dtype=Reaction.storage_dtype,usecols=(0,1,2))]
                     del path_file,file,data
         except FileNotFoundError as e:
                 sys.exit(e)
@@ -1761,145 +2474,362 @@ class Reaction:
         return TALYS_data
     #------------------------------------------------------- END OF METHOD ---------------------------------------------------------#
 
-#----------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
-    
-class Custom_Thread(Thread):
-    """Custom thread class with capabilities to store output for
-    unperturbed simulations.
+    def open_TALYS_output_file(path_TALYS_output_file):
+        """Open the destination of the screen output of a TALYS 
+        simulation.
 
-    Parameters
-    ----------
-    target : callable
-        ``Reaction.create_unperturbed_FY()`` function with arguments:
-        - ``Z_target`` : Atomic number of target chemical element (`int`).
-        - ``A_compound`` : Mass number of compound target nuclei (`int`).
-        - ``E_reaction`` : Kinetic energy (MeV) of incident neutron in 
-                           fission event (`float`).
-        - ``MC_runs`` : The number of Monte Carlo simulations to be 
-                        performed in GEF (`int`).
-        - ``With_TALYS_flag`` : If `True`, includes TALYS evaporation 
-                                simulation (`boolean`).
-        - ``path_dict`` : Dictionary with local paths needed for 
-                          simulations `dict` [`str`, `str`, `str`,
-                          `str`, `str`, `str`, `str`, `str`].
+        Parameters
+        ----------
+        path_TALYS_output_file : `str`
+            Local path to the "_output.out" file of a TALYS simulation.
 
-    See Also
-    --------
-    ``Reaction.create_unperturbed_FY()``
-    ``Reaction.read_and_clear_GEF_results()``
-    ``Reaction.read_and_clear_TALYS_results()``
-    ``Reaction.FY_results()``
-    ``Reaction.GEF_FY_for_TALYS`()``
+        Returns
+        -------
+        TALYS_output : context manager
+            Opened "_output.out" file if ``Reaction.keep_TALYS_output_file``
+            is `True`, otherwise `subprocess.DEVNULL`. Both are used as 
+            the ``stdout`` of `subprocess.run()` in a `with` statement.
 
-    Notes
-    -----
-    Simulation for unperturbed simulations performed separately because
-    it only has to do one simulation and its faster/easier than to 
-    include it in the `concurrent.futures`-multithread simulations. Since
-    a separate thread cannot communicate with the main thread, it is not
-    possible to store output data from the thread. Hence, a custom class
-    that overloads the built-in Python `Thread` class is used.
-    
-    References
-    ----------
-    .. [1] P. Karlsson, "Total Monte Carlo of the fission model in
-    GEF and its influence on the nuclear evaporation in TALYS." 
-    Technical report UPTEC F 23065, Uppsala University, 2023, accessed
-    1 Janauary 2024, 
-    url: <http://urn.kb.se/resolve?urn=urn:nbn:se:uu:diva-517598>.
+        See Also
+        --------
+        ``Reaction.read_and_clear_TALYS_results()``
+        ``Reaction.delete_TALYS_result_files()``
 
-    Examples
-    --------
-    To perform an unperturbed thermal fission simulation for U235 + n 
-    with 1e6 Monte Carlo fission events in GEF and no TALYS simulation.
+        Notes
+        -----
+        The TALYS results stored by McPUFF are read from the files that 
+        TALYS writes itself (e.g. "yieldA" and "pfns"), which cannot be 
+        sent through a pipe. The screen output was the only file written 
+        by McPUFF. It is never read and is deleted together with the 
+        TALYS working directory, so by default it is not written at all.
 
-    >>> unperturbed_thread = 
-                    Custom_Thread(target=Reaction.create_unperturbed_FY, 
-                        args=[92,236,2.53e-8,1e6,False,path_dict])
-    [unperturbed_thread (Custom_Thread object)]     
-    """
-    #--------------------------------------------------- CLASS ATTRIBUTES ------------------------------------------------------#
-    unperturbed_FY = None
-    """Array with unperturbed GEF fission fragment yield data in ".ff" 
-    file format 
-    
-    For GEF "lmd" option:  (`numpy.ndarray` (300,11)).
-    For GEF "lmd+" option: (`numpy.ndarray` (300,19)).
-    See the `See Also` section."""
+        Examples
+        --------
+        >>> with Reaction.open_TALYS_output_file("/local/path/TMC_5_output.out") as TALYS_output:
+                subprocess.run(["talys"],stdin=TALYS_input,stdout=TALYS_output)
+        []
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        if Reaction.keep_TALYS_output_file == True:
+            return open(path_TALYS_output_file,'wb')
+        return contextlib.nullcontext(DEVNULL)                                                                                  # Nothing to close. TALYS writes to the null device.
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
-    unperturbed_ignored_events = None
-    """Number of GEF fission events removed due to statistical reasons 
-    because they only occur once (`int`) [1]_."""
+    def run_GEF_simulation(GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_DMP_EN_path,A_compound,Z_target,GEF_cache_path):
+        """Run a GEF simulation and read its results, or reuse the results
+        of an earlier GEF simulation with identical input.
+        
+        Parameters
+        ----------
+        GEF_cwd_path : `str`
+            Local path to individual GEF simulation folder.
+        GEF_LMD_path : `str`
+            Local path to GEF ".lmd" file of the simulation.
+        GEF_DAT_path : `str`
+            Local path to GEF ".dat" file of the simulation.
+        GEF_DMP_EN_path : `str`
+            Local path to GEF "EN.dmp" file of the simulation.
+        A_compound : `int`
+            Mass number of compound target nuclei. I.e A + 1.
+        Z_target : `int`
+            Atomic number of target chemical element. 
+        GEF_cache_path : `str`
+            Local path to folder with cached GEF results.
 
-    unperturbed_GEF_results = None
-    """Dictionary of unperturbed GEF simulation results (`dict`) 
-    (See the `See Also` section.)"""
+        Returns
+        -------
+        FY_TALYS_format : `numpy.ndarray` (300,11) or (300,19)
+            GEF fission fragment yields in ".ff" file library format.
+            See ``Reaction.FY_results()``.
+        ignored_events : `int`
+            Number of GEF fission events removed because they only occur
+            once.
+        GEF_data_dict : `dict`
+            GEF simulation results. See ``Reaction.read_and_clear_GEF_results()``.
 
-    unperturbed_TALYS_results = None
-    """Dictionary of unperturbed TALYS simulation results (`dict`) 
-    (See the `See Also` section.)"""
-    #------------------------------------------------------ CONSTRUCTOR --------------------------------------------------------#
-    def __init__(self,target=None,args=[]):
-        Thread.__init__(self,target=None,args=[])
-        self.target     = target
-        self.Z_target        = args[0]
-        self.A_compound      = args[1]
-        self.E_reaction      = args[2]
-        self.runs_MC         = args[3]
-        self.With_TALYS_flag = args[4]
-        self.path_dict       = args[5]
-        self.unperturbed_FY = None
-        self.unperturbed_ignored_events = None
-        self.unperturbed_GEF_results = {}
-        self.unperturbed_TALYS_results = {}
-    #------------------------------------------------------ CLASS METHODS ------------------------------------------------------#
-    def run(self):
-        """Custom run method to store output data from thread target.
+        See Also
+        --------
+        ``Reaction.GEF_input_hash()``
+        ``Reaction.FY_results()``
+        ``Reaction.read_and_clear_GEF_results()``
+
+        Notes
+        -----
+        The GEF input files (including "MyParameters.dat") must be written 
+        before this function is called. The results of every GEF 
+        simulation are stored in the GEF cache folder under the hash of 
+        the GEF input and of the GEF executable, if 
+        ``Reaction.use_GEF_cache`` is `True` (`False` by default). A 
+        rebuilt GEF therefore never gets the results of the old one. If a
+        later simulation has exactly the same input,
+        e.g. the unperturbed simulation when McPUFF is run again or the 
+        "max-min" distribution, GEF is not run and the stored results are
+        returned. Note that these are then the results of the same GEF 
+        Monte Carlo sampling as the earlier simulation. Simulations with 
+        random perturbations practically never get the same input. Cached
+        results are read with ``McPUFF_Unpickler``. The cache is emptied 
+        by deleting the files in the cache folder.
+
+        Every perturbed simulation is its own GEF process. GEF can 
+        simulate several reactions listed in "file.in" in one run, but 
+        all of them are run with the same "MyParameters.dat" and their 
+        output files are named after Z, A and E only. Simulations with 
+        different parameter values can therefore not be combined into one
+        GEF run. The simulations are run by several worker threads or
+        processes at once, so while one worker reads the output of its
+        GEF simulation, the GEF and TALYS processes of the other workers
+        keep running. No `asyncio` event loop is needed for that overlap.
+
+        Examples
+        --------
+        >>> FY, ignored, GEF_dict = Reaction.run_GEF_simulation(GEF_cwd_path,
+                 GEF_LMD_path,GEF_DAT_path,GEF_DMP_EN_path,236,92,GEF_cache_path)
+        [numpy.ndarray (300,19), 42, dict]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        if Reaction.use_GEF_cache == True:
+            cache_file_path = os.path.join(GEF_cache_path,f'{Reaction.GEF_input_hash(GEF_cwd_path)}.pkl')
+            if os.path.isfile(cache_file_path):                                                                                 # Identical GEF input simulated before. Skip GEF.
+                FY_TALYS_format,ignored_events,GEF_data_dict = Reaction.load_cache_file(cache_file_path)
+                Reaction.delete_GEF_result_folder(GEF_cwd_path)                                                                 # GEF input files are deleted as after a GEF simulation.
+                del cache_file_path
+                return FY_TALYS_format,ignored_events,GEF_data_dict
+        #----------------------------------------------- RUN GEF SIMULATION ----------------------------------------------------#
+        GEF_process = subprocess.run(["GEF"],input=b'\n',stdout=DEVNULL,cwd=GEF_cwd_path)                                     # Make sure modified GEF is on path. Blocks in waitpid() until GEF exits, no polling.
+        FY_TALYS_format,ignored_events = Reaction.FY_results(GEF_LMD_path,A_compound,Z_target)
+        GEF_data_dict = Reaction.read_and_clear_GEF_results(GEF_cwd_path,GEF_DAT_path,GEF_DMP_EN_path)                          # Reads and stores data from ".dat" file. Deletes files and folders after data is stored.
+        #------------------------------------------------ STORE RESULTS IN CACHE -----------------------------------------------#
+        if Reaction.use_GEF_cache == True:
+            with open(cache_file_path+f'.{os.getpid()}.tmp','wb') as cache_file:                                               # Write to temporary file and rename. Other processes never read a half written file.
+                pickle.dump((FY_TALYS_format,ignored_events,GEF_data_dict),cache_file,protocol=5)
+            os.replace(cache_file_path+f'.{os.getpid()}.tmp',cache_file_path)
+            del cache_file_path,cache_file
+        del GEF_process
+        return FY_TALYS_format,ignored_events,GEF_data_dict
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
-        Overloads `threading.Thread.run()` method.
+    def run_TALYS_simulation(TALYS_input_path,TALYS_ff_file_path,unique_thread_ID,FY_TALYS_format,Z_target,A_compound,E_reaction,TALYS_cache_path):
+        """Run a TALYS simulation with GEF fission yields and read its 
+        results, or reuse the results of an earlier TALYS simulation with
+        identical input.
         
         Parameters
         ----------
-        Function takes no arguments.
+        TALYS_input_path : `str`
+            Local path to where to place TALYS input file. See
+            ``Reaction.create_paths_and_directories()``.
+        TALYS_ff_file_path : `str`
+            Local path to modified GEF library of ".ff" files.
+        unique_thread_ID : `str`
+            Used to name files and enable TALYS to differentiate between
+            perturbed ".ff" files in GEF library during multi-threading.
+        FY_TALYS_format : `numpy.ndarray` (300,11) or (300,19)
+            GEF fission fragment yields in ".ff" file library format.
+            See ``Reaction.FY_results()``.
+        Z_target : `int`
+            Atomic number of target chemical element. 
+        A_compound : `int`
+            Mass number of compound target nuclei. I.e A + 1.
+        E_reaction : `float`
+            Kinetic energy (MeV) of incident neutron in fission event.
+        TALYS_cache_path : `str`
+            Local path to folder with cached TALYS results.
 
         Returns
         -------
-        For GEF "lmd" option:
-        result_dict : `dict` [`numpy.ndarray` (300,11), `dict`, `dict`,`int`]
-        For GEF "lmd+" option:
-        result_dict : `dict` [`numpy.ndarray` (300,19), `dict`, `dict`,`int`]
+        TALYS_data_dict : `dict`
+            TALYS simulation results. See ``Reaction.read_and_clear_TALYS_results()``.
 
         See Also
         --------
-        `threading.Thread.run()`. 
-        url: <https://docs.python.org/3/library/threading.html?highlight=thread#module-threading>
+        ``Reaction.run_GEF_simulation()``
+        ``Reaction.print_TALYS_ff_files()``
+        ``Reaction.read_and_clear_TALYS_results()``
 
         Notes
         -----
-        In case ``With_TALYS_flag`` = "False", 
-        Reaction.create_unperturbed_FY() returns ``TALYS_data_dict`` 
-        as an empty dictionary.
-        
+        If ``Reaction.use_TALYS_cache`` is `True` (`False` by default),
+        the results are cached. TALYS is deterministic, so its results 
+        only depend on the fission yields in the ".ff" file, on the 
+        reaction, on the TALYS input file written by 
+        ``package_McPUFF.TALYS_Input`` and on the TALYS executable. The 
+        hash of these is the name of the cached results, in the same way
+        as the GEF input hash in ``Reaction.run_GEF_simulation()``. The 
+        source file of ``package_McPUFF.TALYS_Input`` is hashed, so 
+        editing its keywords or rebuilding TALYS (see 
+        ``Reaction.program_file_identity()``) gives new hashes. When GEF results are 
+        reused from the GEF cache, the TALYS results are therefore reused
+        as well and neither program is run. No ".ff" file, TALYS input
+        file or "_output.out" file is written when the cached results 
+        are used. Cached results are read with ``McPUFF_Unpickler``. The 
+        cache is emptied by deleting the files in the cache folder.
+
         Examples
         --------
-        Custom thread stores output from thread in a dictionary.
+        >>> TALYS_dict = Reaction.run_TALYS_simulation(TALYS_input_path,
+                 TALYS_ff_file_path,"TMC_5",FY_TALYS_format,92,236,6.5,TALYS_cache_path)
+        [dict]
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        if Reaction.use_TALYS_cache == True:
+            TALYS_hash = hashlib.blake2b(f'{Z_target} {A_compound} {E_reaction} {FY_TALYS_format.dtype} {FY_TALYS_format.shape}'.encode(),digest_size=16)
+            TALYS_hash.update(Reaction.program_file_identity('talys').encode())                                                # A rebuilt TALYS gets new hashes.
+            with open(TALYS_Input.__file__,'rb') as TALYS_input_source:
+                TALYS_hash.update(TALYS_input_source.read())                                                                    # The keywords of the TALYS input file are set in this source file.
+            TALYS_hash.update(np.ascontiguousarray(FY_TALYS_format).tobytes())                                                  # The fission yields written to the ".ff" file.
+            cache_file_path = os.path.join(TALYS_cache_path,f'{TALYS_hash.hexdigest()}.pkl')
+            del TALYS_hash,TALYS_input_source
+            if os.path.isfile(cache_file_path):                                                                                 # Identical TALYS input simulated before. Skip TALYS.
+                TALYS_data_dict = Reaction.load_cache_file(cache_file_path)
+                del cache_file_path
+                return TALYS_data_dict
+        #--------------------------------------- CREATE .FF FILE AND TALYS INPUT FILE ------------------------------------------#
+        Reaction.print_TALYS_ff_files(TALYS_ff_file_path,FY_TALYS_format,Z_target,A_compound,E_reaction,unique_thread_ID)
+        TALYS_input_command = 'talys'  
+        TALYS_input_file    = f'{unique_thread_ID}_input.in'                       
+        TALYS_output_file   = f'{unique_thread_ID}_output.out'
+        TALYS_cwd           = os.path.join(TALYS_input_path+f'{unique_thread_ID}',"")                                           # Unique TALYS output folder for each simulation.
+        TALYS_Input.create_TALYS_input_file(TALYS_input_path,unique_thread_ID,TALYS_input_file,Z_target,A_compound,E_reaction)
+        #----------------------------------------------- RUN TALYS SIMULATION --------------------------------------------------#
+        try:
+            with open(os.path.join(TALYS_cwd,TALYS_input_file),'rb') as TALYS_input, Reaction.open_TALYS_output_file(os.path.join(TALYS_cwd,TALYS_output_file)) as TALYS_output:
+                subprocess.run([TALYS_input_command],stdin=TALYS_input,stdout=TALYS_output,cwd=TALYS_cwd,check=True)          # Run TALYS simulation without a shell. Make sure modified TALYS is on path.
+        except FileNotFoundError as e:
+            print(f'TALYS could not run. Either the "{TALYS_input_command}" executable is not on the path or the input file cannot be found.\n{e}')
+            sys.exit(e)
+        except subprocess.CalledProcessError as e:
+            print(f'An error occured while running TALYS\n{e}')
+            sys.exit(e)
+        #------------------------------ STORE TALYS DATA AND DELETE OUTPUT FILES AND FOLDERS -----------------------------------#
+        TALYS_data_dict = Reaction.read_and_clear_TALYS_results(TALYS_cwd,TALYS_ff_file_path,unique_thread_ID)                  # Store selected TALYS output and then delete files and folders.
+        #------------------------------------------------ STORE RESULTS IN CACHE -----------------------------------------------#
+        if Reaction.use_TALYS_cache == True:
+            with open(cache_file_path+f'.{os.getpid()}.tmp','wb') as cache_file:                                               # Write to temporary file and rename. Other processes never read a half written file.
+                pickle.dump(TALYS_data_dict,cache_file,protocol=5)
+            os.replace(cache_file_path+f'.{os.getpid()}.tmp',cache_file_path)
+            del cache_file_path,cache_file
+        del TALYS_input_command,TALYS_input_file,TALYS_output_file,TALYS_cwd
+        return TALYS_data_dict
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
-        For GEF "lmd" option:
-        >>> result_dict = self.target(92,236,2,1e5,True,path_dict)
-        [result_dict dict [numpy.ndarray (300,11), dict, dict, int] ]
+    def sum_lmd_plus_energies(energy_lines,number_of_lines,neutron_flag):
+        """Sum the neutron or gamma ray energies of every fission event in
+        a group of lines from a GEF ".lmd+" file.
+        
+        Parameters
+        ----------
+        energy_lines : `list` [`str`]
+            Lines with energies of one kind of emission, one line per 
+            fission event, with the leading line identifier removed.
+        number_of_lines : `int`
+            Number of fission events in the ".lmd+" file. Length of the 
+            returned array.
+        neutron_flag : `bool`
+            `True` for neutron lines, where every fourth number is a 
+            neutron energy. `False` for gamma ray lines, where every entry
+            that starts with a digit is a gamma ray energy.
+
+        Returns
+        -------
+        summed_energies : `numpy.ndarray` (number_of_lines,)
+            dtype = `numpy.float64`. Sum of the energies on each line.
+            Fission events without a line get the value zero.
 
-        For GEF "lmd+" option:
-        >>> result_dict = self.target(92,236,2,1e5,True,path_dict)
-        [result_dict dict [numpy.ndarray (300,19), dict, dict, int] ]
+        See Also
+        --------
+        ``Reaction.FY_results()``
+        `numpy.bincount()`(url:
+        <https://numpy.org/doc/stable/reference/generated/numpy.bincount.html>)
+
+        Notes
+        -----
+        All lines are joined and split into entries in one call, with a 
+        marker entry between the lines, so that no Python loop runs per 
+        line or per entry. The line of every entry and the gamma ray 
+        energies are found with `numpy` operations on the array of 
+        entries. The energies are then converted to numbers in one call 
+        and summed per line with `numpy.bincount()`, instead of one 
+        `numpy.sum()` per line. A ".lmd+" file has one line
+        of each kind per GEF Monte Carlo simulation, e.g 1e6 lines.
+        `numpy.bincount()` is used rather than `numpy.add.reduceat()`.
+        For an empty segment (a line without energies, e.g. no emitted
+        gamma rays) ``reduceat`` returns the next entry instead of zero,
+        and it needs the line offsets, which ``bincount`` does not.
+        The gamma ray lines also hold entries that are not numbers, so
+        they cannot be read with `numpy.fromstring()` (deprecated for
+        text) or `numpy.loadtxt()`. Only the selected entries are
+        converted, with one ``astype`` call.
+
+        Examples
+        --------
+        >>> Reaction.sum_lmd_plus_energies([" 1.2 0 0 0 0.8 0 0 0"],1,True)
+        [numpy.ndarray (1,) = [2.0]]
         """
         #-----------------------------------------------------------------------------------------------------------------------#
-        result_dict = self.target(self.Z_target,self.A_compound,self.E_reaction,self.runs_MC,self.With_TALYS_flag,self.path_dict)
-        self.unperturbed_FY = result_dict['FY_TALYS_format']
-        self.unperturbed_GEF_results = result_dict['GEF_data_dict']
-        self.unperturbed_TALYS_results = result_dict['TALYS_data_dict'] 
-        self.unperturbed_ignored_events = result_dict['unpert_ignored_events']
-#------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
+        all_entries = np.array(' \x01 '.join(energy_lines).split(),dtype=str)                                                   # All lines split in one call. The entry '\x01' (not whitespace, not in a text file) marks the end of a line.
+        end_of_line = all_entries == '\x01'
+        line_number = np.cumsum(end_of_line)[~end_of_line]                                                                      # Line (fission event) of every entry.
+        all_entries = all_entries[~end_of_line]
+        if neutron_flag == True:
+            entries_per_line = np.bincount(line_number,minlength=len(energy_lines))
+            position_in_line = np.arange(len(all_entries)) - np.repeat(np.cumsum(entries_per_line)-entries_per_line,entries_per_line)
+            energy_entries = position_in_line % 4 == 0                                                                          # Every fourth entry is a neutron energy.
+            del entries_per_line,position_in_line
+        else:
+            first_character = all_entries.view(np.uint32).reshape(len(all_entries),all_entries.itemsize//4)[:,0]              # Unicode code point of the first character of every entry.
+            energy_entries = (first_character >= ord('0')) & (first_character <= ord('9'))                                      # Gamma ray energies start with a digit.
+            del first_character
+        energies = all_entries[energy_entries].astype(np.float32)
+        summed_energies = np.bincount(line_number[energy_entries],weights=energies,minlength=number_of_lines)
+        del end_of_line,line_number,all_entries,energy_entries,energies
+        return summed_energies
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+    def write_MyParameters_dat(GEF_cwd_path,param_names,param_values):
+        """Write perturbed GEF parameter values to the "MyParameters.dat"
+        file of a GEF simulation, replacing previous content.
         
+        Parameters
+        ----------
+        GEF_cwd_path : `str`
+            Local path to individual GEF simulation folder.
+        param_names : `list` [`str`]
+            Names of the GEF parameters to perturb.
+        param_values : `list` [`float`]
+            Perturbed parameter values, in the same order as 
+            ``param_names``.
+
+        Returns
+        -------
+        Function has no return value.
+
+        See Also
+        --------
+        ``Reaction.clear_MyParameters_dat()``
+        ``package_McPUFF.GEF_input``
+
+        Notes
+        -----
+        Each parameter is written on its own line as "name = value". The
+        content of the file is assembled in memory and written with one
+        call, instead of opening the file once per parameter in the 
+        ``TMC`` mode.
+
+        Examples
+        --------
+        >>> Reaction.write_MyParameters_dat("/local/path/GEF/output/GEF_TMC_5/",
+                                    ["_Delta_S0","_P_DZ_Mean_S1"],[0.31,-0.52])
+        []
+        """
+        #-----------------------------------------------------------------------------------------------------------------------#
+        MyParameters_content = ''.join([f'{param_name} = {str(param_value)}\n' for param_name,param_value in zip(param_names,param_values)])   # str(): numpy.float32 is formatted with its shortest repr, as before.
+        with open(os.path.join(GEF_cwd_path,'MyParameters.dat'),'w') as inputMyParameters_dat:
+            inputMyParameters_dat.write(MyParameters_content)
+        del MyParameters_content,inputMyParameters_dat
+    #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
+
+#----------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
+    
 class Modified_Parameter(Reaction):
     """Create object that holds all simulation information about a 
     specific GEF parameter for ``Single_Parameter`` mode.
@@ -1928,6 +2858,9 @@ class Modified_Parameter(Reaction):
     distribution_flag : `str`
             Specifies if random numbers are to be drawn from "uniform", 
             "normal" or "max-min" distributions.
+    random_generator : `numpy.random.Generator`, optional
+        Generator the random numbers are drawn from. A new, unseeded 
+        generator is used if `None`. See ``Reaction.random_seed``.
 
     See Also
     --------
@@ -2003,21 +2936,23 @@ class Modified_Parameter(Reaction):
     as a percentage of the unperturbed parameter value in the file: 
     ``Gaussian_GEF_Param.py`` (See the "See Also" section)."""
     #------------------------------------------------------ CONSTRUCTOR --------------------------------------------------------#
-    def __init__(self, param_name,unpert_param_val,num_of_rands,distribution_flag): 
+    def __init__(self, param_name,unpert_param_val,num_of_rands,distribution_flag,random_generator=None): 
         self.param_name = param_name                                
         self.unpert_param_val = np.float32(unpert_param_val)                                                                        # Unperturbed value used for centering distributions on unperturbed parameter value.
         self.list_of_Random_Parameter_Value_objects = []            
+        if random_generator is None:
+            random_generator = np.random.default_rng()
         #---------------------------------- LIST OF RANDOM NUMBERS FOR "UNIFORM" DISTRIBUTION ----------------------------------#
         if distribution_flag == 'uniform':
             scaling_number_uniform = np.float32(0.5)                                                    # Scaling value for limits of distribution. User can adjust the span of the uniform distribution here.
             upper_lim = abs(self.unpert_param_val) + scaling_number_uniform*abs(self.unpert_param_val)                              # Upper numerical limit of distribution.
             lower_lim = abs(self.unpert_param_val) - scaling_number_uniform*abs(self.unpert_param_val)                              # Lower numerical limit of distribution.
-            self.list_of_rand_num = (np.random.default_rng().uniform(low=lower_lim,high=upper_lim,size=num_of_rands)).astype(dtype=np.float32) # Creation of list of random numbers.
+            self.list_of_rand_num = (random_generator.uniform(low=lower_lim,high=upper_lim,size=num_of_rands)).astype(dtype=np.float32) # Creation of list of random numbers.
             del distribution_flag,scaling_number_uniform,upper_lim,lower_lim
         #----------------------------------- LIST OF RANDOM NUMBERS FOR "NORMAL" DISTRIBUTION ----------------------------------#
         elif distribution_flag == 'normal':
             GEF_st_dev = abs(Gaussian_GEF_Param.gaussian_st_dev_for_parameter(param_name,unpert_param_val))                         # Retrieval of std from external input file.
-            self.list_of_rand_num = (np.random.default_rng().normal(self.unpert_param_val,scale=float(GEF_st_dev),size=num_of_rands)).astype(np.float32)    # Creation of list of random numbers.
+            self.list_of_rand_num = (random_generator.normal(self.unpert_param_val,scale=float(GEF_st_dev),size=num_of_rands)).astype(np.float32)    # Creation of list of random numbers.
             del distribution_flag,GEF_st_dev
         #----------------------------------- LIST OF RANDOM NUMBERS FOR "MAX-MIN" DISTRIBUTION ---------------------------------#
         elif distribution_flag == 'max-min':
@@ -2027,7 +2962,7 @@ class Modified_Parameter(Reaction):
             print(f'The "{distribution_flag}"-distribution does not exist')
             sys.exit('Exiting program')
     #------------------------------------------------------ CLASS METHODS ------------------------------------------------------#
-    def create_perturbed_parameter_value(param_name,rand_num,unpert_param_val,distribution_flag):
+    def create_perturbed_parameter_value(param_name,rand_num,unpert_param_val,distribution_flag,special_case_standard_rand_num=None):
         """Perturb GEF parameter by adding a random number to the GEF
         default value.
         
@@ -2042,6 +2977,13 @@ class Modified_Parameter(Reaction):
             Default GEF parameter value. 
         distribution_flag : `str`
             Name of distribution from which the random number was drawn.
+        special_case_standard_rand_num : `float`, optional
+            Standard uniform ([0,1[) or standard normal random number for
+            parameters in ``special_case_parameters``. If `None` (default),
+            a new, unseeded random number is drawn. McPUFF passes numbers
+            from the seeded generator in both modes (see 
+            ``Reaction.random_seed``), so the unseeded draw is only used
+            when the function is called directly.
             
         Returns
         -------
@@ -2117,10 +3059,13 @@ class Modified_Parameter(Reaction):
         if distribution_flag == 'uniform':
             if param_name in special_case_parameters:                                                                       # Cannot produce perturbation as percentage if default value = 0. Set value using special case scaling parameter.   
                 scaling_special_case_parameters = np.float32(0.5)                                                           # The user can change this value to set the range of the special case random number distributions.     
-                special_case_rand_num = np.random.rand(1).astype('float32')                                                 # One random number in range [0,1[
+                if special_case_standard_rand_num is None:
+                    special_case_rand_num = np.random.default_rng().random(1).astype('float32')                             # One random number in range [0,1[. Own generator, worker processes must not share the global random state.
+                else:
+                    special_case_rand_num = np.array([special_case_standard_rand_num],dtype=np.float32)                     # Random number in range [0,1[ drawn up front.
                 pert_param_val = -scaling_special_case_parameters + special_case_rand_num*2*scaling_special_case_parameters
                 pert_param_val = round(pert_param_val[0],9)                                                                 # [0] Important, otherwise pert_param_val is list.
-                del special_case_parameters,param_name,rand_num,unpert_param_val,distribution_flag,scaling_special_case_parameters,special_case_rand_num
+                del special_case_parameters,param_name,rand_num,unpert_param_val,distribution_flag,scaling_special_case_parameters,special_case_rand_num,special_case_standard_rand_num
                 return pert_param_val
             else:                         
                 pert_param_val = round((unpert_param_val/abs(unpert_param_val))*rand_num,9)                                 # Multiply random number by normalized unperturbed parameter value to get correct sign.             
@@ -2130,9 +3075,12 @@ class Modified_Parameter(Reaction):
         elif distribution_flag == 'normal':                  
             if param_name in special_case_parameters:                                                                       # Cannot produce perturbation as percentage if default value = 0. Set value using special case scaling parameter.
                 st_dev_special_param = np.float32(0.03)                                                                     # The user can change this value to set the range of the special case random number distributions.
-                special_case_rand_num = (np.random.default_rng().normal(loc=0.0,scale=st_dev_special_param,size=1)).astype(dtype=np.float32)                                                                                                                  
+                if special_case_standard_rand_num is None:
+                    special_case_rand_num = (np.random.default_rng().normal(loc=0.0,scale=st_dev_special_param,size=1)).astype(dtype=np.float32)
+                else:
+                    special_case_rand_num = np.array([special_case_standard_rand_num*st_dev_special_param],dtype=np.float32)  # Standard normal random number drawn up front, scaled to st_dev_special_param.
                 pert_param_val = round(special_case_rand_num[0],9)                                                          # [0] Important, otherwise pert_param_val is list.
-                del special_case_parameters,param_name,rand_num,unpert_param_val,distribution_flag,st_dev_special_param,special_case_rand_num
+                del special_case_parameters,param_name,rand_num,unpert_param_val,distribution_flag,st_dev_special_param,special_case_rand_num,special_case_standard_rand_num
                 return pert_param_val
             else:
                 pert_param_val = round(rand_num,9)                                                                          # Random number created using ``Gaussian_GEF_Param.gaussian_st_dev_for_parameter()``. See the "See Also" section.
@@ -2152,7 +3100,7 @@ class Modified_Parameter(Reaction):
             print(f'The distribution named {distribution_flag} is not available')
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
     
-    def create_perturbed_FY(param_name,unpert_param_val,rand_num,enumeration_rand_num,Z_target,A_compound,E_reaction,MC_runs,With_TALYS_flag,distribution_flag,path_dict):
+    def create_perturbed_FY(param_name,unpert_param_val,rand_num,enumeration_rand_num,Z_target,A_compound,E_reaction,MC_runs,With_TALYS_flag,distribution_flag,path_dict,special_case_standard_rand_num=None):
         """Perform simulation with perturbed GEF parameter values using
         ``Single_Parameter`` mode.
 
@@ -2189,6 +3137,9 @@ class Modified_Parameter(Reaction):
             "normal" or "max-min" distributions.
         path_dict : `dict` [`str`,`str`,`str`,`str`,`str`,`str`,`str`]
             Dictionary with local paths needed for simulations.
+        special_case_standard_rand_num : `float`, optional
+            Standard random number for special case parameters, drawn up
+            front. See ``Modified_Parameter.create_perturbed_parameter_value()``.
         
         Returns
         -------
@@ -2216,8 +3167,13 @@ class Modified_Parameter(Reaction):
                 
                 For GEF "lmd" option:  (`numpy.ndarray`, (300,11)).
                 For GEF "lmd+" option: (`numpy.ndarray`, (300,19)).
+            ``number_of_fission_events``
+                Number of rows with data in ``perturbed_FY`` (`int`).
             ``perturbed_GEF_results``
                 Dictionary with GEF simulation results (`dict`).
+            ``perturbed_GEF_mean_values``
+                Mean values in ``perturbed_GEF_results`` as `float` 
+                (`dict` [`str`, `float`]).
             ``perturbed_TALYS_results``
                 Dictionary with TALYS simulation results (`dict`).
 
@@ -2259,7 +3215,7 @@ class Modified_Parameter(Reaction):
         #---------------------------------- CREATE ``RANDOM_PARAMETER_VALUE`` OBJECT TO STORE RESULTS --------------------------#
         rand_param_val_obj = Random_Parameter_value(param_name,unpert_param_val,rand_num,enumeration_rand_num)      # Holds all perturbed simulation results for simulation with specific random number.
         #----------------------------------------------- CREATE PERTURBED PARAMETER VALUES -------------------------------------#
-        rand_param_val_obj.pert_param_val = Modified_Parameter.create_perturbed_parameter_value(param_name,rand_num,unpert_param_val,distribution_flag)     
+        rand_param_val_obj.pert_param_val = Modified_Parameter.create_perturbed_parameter_value(param_name,rand_num,unpert_param_val,distribution_flag,special_case_standard_rand_num)     
         #----------------------------------------------- CREATE GEF PATHS FOR SIMULATION ---------------------------------------#     
         dict_of_GEF_paths = Reaction.create_GEF_workingdir_and_inputfile(unique_pert_thread_ID,Z_target,A_compound,E_reaction,MC_runs,path_dict['GEF_working_dir_path'])    # Add more paths if other files are to be read.
         GEF_cwd_path = dict_of_GEF_paths['GEF_cwd_path']                                                            # Local path to individual perturbed GEF simulation output folder.
@@ -2268,42 +3224,23 @@ class Modified_Parameter(Reaction):
         GEF_DMP_EN_path = dict_of_GEF_paths['GEF_DMP_EN_path']                                                      # Local path to individual perturbed GEF simulation "EN.dat" file.
         Reaction.eraseFolders(GEF_cwd_path)                                                                         # Make sure folders are erased before start. Otherwise GEF exits because it thinks the simulation has already been performed.
         #-------------------------------- WRITE PERTURBED PARAMETER VALUES IN MY_PARAMETERS.DAT --------------------------------#
-        with open(os.path.join(GEF_cwd_path,'MyParameters.dat'), 'w') as inputMyParameters_dat:
-            row = param_name+' = '+str(rand_param_val_obj.pert_param_val)                                           # Enter perturbed GEF parameter value to be used in simulation.
-            row = ''.join(map(str,row))
-            inputMyParameters_dat.write(row) 
+        Reaction.write_MyParameters_dat(GEF_cwd_path,[param_name],[rand_param_val_obj.pert_param_val])              # Enter perturbed GEF parameter value to be used in simulation.
         #----------------------------------------------- RUN PERTURBED GEF SIMULATION ------------------------------------------#
-        with subprocess.Popen(["GEF"],stdin=PIPE,stdout=DEVNULL,cwd=GEF_cwd_path) as GEF_process:                   # Run perturbed GEF simulation. Make sure modified GEF is on path.
-            GEF_process.communicate(input=b'\n')
-        rand_param_val_obj.perturbed_FY, rand_param_val_obj.ignored_events = Reaction.FY_results(GEF_LMD_path,A_compound,Z_target)
-        rand_param_val_obj.perturbed_GEF_results = Reaction.read_and_clear_GEF_results(GEF_cwd_path,GEF_DAT_path,GEF_DMP_EN_path)   # Reads and stores data from ".dat" file. Deletes files and folders after data is stored in object.
-        del GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_process
+        rand_param_val_obj.perturbed_FY, rand_param_val_obj.ignored_events, rand_param_val_obj.perturbed_GEF_results = \
+            Reaction.run_GEF_simulation(GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_DMP_EN_path,A_compound,Z_target,path_dict['GEF_cache_path'])    # Run perturbed GEF simulation (or reuse cached results). Deletes files and folders after data is stored in object.
+        rand_param_val_obj.number_of_fission_events = int(np.count_nonzero(rand_param_val_obj.perturbed_FY[:,0]))   # Rows with data. Z1 is never zero for a fission event. Stored so analysis does not have to count.
+        rand_param_val_obj.perturbed_GEF_mean_values = Reaction.GEF_mean_values(rand_param_val_obj.perturbed_GEF_results)   # Converted once here, not on every analysis.
+        del GEF_cwd_path,GEF_LMD_path,GEF_DAT_path
         if With_TALYS_flag == True:                                                                                 # If flag set to TRUE, run TALYS.
-            #----------------------------------- CREATE PERTURBED .FF FILE AND TALYS PATHS FOR SIMULATION ----------------------#                                                                          
-            Reaction.print_TALYS_ff_files(path_dict['TALYS_ff_file_path'],rand_param_val_obj.perturbed_FY,Z_target,A_compound,E_reaction,unique_pert_thread_ID)
-            TALYS_pert_input_command = 'talys'  
-            TALYS_pert_input_file    = f'{unique_pert_thread_ID}_input.in'                                 
-            TALYS_pert_output_file   = f'{unique_pert_thread_ID}_output.out'
-            TALYS_pert_cwd           = os.path.join(path_dict['TALYS_input_path']+f'{unique_pert_thread_ID}',"")    # Unique TALYS output folder for each perturbed simulation.
-            TALYS_Input.create_TALYS_input_file(path_dict['TALYS_input_path'],unique_pert_thread_ID,TALYS_pert_input_file,Z_target,A_compound,E_reaction)
             #---------------------------------------------- RUN PERTURBED TALYS SIMULATION -------------------------------------#
-            try:
-                subprocess.run(["bash","-c",str(f"{TALYS_pert_input_command} < {TALYS_pert_input_file} > {TALYS_pert_output_file}")],cwd=TALYS_pert_cwd)    # Run perturbed TALYS simulation. Make sure modified TALYS is on path.
-            except FileNotFoundError as e:
-                print(f'TALYS could not run because it cannot find the input file.\n{e}')
-                sys.exit(e)
-            except subprocess.CalledProcessError as e:
-                print(f'An error occured while running TALYS\n{e}')
-                sys.exit()
-            #------------------------- STORE PERTURBED TALYS DATA AND DELETE OUTPUT FILES AND FOLDERS --------------------------#
-            rand_param_val_obj.perturbed_TALYS_results = Reaction.read_and_clear_TALYS_results(TALYS_pert_cwd,path_dict['TALYS_ff_file_path'],unique_pert_thread_ID)    # Store selected TALYS output and then delete files and folders.
-            del TALYS_pert_input_command,TALYS_pert_input_file,TALYS_pert_output_file,TALYS_pert_cwd
+            rand_param_val_obj.perturbed_TALYS_results = Reaction.run_TALYS_simulation(path_dict['TALYS_input_path'],path_dict['TALYS_ff_file_path'],unique_pert_thread_ID,rand_param_val_obj.perturbed_FY,
+                                                                             Z_target,A_compound,E_reaction,path_dict['TALYS_cache_path'])     # Run perturbed TALYS simulation (or reuse cached results). Deletes files and folders after data is stored in object.
         #------------------------------------------- IMPORTANT INDENTATION -----------------------------------------------------#
         del unique_pert_thread_ID
         return rand_param_val_obj       
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
-    def create_perturbed_TMC_FY(dict_unpert_param_name_val,enumeration_rand_num,Z_target,A_compound,E_reaction,MC_runs,path_dict,With_TALYS_flag,distribution_flag):
+    def create_perturbed_TMC_FY(dict_unpert_param_name_val,enumeration_rand_num,Z_target,A_compound,E_reaction,MC_runs,path_dict,With_TALYS_flag,distribution_flag,standard_rand_nums):
         """Perform simulation with perturbed GEF parameter values using
         ``TMC`` mode.
 
@@ -2337,6 +3274,11 @@ class Modified_Parameter(Reaction):
         distribution_flag : `str`
             Specifies if random numbers are to be drawn from "uniform", 
             "normal" or "max-min" distributions.
+        standard_rand_nums : `numpy.ndarray` (number of parameters,)
+            Random numbers for this simulation from the standard uniform
+            or standard normal distribution, one per parameter in 
+            ``dict_unpert_param_name_val``. All random numbers for all 
+            simulations are drawn at once in ``Reaction.__init__``.
         
         Returns
         -------
@@ -2361,8 +3303,13 @@ class Modified_Parameter(Reaction):
                 
                 For GEF "lmd" option:  (`numpy.ndarray`, (300,11)).
                 For GEF "lmd+" option: (`numpy.ndarray`, (300,19)).
+            ``number_of_fission_events``
+                Number of rows with data in ``perturbed_FY`` (`int`).
             ``perturbed_GEF_results``
                 Dictionary with GEF simulation results (`dict`).
+            ``perturbed_GEF_mean_values``
+                Mean values in ``perturbed_GEF_results`` as `float` 
+                (`dict` [`str`, `float`]).
             ``perturbed_TALYS_results``
                 Dictionary with TALYS simulation results (`dict`).
         See Also
@@ -2395,7 +3342,8 @@ class Modified_Parameter(Reaction):
         --------
         Performs perturbed simulations with GEF and TALYS for the ``TMC`` mode.
         >>> Sim_obj = Reaction.create_perturbed_TMC_FY(dictParamNameVal,
-                         572,92,236,2.53e-8,1e6,path_dict,True,"normal")
+                         572,92,236,2.53e-8,1e6,path_dict,True,"normal",
+                                            standard_random_numbers[572])
         [Sim_obj (TMC_Object object)]  
         """
         #------------------------------------- CREATE UNIQUE THREAD NAME FOR MULTI-THREADING -----------------------------------#
@@ -2403,9 +3351,10 @@ class Modified_Parameter(Reaction):
         #------------------------------------------ CREATE ``TMC`` OBJECT TO STORE RESULTS -------------------------------------#
         tmc_obj = TMC_Object(dict_unpert_param_name_val, enumeration_rand_num)     
         #------------------------ CREATE INDIVIDUAL PARAMETER OBJECTS AND PERTURBED PARAMETER VALUES ---------------------------#  
-        for param_name, unpert_param_val in dict_unpert_param_name_val.items():                    
-            tmc_mod_param_obj = TMC_Mod_Param_object(param_name,unpert_param_val,distribution_flag)                                                             # Holds all perturbed simulation results for simulation with specific random number.
-            tmc_mod_param_obj.pert_param_val = Modified_Parameter.create_perturbed_parameter_value(param_name,tmc_mod_param_obj.random_value,unpert_param_val,distribution_flag)
+        for (param_name, unpert_param_val), standard_rand_num in zip(dict_unpert_param_name_val.items(),standard_rand_nums):                    
+            tmc_mod_param_obj = TMC_Mod_Param_object(param_name,unpert_param_val,distribution_flag,standard_rand_num)                                           # Holds all perturbed simulation results for simulation with specific random number.
+            tmc_mod_param_obj.pert_param_val = Modified_Parameter.create_perturbed_parameter_value(param_name,tmc_mod_param_obj.random_value,unpert_param_val,distribution_flag,
+                                                                                                   standard_rand_num)                                   # Special case parameters use the standard random number drawn up front.
             tmc_obj.list_of_TMC_Mod_Param_objects.append(tmc_mod_param_obj)                                                                                     # Must append here to loop over all chosen parameters in GEF run.
         #----------------------------------------------- CREATE GEF PATHS FOR SIMULATION ---------------------------------------#
         dict_of_GEF_paths = Reaction.create_GEF_workingdir_and_inputfile(unique_pert_thread_ID,Z_target,A_compound,E_reaction,MC_runs,path_dict['GEF_working_dir_path'])
@@ -2415,39 +3364,19 @@ class Modified_Parameter(Reaction):
         GEF_DMP_EN_path = dict_of_GEF_paths['GEF_DMP_EN_path']                                                                                                  # Local path to individual perturbed GEF simulation "EN.dat" file.
         #-------------------------------- WRITE PERTURBED PARAMETER VALUES IN MY_PARAMETERS.DAT --------------------------------#
         Reaction.eraseFolders(GEF_cwd_path)                                                                                                                     # Make sure folders are erased before start. Otherwise GEF exits because it thinks the simulation has already been performed.
-        Reaction.clear_MyParameters_dat(GEF_cwd_path)                                       
-        for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects:
-            with open(os.path.join(GEF_cwd_path,'MyParameters.dat'), 'a') as inputMyParameters_dat:
-                row = tmc_mod_param_obj.param_name+' = '+str(tmc_mod_param_obj.pert_param_val)                                                                  # Enter perturbed GEF parameter value to be used in simulation.
-                row = ''.join(map(str,row))
-                inputMyParameters_dat.write(row+'\n')
+        Reaction.write_MyParameters_dat(GEF_cwd_path,[tmc_mod_param_obj.param_name for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects],
+                                        [tmc_mod_param_obj.pert_param_val for tmc_mod_param_obj in tmc_obj.list_of_TMC_Mod_Param_objects])             # Enter all perturbed GEF parameter values to be used in simulation. Replaces previous content.
         #----------------------------------------------- RUN PERTURBED GEF SIMULATION ------------------------------------------#
-        with subprocess.Popen(["GEF"],stdin=PIPE,stdout=DEVNULL,cwd=GEF_cwd_path) as GEF_process:                                                               # Run perturbed GEF simulation. Make sure modified GEF is on path.
-            GEF_process.communicate(input=b'\n')
-        tmc_obj.perturbed_FY, tmc_obj.ignored_events = Reaction.FY_results(GEF_LMD_path,A_compound,Z_target)
-        tmc_obj.perturbed_GEF_results = Reaction.read_and_clear_GEF_results(GEF_cwd_path,GEF_DAT_path,GEF_DMP_EN_path)                                          # Reads and stores data from ".dat" file. Deletes files and folders after data is stored in object.
+        tmc_obj.perturbed_FY, tmc_obj.ignored_events, tmc_obj.perturbed_GEF_results = \
+            Reaction.run_GEF_simulation(GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_DMP_EN_path,A_compound,Z_target,path_dict['GEF_cache_path'])                # Run perturbed GEF simulation (or reuse cached results). Deletes files and folders after data is stored in object.
+        tmc_obj.number_of_fission_events = int(np.count_nonzero(tmc_obj.perturbed_FY[:,0]))                                                                    # Rows with data. Z1 is never zero for a fission event. Stored so analysis does not have to count.
+        tmc_obj.perturbed_GEF_mean_values = Reaction.GEF_mean_values(tmc_obj.perturbed_GEF_results)                                                            # Converted once here, not on every analysis.
         if With_TALYS_flag == True:                                                                                                                             # If flag set to TRUE, run TALYS      
-            #------------------------- CREATE PERTURBED .FF FILE AND TALYS PATHS FOR SIMULATION --------------------------------#
-            Reaction.print_TALYS_ff_files(path_dict['TALYS_ff_file_path'],tmc_obj.perturbed_FY,Z_target,A_compound,E_reaction,unique_pert_thread_ID)
-            TALYS_pert_input_command = 'talys'  
-            TALYS_pert_input_file    = f'{unique_pert_thread_ID}_input.in'                       
-            TALYS_pert_output_file   = f'{unique_pert_thread_ID}_output.out'
-            TALYS_pert_cwd           = os.path.join(path_dict['TALYS_input_path']+f'{unique_pert_thread_ID}',"")                                                # Unique TALYS output folder for each perturbed simulation.
-            TALYS_Input.create_TALYS_input_file(path_dict['TALYS_input_path'],unique_pert_thread_ID,TALYS_pert_input_file,Z_target,A_compound,E_reaction)
             #---------------------------------------------- RUN PERTURBED TALYS SIMULATION -------------------------------------#
-            try:
-                subprocess.run(["bash","-c",str(f"{TALYS_pert_input_command} < {TALYS_pert_input_file} > {TALYS_pert_output_file}")],cwd=TALYS_pert_cwd)        # Run perturbed TALYS simulation. Make sure modified TALYS is on path.
-            except FileNotFoundError as e:
-                print(f'TALYS could not run because it cannot find the input file.\n{e}')
-                sys.exit(e)
-            except subprocess.CalledProcessError as e:
-                print(f'An error occured while running TALYS\n{e}')
-                sys.exit()
-            #------------------------- STORE PERTURBED TALYS DATA AND DELETE OUTPUT FILES AND FOLDERS --------------------------#
-            tmc_obj.perturbed_TALYS_results = Reaction.read_and_clear_TALYS_results(TALYS_pert_cwd,path_dict['TALYS_ff_file_path'],unique_pert_thread_ID)       # Store selected TALYS output and then delete files and folders.
-            del TALYS_pert_input_command,TALYS_pert_input_file,TALYS_pert_output_file,TALYS_pert_cwd
+            tmc_obj.perturbed_TALYS_results = Reaction.run_TALYS_simulation(path_dict['TALYS_input_path'],path_dict['TALYS_ff_file_path'],unique_pert_thread_ID,tmc_obj.perturbed_FY,
+                                                                             Z_target,A_compound,E_reaction,path_dict['TALYS_cache_path'])     # Run perturbed TALYS simulation (or reuse cached results). Deletes files and folders after data is stored in object.
         #------------------------------------------- IMPORTANT INDENTATION -----------------------------------------------------#
-        del unique_pert_thread_ID,GEF_cwd_path,GEF_LMD_path,GEF_DAT_path,GEF_process
+        del unique_pert_thread_ID,GEF_cwd_path,GEF_LMD_path,GEF_DAT_path
         return tmc_obj
     #----------------------------------------------------- END OF METHOD -------------------------------------------------------#
 
@@ -2527,9 +3456,17 @@ class Random_Parameter_value(Modified_Parameter):
     For GEF "lmd" option:  (`numpy.ndarray`, (300,11)).
     For GEF "lmd+" option: (`numpy.ndarray`, (300,19))."""
 
+    number_of_fission_events = None
+    """Number of rows with data in ``perturbed_FY`` (`int`). The 
+    remaining rows are zero."""
+
     perturbed_GEF_results = None
     """Dictionary with GEF simulation results (`dict`)."""
 
+    perturbed_GEF_mean_values = None
+    """Entries of ``perturbed_GEF_results`` with key 'mean_value_...' as
+    `float` (`dict` [`str`, `float`]). See ``Reaction.GEF_mean_values()``."""
+
     perturbed_TALYS_results = None
     """Dictionary with TALYS simulation results (`dict`)."""
     #------------------------------------------------------ CONSTRUCTOR --------------------------------------------------------#
@@ -2541,7 +3478,9 @@ class Random_Parameter_value(Modified_Parameter):
         self.ignored_events = None
         self.pert_param_val = None
         self.perturbed_FY = None
+        self.number_of_fission_events = None
         self.perturbed_GEF_results = {}
+        self.perturbed_GEF_mean_values = {}
         self.perturbed_TALYS_results = {}
 #------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
 
@@ -2604,9 +3543,17 @@ class TMC_Object(Modified_Parameter):
     For GEF "lmd" option:  (`numpy.ndarray`, (300,11)).
     For GEF "lmd+" option: (`numpy.ndarray`, (300,19))."""
 
+    number_of_fission_events = None
+    """Number of rows with data in ``perturbed_FY`` (`int`). The 
+    remaining rows are zero."""
+
     perturbed_GEF_results = None
     """Dictionary with GEF simulation results (`dict`)."""
 
+    perturbed_GEF_mean_values = None
+    """Entries of ``perturbed_GEF_results`` with key 'mean_value_...' as
+    `float` (`dict` [`str`, `float`]). See ``Reaction.GEF_mean_values()``."""
+
     perturbed_TALYS_results = None
     """Dictionary with TALYS simulation results (`dict`)."""
     #------------------------------------------------------ CONSTRUCTOR --------------------------------------------------------#
@@ -2616,7 +3563,9 @@ class TMC_Object(Modified_Parameter):
         self.list_of_TMC_Mod_Param_objects = []    
         self.ignored_events = None
         self.perturbed_FY = None
+        self.number_of_fission_events = None
         self.perturbed_GEF_results = {}
+        self.perturbed_GEF_mean_values = {}
         self.perturbed_TALYS_results = {}
 #------------------------------------------------------- END OF CLASS ----------------------------------------------------------#
         
@@ -2633,6 +3582,10 @@ class TMC_Mod_Param_object(Modified_Parameter):
     distribution_flag : `str`
             Specifies if random numbers are to be drawn from "uniform", 
             "normal" or "max-min" distributions.
+    standard_rand_num : `float`
+        Random number from the standard uniform distribution [0,1[ or 
+        the standard normal distribution. It is scaled to the 
+        distribution of the parameter.
 
     See Also
     --------
@@ -2660,7 +3613,7 @@ class TMC_Mod_Param_object(Modified_Parameter):
     Examples
     --------
     Instantiates a ``TMC_Object`` object:
-    >>> tmc_mod_param_obj = TMC_Mod_Param_object("P_Shell_SL4",-0.4,"normal")
+    >>> tmc_mod_param_obj = TMC_Mod_Param_object("P_Shell_SL4",-0.4,"normal",0.27)
     [tmc_mod_param_obj (TMC_Mod_Param_object object)]
     """
     #--------------------------------------------------- CLASS ATTRIBUTES ------------------------------------------------------#
@@ -2697,7 +3650,7 @@ class TMC_Mod_Param_object(Modified_Parameter):
     as a percentage of the unperturbed parameter value in the file: 
     ``Gaussian_GEF_Param.py`` (See the "See Also" section)."""
     #------------------------------------------------------ CONSTRUCTOR --------------------------------------------------------#
-    def __init__(self, parameter_name, unperturbed_param_val,distribution_flag):
+    def __init__(self, parameter_name, unperturbed_param_val,distribution_flag,standard_rand_num):
         self.param_name = str(parameter_name)
         self.unpert_param_val = np.float32(unperturbed_param_val)
         self.pert_param_val = None
@@ -2707,12 +3660,12 @@ class TMC_Mod_Param_object(Modified_Parameter):
             scaling_number_uniform = np.float32(0.5)                                                                                    # Scaling value for limits of distribution. User can adjust the span of the uniform distribution here.
             upper_lim = abs(self.unpert_param_val) + scaling_number_uniform*abs(self.unpert_param_val)                                  # Upper numerical limit of distribution.
             lower_lim = abs(self.unpert_param_val) - scaling_number_uniform*abs(self.unpert_param_val)                                  # Lower numerical limit of distribution.
-            self.random_value = ((np.random.default_rng().uniform(low=lower_lim,high=upper_lim,size=1)).astype(dtype=np.float32))[0]    #Important [0]. Removes [ndarray] that prohibits MyParameters from reading
+            self.random_value = np.float32(lower_lim + standard_rand_num*(upper_lim-lower_lim))                                        # Standard uniform random number scaled to [lower_lim,upper_lim[.
             del scaling_number_uniform,upper_lim,lower_lim,distribution_flag
         #------------------------------------ CREATE RANDOM NUMBER FOR "NORMAL" DISTRIBUTION -----------------------------------#
         elif distribution_flag == 'normal':
             GEF_st_dev = abs(np.float32(Gaussian_GEF_Param.gaussian_st_dev_for_parameter(self.param_name,self.unpert_param_val)))       # Retrieval of std from external input file.
-            self.random_value = (np.random.default_rng().normal(self.unpert_param_val,scale=GEF_st_dev,size=1)).astype(np.float32)[0]   # Important [0]. Goes into [ndarray] that otherwise prohibits MyParameters from reading
+            self.random_value = np.float32(self.unpert_param_val + standard_rand_num*GEF_st_dev)                                        # Standard normal random number scaled to mean = default value, std = GEF_st_dev.
             del distribution_flag,GEF_st_dev
         else:
             print(f'The "{distribution_flag}"-distribution does not exist')